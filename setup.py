@@ -13,7 +13,10 @@ setup(
     ],
     extras_require={
         "aws-caching": ["aws-secretsmanager-caching", "boto3"],
-        "aws": ["boto3"]
+        "aws": ["boto3"],
+        "async": ["httpx"],
+        "arrow": ["pyarrow"],
+        "orjson": ["orjson"]
     },
     packages=['tests', 'tests.api', 'tests.api.orders', 'tests.api.sellers', 'tests.api.finances',
               'tests.api.product_fees', 'tests.api.notifications', 'tests.api.reports', 'tests.client',
@@ -42,6 +45,7 @@ setup(
               'sp_api.util',
               ##### DO NOT DELETE ########## INSERT PACKAGE HERE #######
               'sp_api.polling_manager',
+              'sp_api.asyncio',
               'sp_api.api.listings_restrictions',
               'sp_api.api.amazon_warehousing_and_distribu',
               'sp_api.api.catalog_items',
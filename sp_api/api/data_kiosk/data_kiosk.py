@@ -1,8 +1,10 @@
 import urllib.parse
 from io import BytesIO, StringIO
-from typing import Union, BinaryIO, TextIO
+from typing import Iterator, Union, BinaryIO, TextIO
 
 from sp_api.base import Client, sp_endpoint, fill_query_params, ApiResponse
+from sp_api.base import json_codec
+from sp_api.base.document import DEFAULT_CHUNK_SIZE
 
 
 class DataKiosk(Client):
@@ -170,23 +172,64 @@ class DataKiosk(Client):
             ApiResponse:
         """
 
-        res = self._request(fill_query_params(kwargs.pop('path'), document_id), params=kwargs, add_marketplace=False)
-        if download or file or ('decrypt' in kwargs and kwargs['decrypt']):
+        process = download or file or kwargs.get('decrypt')
+        res = self._request(fill_query_params(kwargs.pop('path'), document_id), params=kwargs, add_marketplace=False,
+                            raw=False if process else None)
+        if process:
             import requests
             document_response = requests.get(
                 res.payload.get('documentUrl'),
                 proxies=self.proxies,
                 verify=self.verify,
             )
-            document = document_response.content
-            if download:
-                res.payload.update({
-                    'document': document,
-                })
-            if file:
-                self._handle_file(file, document, encoding=encoding)
+            self._handle_document(res, document_response.content, download, file, encoding)
         return res
 
+    def iter_document_records(self, document_id, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> Iterator[dict]:
+        """
+        iter_document_records(self, document_id, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> Iterator[dict]
+
+        Downloads a Data Kiosk document and yields its JSON Lines records one by one, decoded with the json codec
+        (see `sp_api.base.set_codec`). The document is streamed, the connection is released once the iterator is
+        exhausted or closed.
+
+        Examples:
+            literal blocks::
+
+                for record in DataKiosk().iter_document_records('DOC-b8b0-4226-b4b9-0ee058ea5760'):
+                    process(record)
+
+        Args:
+            document_id: str | The identifier for the Data Kiosk document.
+            chunk_size: int | The size of the chunks read from the response, in bytes
+
+        Returns:
+            Iterator[dict]
+        """
+        url = self.get_document(document_id, **kwargs).payload.get('documentUrl')
+        document_response = self.session_pool.get(url).get(
+            url,
+            stream=True,
+            proxies=self.proxies,
+            verify=self.verify,
+            timeout=self.timeout,
+        )
+        try:
+            document_response.raise_for_status()
+            for line in document_response.iter_lines(chunk_size=chunk_size):
+                if line.strip():
+                    yield json_codec.loads(line)
+        finally:
+            document_response.close()
+
+    def _handle_document(self, res, document, download, file, encoding):
+        if download:
+            res.payload.update({
+                'document': document,
+            })
+        if file:
+            self._handle_file(file, document, encoding=encoding)
+
     @staticmethod
     def _handle_file(file, document, encoding='utf-8'):
         if isinstance(file, str):
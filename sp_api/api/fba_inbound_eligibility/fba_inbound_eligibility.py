@@ -69,8 +69,10 @@ class FbaInboundEligibility(Client):
             ApiResponse:
         """
 
-        api_response = self._request(kwargs.pop('path'), params=kwargs)
+        return self._add_ineligibility_messages(self._request(kwargs.pop('path'), params=kwargs))
 
+    @staticmethod
+    def _add_ineligibility_messages(api_response: ApiResponse) -> ApiResponse:
         if api_response.payload.get("ineligibilityReasonList") and api_response.payload.get("isEligibleForProgram") is False:
             ineligibility_list = api_response.payload.get("ineligibilityReasonList")
             errors = []
@@ -167,21 +167,29 @@ class Feeds(Client):
         data = {
             'contentType': kwargs.get('contentType', content_type)
         }
-        response = self._request(kwargs.get('path'), data={**data, **kwargs})
+        response = self._request(kwargs.get('path'), data={**data, **kwargs}, raw=False if file is not None else None)
 
         if(file is None):
             return response
 
+        upload = requests.put(
+            response.payload.get('url'),
+            data=self._read_feed_document(file),
+            headers={'Content-Type': content_type}
+        )
+        return self._check_upload(response, upload)
+
+    @staticmethod
+    def _read_feed_document(file):
         upload_data = file.read()
         try:
             upload_data = upload_data.encode('iso-8859-1')
         except AttributeError:
             pass
-        upload = requests.put(
-            response.payload.get('url'),
-            data=upload_data,
-            headers={'Content-Type': content_type}
-        )
+        return upload_data
+
+    @staticmethod
+    def _check_upload(response, upload):
         if 200 <= upload.status_code < 300:
             return response
         from sp_api.base.exceptions import SellingApiException
@@ -224,15 +232,18 @@ class Feeds(Client):
             str:
         """
         response = self._request(fill_query_params(kwargs.pop('path'), feedDocumentId), params=kwargs,
-                                 add_marketplace=False)
+                                 add_marketplace=False, raw=False)
         url = response.payload.get('url')
         doc_response = requests.get(url)
+        return self._decode_document(response, doc_response.content,
+                                     doc_response.encoding if doc_response else None)
 
-        encoding = doc_response.encoding if doc_response and doc_response.encoding else 'iso-8859-1'
+    @staticmethod
+    def _decode_document(response, content, encoding) -> str:
+        encoding = encoding or 'iso-8859-1'
         if encoding.lower() == 'windows-31j':
             encoding = 'cp932'
 
-        content = doc_response.content
         if 'compressionAlgorithm' in response.payload:
             try:
                 return zlib.decompress(bytearray(content), 15 + 32).decode(encoding)
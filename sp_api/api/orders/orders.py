@@ -1,5 +1,5 @@
 from sp_api.base import sp_endpoint, fill_query_params, ApiResponse, deprecated
-from sp_api.base import Client, Marketplaces
+from sp_api.base import Client, Marketplaces, SellingApiForbiddenException
 
 
 class Orders(Client):
@@ -305,22 +305,46 @@ class Orders(Client):
 
     @sp_endpoint('/tokens/2021-03-01/restrictedDataToken', method='POST')
     def _get_token(self, **kwargs):
-        data_elements = kwargs.pop('RestrictedResources')
-
         restricted_resources = [{
             "method": "GET",
-            "path": kwargs.get('original_path'),
-            "dataElements": data_elements
+            "path": kwargs.pop('restricted_path'),
+            "dataElements": kwargs.pop('RestrictedResources')
         }]
+        # Tokens are minted with the access token, even if a restricted data token is kept on the client
+        headers = {**self.headers, 'x-amz-access-token': self.auth.access_token}
+        return self._request(kwargs.pop('path'), data={'restrictedResources': restricted_resources, **kwargs},
+                             headers=headers, raw=False)
+
+    def _restricted_request(self, kwargs):
+        """
+        Returns the restricted path to request, the restricted resource of its token and the token's cache key
 
-        return self._request(kwargs.pop('path'), data={'restrictedResources': restricted_resources, **kwargs})
+        Tokens are minted for the generic path of the operation, e.g. `/orders/v0/orders/{orderId}/orderItems`,
+        so one cached token covers the operation for all orders.
+        """
+        path = kwargs.pop('original_path', kwargs['path'])
+        token_kwargs = {'restricted_path': kwargs.pop('path').replace('{}', '{orderId}'),
+                        'RestrictedResources': kwargs.pop('RestrictedResources')}
+        cache_key = self.restricted_data_token_key('GET', token_kwargs['restricted_path'],
+                                                   token_kwargs['RestrictedResources'])
+        return path, token_kwargs, cache_key
 
     def _access_restricted(self, kwargs):
-        if 'original_path' not in kwargs:
-            kwargs.update({'original_path': kwargs['path']})
-        token = self._get_token(**kwargs).payload
-        self.restricted_data_token = token['restrictedDataToken']
-        r = self._request(kwargs.pop('original_path'), params={**kwargs})
-        if not self.keep_restricted_data_token:
-            self.restricted_data_token = None
-        return r
+        path, token_kwargs, cache_key = self._restricted_request(kwargs)
+        while True:
+            token = self.rdt_cache.get(cache_key)
+            cached = token is not None
+            if not cached:
+                token = self._get_token(**token_kwargs).payload
+                self._cache_restricted_data_token(cache_key, token)
+            if self.keep_restricted_data_token:
+                self.restricted_data_token = token['restrictedDataToken']
+            # Pass the token per request, concurrent calls on this client must not share it
+            headers = {**self.headers, 'x-amz-access-token': token['restrictedDataToken']}
+            try:
+                return self._request(path, params={**kwargs}, headers=headers)
+            except SellingApiForbiddenException:
+                # A cached token can be revoked before it expires, mint a new one once
+                self.rdt_cache.delete(cache_key)
+                if not cached:
+                    raise
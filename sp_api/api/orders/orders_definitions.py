@@ -0,0 +1,228 @@
+"""
+Typed models of the payloads of the Orders API v0
+
+The models are written by hand from the Orders API v0 reference, the schema is not part of this package. Keys that
+are not declared are kept, see `Model`.
+
+Lists of models, e.g. `Order.PaymentExecutionDetail`, are parsed on first access. Single nested models, e.g. `Money`
+and `Address`, are parsed with the model that holds them: they are small, and keeping their payload until first
+access would take more memory than the parsed model.
+"""
+from decimal import Decimal
+from typing import List
+
+from sp_api.base.model import Model, Nested
+
+
+class Money(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#money """
+    _interned = frozenset(('CurrencyCode',))
+    CurrencyCode: str
+    Amount: str
+
+    @property
+    def decimal(self) -> Decimal:
+        return Decimal(self.Amount)
+
+
+class Address(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#address """
+    _interned = frozenset(('CountryCode', 'StateOrRegion', 'AddressType'))
+    Name: str
+    CompanyName: str
+    AddressLine1: str
+    AddressLine2: str
+    AddressLine3: str
+    City: str
+    County: str
+    District: str
+    StateOrRegion: str
+    Municipality: str
+    PostalCode: str
+    CountryCode: str
+    Phone: str
+    ExtendedFields: dict
+    AddressType: str
+
+
+class BuyerInfo(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#buyerinfo """
+    BuyerEmail: str
+    BuyerName: str
+    BuyerCounty: str
+    BuyerTaxInfo: dict
+    PurchaseOrderNumber: str
+
+
+class PaymentExecutionDetailItem(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #paymentexecutiondetailitem """
+    _interned = frozenset(('PaymentMethod',))
+    Payment: Money
+    PaymentMethod: str
+
+
+class BuyerTaxInformation(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #buyertaxinformation """
+    BuyerLegalCompanyName: str
+    BuyerBusinessAddress: str
+    BuyerTaxRegistrationId: str
+    BuyerTaxOffice: str
+
+
+class FulfillmentInstruction(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #fulfillmentinstruction """
+    FulfillmentSupplySourceId: str
+
+
+class AutomatedShippingSettings(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #automatedshippingsettings """
+    HasAutomatedShippingSettings: bool
+    AutomatedCarrier: str
+    AutomatedShipMethod: str
+
+
+class Order(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#order """
+    _interned = frozenset(('OrderStatus', 'FulfillmentChannel', 'SalesChannel', 'OrderChannel', 'ShipServiceLevel',
+                           'PaymentMethod', 'MarketplaceId', 'ShipmentServiceLevelCategory', 'EasyShipShipmentStatus',
+                           'OrderType', 'BuyerInvoicePreference', 'ElectronicInvoiceStatus'))
+    AmazonOrderId: str
+    SellerOrderId: str
+    PurchaseDate: str
+    LastUpdateDate: str
+    OrderStatus: str
+    FulfillmentChannel: str
+    SalesChannel: str
+    OrderChannel: str
+    ShipServiceLevel: str
+    OrderTotal: Money
+    NumberOfItemsShipped: int
+    NumberOfItemsUnshipped: int
+    PaymentExecutionDetail: List[PaymentExecutionDetailItem] = Nested(PaymentExecutionDetailItem, many=True)
+    PaymentMethod: str
+    PaymentMethodDetails: List[str]
+    MarketplaceId: str
+    ShipmentServiceLevelCategory: str
+    EasyShipShipmentStatus: str
+    CbaDisplayableShippingLabel: str
+    OrderType: str
+    EarliestShipDate: str
+    LatestShipDate: str
+    EarliestDeliveryDate: str
+    LatestDeliveryDate: str
+    IsBusinessOrder: bool
+    IsPrime: bool
+    IsPremiumOrder: bool
+    IsGlobalExpressEnabled: bool
+    ReplacedOrderId: str
+    IsReplacementOrder: bool
+    PromiseResponseDueDate: str
+    IsEstimatedShipDateSet: bool
+    IsSoldByAB: bool
+    IsIBA: bool
+    DefaultShipFromLocationAddress: Address
+    BuyerInvoicePreference: str
+    BuyerTaxInformation: BuyerTaxInformation
+    FulfillmentInstruction: FulfillmentInstruction
+    IsISPU: bool
+    IsAccessPointOrder: bool
+    MarketplaceTaxInfo: dict
+    SellerDisplayName: str
+    ShippingAddress: Address
+    BuyerInfo: BuyerInfo
+    AutomatedShippingSettings: AutomatedShippingSettings
+    HasRegulatedItems: bool
+    ElectronicInvoiceStatus: str
+
+
+class OrderAddress(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#orderaddress """
+    AmazonOrderId: str
+    BuyerCompanyName: str
+    ShippingAddress: Address
+    DeliveryPreferences: dict
+
+
+class ProductInfoDetail(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #productinfodetail """
+    NumberOfItems: str
+
+
+class PointsGrantedDetail(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #pointsgranteddetail """
+    PointsNumber: int
+    PointsMonetaryValue: Money
+
+
+class TaxCollection(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#taxcollection """
+    _interned = frozenset(('Model', 'ResponsibleParty'))
+    Model: str
+    ResponsibleParty: str
+
+
+class ItemBuyerInfo(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#itembuyerinfo """
+    BuyerCustomizedInfo: dict
+    GiftWrapPrice: Money
+    GiftWrapTax: Money
+    GiftMessageText: str
+    GiftWrapLevel: str
+
+
+class BuyerRequestedCancel(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference
+    #buyerrequestedcancel """
+    IsBuyerRequestedCancel: str
+    BuyerCancelReason: str
+
+
+class OrderItem(Model):
+    """ Implements definition: https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#orderitem """
+    _interned = frozenset(('ConditionId', 'ConditionSubtypeId', 'PriceDesignation', 'DeemedResellerCategory'))
+    ASIN: str
+    SellerSKU: str
+    OrderItemId: str
+    AssociatedItems: List[dict]
+    Title: str
+    QuantityOrdered: int
+    QuantityShipped: int
+    ProductInfo: ProductInfoDetail
+    PointsGranted: PointsGrantedDetail
+    ItemPrice: Money
+    ShippingPrice: Money
+    ItemTax: Money
+    ShippingTax: Money
+    ShippingDiscount: Money
+    ShippingDiscountTax: Money
+    PromotionDiscount: Money
+    PromotionDiscountTax: Money
+    PromotionIds: List[str]
+    CODFee: Money
+    CODFeeDiscount: Money
+    IsGift: str
+    ConditionNote: str
+    ConditionId: str
+    ConditionSubtypeId: str
+    ScheduledDeliveryStartDate: str
+    ScheduledDeliveryEndDate: str
+    PriceDesignation: str
+    TaxCollection: TaxCollection
+    SerialNumberRequired: bool
+    IsTransparency: bool
+    IossNumber: str
+    StoreChainStoreId: str
+    DeemedResellerCategory: str
+    BuyerInfo: ItemBuyerInfo
+    BuyerRequestedCancel: BuyerRequestedCancel
+    SerialNumbers: List[str]
+    SubstitutionPreferences: dict
+    Measurement: dict
+    ShippingConstraints: dict
+    AmazonPrograms: dict
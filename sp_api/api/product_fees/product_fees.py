@@ -178,7 +178,7 @@ class ProductFees(Client):
         return body
 
 
-    def _add_marketplaces(self, data):
+    def _add_marketplaces(self, data, method=None):
         # MarketplaceID is a property of the body's FeesEstimateRequest for this section, and does
         # not need to be added. Additionally, Client._add_marketplaces will fail as it assumes
         # data is a dict, which is not the case for get_product_fees_estimate.
@@ -0,0 +1,229 @@
+import asyncio
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, Optional
+
+from sp_api.base import ApiResponse, ProcessingStatus
+
+TERMINAL_STATUSES = (ProcessingStatus.DONE, ProcessingStatus.FATAL, ProcessingStatus.CANCELLED)
+
+
+class ReportJob:
+    """
+    A report to create, wait for and download
+
+    Jobs move through `create_report`, `get_report` until the report's `processingStatus` is terminal, and
+    `get_report_document`. Polling is adaptive: it starts at poll_interval and backs off by backoff up to
+    max_poll_interval while the status stays the same, and starts over once the status changes,
+    e.g. from IN_QUEUE to IN_PROGRESS.
+
+    A job is done once `status` is set, `error` holds the exception of a failed job. The report's details are
+    kept in `report`, the response of `get_report_document` in `document`.
+
+    Examples:
+        literal blocks::
+
+            job = ReportJob(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, file='listings.tsv')
+            Reports().run_report(job)
+
+    Args:
+        client: Reports | The client of the selling partner, defaults to the client running the job
+        file: str or file like object | Write the document to file
+        download: bool | Load the document into `document`, if no file is passed
+        stream: bool | Download the document in chunks, see `Reports.get_report_document`
+        character_code: str | see `Reports.get_report_document`
+        poll_interval: float | Seconds to wait before the first poll
+        max_poll_interval: float | Maximum seconds between polls
+        backoff: float | The factor the interval grows by while the status does not change
+        timeout: float | Seconds until the job fails with a `TimeoutError`, None waits forever
+        **kwargs: The arguments of `Reports.create_report`, e.g. reportType, dataStartTime, marketplaceIds
+    """
+
+    def __init__(self, client=None, file=None, download: bool = False, stream: bool = True,
+                 character_code: Optional[str] = None, poll_interval: float = 2, max_poll_interval: float = 60,
+                 backoff: float = 1.5, timeout: Optional[float] = None, **kwargs):
+        self.client = client
+        self.kwargs = kwargs
+        self.file = file
+        self.download = download
+        self.stream = stream
+        self.character_code = character_code
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.report_id = None
+        self.report = None
+        self.document = None
+        self.status = None
+        self.error = None
+        self.polls = 0
+        self._processing_status = None
+        self._interval = poll_interval
+        self._started = None
+
+    @property
+    def report_type(self):
+        return self.kwargs.get('reportType')
+
+    @property
+    def done(self) -> bool:
+        return self.status is not None or self.error is not None
+
+    @property
+    def document_id(self) -> Optional[str]:
+        return self.report.get('reportDocumentId') if self.report else None
+
+    def step(self, client=None) -> Optional[float]:
+        """
+        Run the next request of the job, returns the seconds to wait before the next step or None if the job is done
+        """
+        client = self.client or client
+        if self.report_id is None:
+            self._started = time.monotonic()
+            return self._created(client.create_report(**self.kwargs))
+        self._check_timeout()
+        if self._processing_status != ProcessingStatus.DONE:
+            return self._polled(client.get_report(self.report_id))
+        self.document = client.get_report_document(self.document_id, **self._document_kwargs())
+        self.status = ProcessingStatus.DONE
+        return None
+
+    async def astep(self, client=None) -> Optional[float]:
+        """
+        Asyncio variant of `step`, for clients of `sp_api.asyncio`
+        """
+        client = self.client or client
+        if self.report_id is None:
+            self._started = time.monotonic()
+            return self._created(await client.create_report(**self.kwargs))
+        self._check_timeout()
+        if self._processing_status != ProcessingStatus.DONE:
+            return self._polled(await client.get_report(self.report_id))
+        self.document = await client.get_report_document(self.document_id, **self._document_kwargs())
+        self.status = ProcessingStatus.DONE
+        return None
+
+    def _created(self, res: ApiResponse) -> float:
+        self.report_id = res.payload['reportId']
+        return self._interval
+
+    def _polled(self, res: ApiResponse) -> Optional[float]:
+        self.polls += 1
+        self.report = res.payload
+        status = ProcessingStatus(self.report['processingStatus'])
+        if status == ProcessingStatus.DONE:
+            self._processing_status = status
+            if self.file or self.download:
+                return 0
+            self.status = status
+            return None
+        if status in TERMINAL_STATUSES:
+            self._processing_status = self.status = status
+            return None
+        if status == self._processing_status:
+            self._interval = min(self._interval * self.backoff, self.max_poll_interval)
+        else:
+            self._interval = self.poll_interval
+        self._processing_status = status
+        return self._interval
+
+    def _check_timeout(self):
+        if self.timeout is not None and time.monotonic() - self._started > self.timeout:
+            raise TimeoutError('Report %s did not finish within %s seconds' % (self.report_id, self.timeout))
+
+    def _document_kwargs(self) -> dict:
+        return dict(download=self.download, file=self.file, stream=self.stream and bool(self.file),
+                    character_code=self.character_code)
+
+    def __repr__(self):
+        return '<ReportJob %s %s %s>' % (self.report_type, self.report_id, self.status or self._processing_status)
+
+
+def _make_job(job) -> ReportJob:
+    return job if isinstance(job, ReportJob) else ReportJob(**job)
+
+
+def run_report_job(client, job: ReportJob) -> ReportJob:
+    """
+    Run a single job until it is done, raising its error
+    """
+    while True:
+        delay = job.step(client)
+        if delay is None:
+            return job
+        time.sleep(delay)
+
+
+def run_report_jobs(client, jobs: Iterable, max_workers: int = 8) -> Iterator[ReportJob]:
+    """
+    Run jobs concurrently, yielding each one once it is done
+
+    Requests are sent from a pool of max_workers threads, jobs waiting for their next poll do not occupy a thread.
+    Jobs without a client of their own send their requests with client, concurrently. Pass client and the clients
+    of the jobs the same `RateLimiter` to stay within the usage plans.
+    """
+    jobs = [_make_job(job) for job in jobs]
+    counter = itertools.count()
+    waiting = [(0, next(counter), job) for job in jobs]
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while waiting or running:
+            now = time.monotonic()
+            while waiting and waiting[0][0] <= now:
+                job = heapq.heappop(waiting)[2]
+                running[executor.submit(job.step, client)] = job
+            timeout = max(waiting[0][0] - now, 0) if waiting else None
+            if not running:
+                time.sleep(timeout)
+                continue
+            finished, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = running.pop(future)
+                try:
+                    delay = future.result()
+                except Exception as e:
+                    job.error = e
+                    yield job
+                    continue
+                if delay is None:
+                    yield job
+                else:
+                    heapq.heappush(waiting, (time.monotonic() + delay, next(counter), job))
+
+
+async def arun_report_job(client, job: ReportJob) -> ReportJob:
+    """
+    Asyncio variant of `run_report_job`
+    """
+    while True:
+        delay = await job.astep(client)
+        if delay is None:
+            return job
+        await asyncio.sleep(delay)
+
+
+async def arun_report_jobs(client, jobs: Iterable, max_workers: int = 8):
+    """
+    Asyncio variant of `run_report_jobs`, at most max_workers requests are in flight at once
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(job):
+        try:
+            while True:
+                async with semaphore:
+                    delay = await job.astep(client)
+                if delay is None:
+                    return job
+                await asyncio.sleep(delay)
+        except Exception as e:
+            job.error = e
+            return job
+
+    # Tasks are created in order, as_completed would start coroutines in the order of a set
+    tasks = [asyncio.ensure_future(run(_make_job(job))) for job in jobs]
+    for finished in asyncio.as_completed(tasks):
+        yield await finished
@@ -2,11 +2,14 @@ import zlib
 from collections import abc
 from datetime import datetime
 from io import BytesIO, StringIO
-from typing import Optional
+from typing import Optional, Iterable, Iterator
 
 import requests
 
 from sp_api.base import Client, sp_endpoint, fill_query_params, ApiResponse, Marketplaces
+from sp_api.base.document import DEFAULT_CHUNK_SIZE, DocumentDecoder, decode_chunks, document_encoding, write_chunks
+from sp_api.util.report_reader import ReportReader
+from .report_jobs import ReportJob, run_report_job, run_report_jobs
 
 
 class Reports(Client):
@@ -326,13 +329,16 @@ class Reports(Client):
 
     @sp_endpoint('/reports/2021-06-30/documents/{}', method='GET')
     def get_report_document(self, reportDocumentId, download: bool = False, file=None,
-                            character_code: Optional[str] = None, **kwargs) -> ApiResponse:
+                            character_code: Optional[str] = None, stream: bool = False,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> ApiResponse:
         """
-        get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: Optional[str] = None, **kwargs) -> ApiResponse
+        get_report_document(self, document_id, decrypt: bool = False, file=None, character_code: Optional[str] = None, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> ApiResponse
         Returns the information required for retrieving a report document's contents. This includes a presigned URL for the report document as well as the information required to decrypt the document's contents.
 
         If decrypt = True the report will automatically be loaded and decrypted/unpacked
         If file is set to a file (or file like object), the report's contents are written to the file
+        If stream = True the report is downloaded, decompressed and decoded chunk by chunk, so memory use is bounded
+        by chunk_size. It is written to file, or, if no file is passed, `document` is an iterator of text chunks.
 
 
         **Usage Plan:**
@@ -363,47 +369,219 @@ class Reports(Client):
                             obtaining the document from the document URL.
                             It fallbacks to 'iso-8859-1' if no encoding was found.
                             Only valid if decrypt=True.
+            stream: bool | Download the document in chunks instead of loading it into memory
+            chunk_size: int | The size of the chunks read when streaming, in bytes
 
         Returns:
              ApiResponse
         """  # noqa: E501
         res = self._request(fill_query_params(kwargs.pop(
             'path'), reportDocumentId), add_marketplace=False)
-        if download or file or ('decrypt' in kwargs and kwargs['decrypt']):
+        if stream and (download or file):
+            encoding, chunks = self._stream_document(res, character_code, chunk_size)
+            if file:
+                write_chunks(file, chunks, encoding)
+            else:
+                res.payload.update({
+                    'document': chunks,
+                })
+        elif download or file or ('decrypt' in kwargs and kwargs['decrypt']):
             document_response = requests.get(
                 res.payload.get('url'),
                 proxies=self.proxies,
                 verify=self.verify,
             )
-            document = document_response.content
-            if not character_code:
-                character_code = (
-                    document_response.encoding
-                    if document_response and document_response.encoding
-                    else 'iso-8859-1'
-                )
-                if character_code.lower() == 'windows-31j':
-                    character_code = 'cp932'
-            if 'compressionAlgorithm' in res.payload:
-                try:
-                    document = zlib.decompress(bytearray(document), 15 + 32)
-                except Exception as e:
-                    pass
-
-            if character_code:
-                try:
-                    decoded_document = document.decode(character_code)
-                except Exception as e:
-                    decoded_document = document
-
-            if download:
-                res.payload.update({
-                    'document': decoded_document,
-                })
-            if file:
-                self._handle_file(file, decoded_document, character_code)
+            self._handle_document(res, document_response.content,
+                                  document_response.encoding if document_response else None,
+                                  download, file, character_code)
         return res
 
+    def run_report(self, job: Optional[ReportJob] = None, **kwargs) -> ReportJob:
+        """
+        run_report(self, job: Optional[ReportJob] = None, **kwargs) -> ReportJob
+
+        Creates a report, polls it until its processing status is DONE, FATAL or CANCELLED and fetches its document.
+        Polling starts fast and backs off while the status does not change, see `ReportJob`.
+
+        Examples:
+            literal blocks::
+
+                job = Reports().run_report(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA,
+                                           file='listings.tsv')
+                job.status  # ProcessingStatus.DONE
+
+        Args:
+            job: ReportJob | optional, the job to run
+            **kwargs: The arguments of `ReportJob`, if no job is passed
+
+        Returns:
+            ReportJob
+        """
+        return run_report_job(self, job or ReportJob(**kwargs))
+
+    def run_reports(self, jobs: Iterable, max_workers: int = 8) -> Iterator[ReportJob]:
+        """
+        run_reports(self, jobs: Iterable, max_workers: int = 8) -> Iterator[ReportJob]
+
+        Runs many report jobs concurrently and yields each job once it is done, failed jobs hold their exception
+        in `error`. Jobs waiting for their next poll do not occupy a worker.
+        Jobs without a client of their own use this client, pass all clients the same `RateLimiter`
+        to stay within the usage plans.
+
+        Examples:
+            literal blocks::
+
+                limiter = RateLimiter()
+                jobs = [ReportJob(Reports(refresh_token=token, rate_limiter=limiter),
+                                  reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, file='%s.tsv' % seller)
+                        for seller, token in refresh_tokens.items()]
+                for job in Reports(rate_limiter=limiter).run_reports(jobs):
+                    print(job.file, job.status, job.error)
+
+        Args:
+            jobs: iterable of ReportJob or dicts of their arguments
+            max_workers: int | The maximum number of concurrent requests
+
+        Returns:
+            Iterator[ReportJob]
+        """
+        return run_report_jobs(self, jobs, max_workers)
+
+    def iter_report_document(self, reportDocumentId, character_code: Optional[str] = None,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        iter_report_document(self, reportDocumentId, character_code: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]
+
+        Downloads a report document and yields its decompressed and decoded text chunk by chunk.
+        The connection is released once the iterator is exhausted or closed.
+
+        Examples:
+            literal blocks::
+
+                for chunk in Reports().iter_report_document('0356cf79-b8b0-4226-b4b9-0ee058ea5760'):
+                    process(chunk)
+
+        Args:
+            reportDocumentId: str | the document to load
+            character_code: str | see `get_report_document`
+            chunk_size: int | The size of the chunks read from the response, in bytes
+
+        Returns:
+            Iterator[str]
+        """
+        return self.get_report_document(reportDocumentId, download=True, character_code=character_code,
+                                        stream=True, chunk_size=chunk_size).payload['document']
+
+    def iter_report_rows(self, reportDocumentId, report_type=None, row_type: type = dict,
+                         character_code: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         **kwargs) -> ReportReader:
+        """
+        iter_report_rows(self, reportDocumentId, report_type=None, row_type: type = dict, character_code: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> ReportReader
+
+        Downloads a report document and lazily parses its rows, so even large reports are processed in constant memory.
+        See `ReportReader` for the supported formats.
+
+        Examples:
+            literal blocks::
+
+                rows = Reports().iter_report_rows('0356cf79-b8b0-4226-b4b9-0ee058ea5760',
+                                                  report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA)
+                for row in rows:
+                    print(row['seller-sku'])
+
+        Args:
+            reportDocumentId: str | the document to load
+            report_type: ReportType or str | The type of the report, used to pick the parser
+            row_type: dict or tuple | The type of the rows of flat files
+            character_code: str | see `get_report_document`
+            chunk_size: int | The size of the chunks read from the response, in bytes
+            **kwargs: see `ReportReader`
+
+        Returns:
+            ReportReader
+        """  # noqa: E501
+        return ReportReader(self.iter_report_document(reportDocumentId, character_code=character_code,
+                                                      chunk_size=chunk_size),
+                            report_type=report_type, row_type=row_type, **kwargs)
+
+    def export_report_document(self, reportDocumentId, file, format: str = 'parquet', report_type=None,
+                               batch_size: int = 65536, schema_hints: Optional[dict] = None,
+                               compression: Optional[str] = None, character_code: Optional[str] = None,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE, decimal_separator: Optional[str] = None) -> int:
+        """
+        export_report_document(self, reportDocumentId, file, format: str = 'parquet', report_type=None, batch_size: int = 65536, schema_hints: Optional[dict] = None, compression: Optional[str] = None, character_code: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, decimal_separator: Optional[str] = None) -> int
+
+        Downloads a report document and writes its rows to a Parquet or Feather file in arrow record batches,
+        without loading the document into memory. Requires pyarrow.
+
+        Examples:
+            literal blocks::
+
+                Reports().export_report_document('0356cf79-b8b0-4226-b4b9-0ee058ea5760', 'listings.parquet',
+                                                 report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA)
+
+        Args:
+            reportDocumentId: str | the document to load
+            file: str or binary file like object
+            format: str | `parquet` or `feather`
+            report_type: ReportType or str | The type of the report, used to pick the parser and schema hints
+            batch_size: int | The number of rows per record batch
+            schema_hints: dict | Column name to type, see `sp_api.util.report_export.arrow_type`
+            compression: str | The codec, defaults to snappy for Parquet and lz4 for Feather
+            character_code: str | see `get_report_document`
+            chunk_size: int | The size of the chunks read from the response, in bytes
+            decimal_separator: str | `.` or `,`, the decimal separator of numbers in the report.
+                                     Guessed per value by default, values like `1,234` raise ValueError
+
+        Returns:
+            int | The number of rows written
+        """  # noqa: E501
+        from sp_api.util.report_export import export_report
+        reader = self.iter_report_rows(reportDocumentId, report_type=report_type, row_type=tuple,
+                                       character_code=character_code, chunk_size=chunk_size)
+        return export_report(reader, file, format, batch_size, schema_hints, compression, decimal_separator)
+
+    def _stream_document(self, res, character_code, chunk_size):
+        url = res.payload.get('url')
+        document_response = self.session_pool.get(url).get(
+            url,
+            stream=True,
+            proxies=self.proxies,
+            verify=self.verify,
+            timeout=self.timeout,
+        )
+        try:
+            # Error pages, e.g. of an expired url, are not part of the document
+            document_response.raise_for_status()
+        except requests.HTTPError:
+            document_response.close()
+            raise
+        encoding = document_encoding(document_response.encoding, character_code)
+        decoder = DocumentDecoder('compressionAlgorithm' in res.payload, encoding)
+        return encoding, decode_chunks(document_response.iter_content(chunk_size), decoder,
+                                       close=document_response.close)
+
+    def _handle_document(self, res, document, encoding, download, file, character_code):
+        character_code = document_encoding(encoding, character_code)
+        if 'compressionAlgorithm' in res.payload:
+            try:
+                document = zlib.decompress(bytearray(document), 15 + 32)
+            except Exception as e:
+                pass
+
+        if character_code:
+            try:
+                decoded_document = document.decode(character_code)
+            except Exception as e:
+                decoded_document = document
+
+        if download:
+            res.payload.update({
+                'document': decoded_document,
+            })
+        if file:
+            self._handle_file(file, decoded_document, character_code)
+
     @staticmethod
     def _handle_file(file, document, encoding):
         if isinstance(file, str):
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+
+from sp_api.base import SellingApiForbiddenException
+
+# A token is minted again once it expires within this many seconds
+EXPIRY_MARGIN = 60
+
+
+def restricted_resource(path: str, data_elements: List[str] = None, method: str = 'GET') -> dict:
+    """
+    Returns a restricted resource for `Tokens.create_restricted_data_token`
+
+    Generic paths, e.g. `/orders/v0/orders/{orderId}/address`, authorize the operation for all orders.
+    """
+    resource = {'method': method, 'path': path}
+    if data_elements:
+        resource['dataElements'] = list(data_elements)
+    return resource
+
+
+class RestrictedDataToken:
+    """
+    One restricted data token for many restricted resources, shared by a batch of concurrent calls
+
+    The token is minted with a single Tokens call on first use, and again once it expires or a call using it is
+    rejected with `SellingApiForbiddenException`. It is also stored in the tokens client's `rdt_cache` for each of
+    its resources, so `Orders` calls with matching `RestrictedResources` reuse it.
+
+    Examples:
+        literal blocks::
+
+            rdt = Tokens().batch_restricted_data_token([
+                restricted_resource('/orders/v0/orders/{orderId}/address'),
+                restricted_resource('/orders/v0/orders/{orderId}/orderItems', ['buyerInfo']),
+                restricted_resource('/mfn/v0/shipments/{shipmentId}'),
+                restricted_resource('/vendor/directFulfillment/shipping/v1/shippingLabels/{purchaseOrderNumber}'),
+            ])
+
+            def load(token, order_id):
+                orders = Orders(restricted_data_token=token)
+                return orders.get_order_address(order_id), orders.get_order_items(order_id)
+
+            for address, items in rdt.map(load, order_ids, max_workers=8):
+                ...
+
+    Args:
+        tokens: Tokens | The client used to mint the token
+        restricted_resources: list | The resources the token covers, see `restricted_resource`
+        target_application: str | optional, the application ID of a delegated application
+    """
+    clock = staticmethod(time.time)
+
+    def __init__(self, tokens, restricted_resources: Iterable[dict], target_application: str = None):
+        self.tokens = tokens
+        self.restricted_resources = list(restricted_resources)
+        self.target_application = target_application
+        self.mints = 0
+        self._token = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
+        self._async_lock = None
+
+    @property
+    def token(self) -> str:
+        """
+        The current token, minted if there is none or it expires soon
+        """
+        with self._lock:
+            if self._expired():
+                self._set(self.tokens.create_restricted_data_token(**self._request_body()).payload)
+            return self._token
+
+    async def atoken(self) -> str:
+        """
+        Like `token`, for an asyncio Tokens client
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._expired():
+                self._set((await self.tokens.create_restricted_data_token(**self._request_body())).payload)
+            return self._token
+
+    def invalidate(self, token: str):
+        """
+        Drop token, so the next call mints a new one, unless another call already replaced it
+        """
+        with self._lock:
+            if self._token == token:
+                self._token = None
+
+    def call(self, function: Callable, *args, **kwargs):
+        """
+        Returns function(token, *args, **kwargs), retried once with a new token if the token was rejected
+        """
+        token = self.token
+        try:
+            return function(token, *args, **kwargs)
+        except SellingApiForbiddenException:
+            self.invalidate(token)
+            return function(self.token, *args, **kwargs)
+
+    async def acall(self, function: Callable, *args, **kwargs):
+        """
+        Like `call`, for a coroutine function
+        """
+        token = await self.atoken()
+        try:
+            return await function(token, *args, **kwargs)
+        except SellingApiForbiddenException:
+            self.invalidate(token)
+            return await function(await self.atoken(), *args, **kwargs)
+
+    def map(self, function: Callable, items: Iterable, max_workers: int = 8) -> list:
+        """
+        Calls function(token, item) for all items on a thread pool
+
+        Returns:
+            list of the results, in the order of items. The first exception of a call is raised.
+        """
+        items = list(items)
+        if not items:
+            return []
+        # Mint once up front instead of in every worker
+        self.token
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.call(function, item), items))
+
+    async def amap(self, function: Callable, items: Iterable, max_concurrency: int = 8) -> list:
+        """
+        Like `map`, awaiting the coroutine function(token, item) with up to max_concurrency calls at once
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(item):
+            async with semaphore:
+                return await self.acall(function, item)
+
+        return list(await asyncio.gather(*[run(item) for item in items]))
+
+    def _expired(self) -> bool:
+        return self._token is None or self.clock() >= self._expires_at - EXPIRY_MARGIN
+
+    def _request_body(self) -> dict:
+        body = {'restrictedResources': self.restricted_resources}
+        if self.target_application:
+            body['targetApplication'] = self.target_application
+        return body
+
+    def _set(self, payload: dict):
+        self._token = payload['restrictedDataToken']
+        self._expires_at = self.clock() + int(payload.get('expiresIn') or 3600)
+        self.mints += 1
+        for resource in self.restricted_resources:
+            cache_key = self.tokens.restricted_data_token_key(resource['method'], resource['path'],
+                                                              resource.get('dataElements'))
+            self.tokens._cache_restricted_data_token(cache_key, payload)
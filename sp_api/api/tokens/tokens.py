@@ -1,6 +1,7 @@
 import urllib.parse
 
 from sp_api.base import Client, sp_endpoint, fill_query_params, ApiResponse
+from .restricted_data_token import RestrictedDataToken
 
 
 class Tokens(Client):
@@ -63,4 +64,31 @@ class Tokens(Client):
         """
     
         return self._request(kwargs.pop('path'),  data=kwargs)
-    
+
+    def batch_restricted_data_token(self, restricted_resources: list, target_application: str = None):
+        """
+        batch_restricted_data_token(self, restricted_resources: list, target_application=None) -> RestrictedDataToken
+
+        Returns a `RestrictedDataToken` that mints one token for all restricted_resources with this client,
+        and shares it between a batch of concurrent restricted calls.
+
+        Examples:
+            literal blocks::
+
+                rdt = Tokens().batch_restricted_data_token([
+                    restricted_resource('/orders/v0/orders/{orderId}/address'),
+                    restricted_resource('/orders/v0/orders/{orderId}/orderItems', ['buyerInfo']),
+                ])
+                addresses = rdt.map(
+                    lambda token, order_id: Orders(restricted_data_token=token).get_order_address(order_id),
+                    order_ids
+                )
+
+        Args:
+            restricted_resources: list | dicts with method, path and optional dataElements, see `restricted_resource`
+            target_application: str | optional
+
+        Returns:
+            RestrictedDataToken:
+        """
+        return RestrictedDataToken(self, restricted_resources, target_application)
@@ -1,15 +1,99 @@
-from sp_api.base import Client, sp_endpoint
-from sp_api.base.helpers import create_md5
+import contextlib
+import io
+import mmap
+import os
+
+from sp_api.base import Client, sp_endpoint, ApiResponse, SellingApiException
+from sp_api.base.helpers import create_md5, MD5_CHUNK_SIZE
 import urllib.parse
 
 
 class Upload(Client):
     @sp_endpoint('/uploads/2020-11-01/uploadDestinations/{}', method='POST')
     def upload_document(self, resource, file, content_type='application/pdf', **kwargs):
-        md5 = urllib.parse.quote(create_md5(file))
+        md5 = kwargs.pop('contentMD5', None) or urllib.parse.quote(create_md5(file))
         kwargs.update({
             'contentMD5': md5,
             'contentType': kwargs.pop('contentType', content_type),
             'marketplaceIds': self.marketplace_id
         })
         return self._request(kwargs.pop('path').format(resource), params=kwargs)
+
+    def upload_file(self, resource, file, content_type='application/pdf', chunk_size: int = MD5_CHUNK_SIZE,
+                    **kwargs) -> ApiResponse:
+        """
+        upload_file(self, resource, file, content_type='application/pdf', chunk_size: int = MD5_CHUNK_SIZE, **kwargs) -> ApiResponse
+
+        Creates an upload destination for the file and uploads it.
+
+        The presigned url is signed with the file's MD5, so the MD5 is computed before the upload. Files on disk are
+        memory-mapped and read from disk once, for hashing and uploading; file like objects that cannot be
+        memory-mapped are read once into memory.
+
+        Examples:
+            literal blocks::
+
+                destination = Upload().upload_file('aplus/2020-11-01/contentDocuments', 'image.jpg',
+                                                   content_type='image/jpeg')
+                destination.payload['uploadDestinationId']
+
+        Args:
+            resource: str | The resource for the upload destination, e.g. `aplus/2020-11-01/contentDocuments`
+            file: str, bytes or file like object | The file's path or content
+            content_type: str | The content type of the file
+            chunk_size: int | The size of the chunks the file is hashed and streamed in, in bytes
+            **kwargs:
+
+        Returns:
+            ApiResponse | The upload destination
+        """
+        with self._open_upload(file) as view:
+            response = self.upload_document(resource, None, content_type,
+                                            contentMD5=urllib.parse.quote(create_md5(view, chunk_size)),
+                                            **{**kwargs, 'raw': False})
+            url = response.payload.get('url')
+            upload = self.session_pool.get(url).put(
+                url,
+                data=view,
+                headers=self._upload_headers(response, content_type),
+                proxies=self.proxies,
+                verify=self.verify,
+                timeout=self.timeout,
+            )
+        return self._check_upload(response, upload)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_upload(file):
+        # Yields the file's content as memoryview, memory-mapped if the file is on disk
+        with contextlib.ExitStack() as stack:
+            if isinstance(file, str):
+                file = stack.enter_context(open(file, 'rb'))
+            offset = 0
+            if isinstance(file, (bytes, bytearray, memoryview)):
+                buffer = memoryview(file).cast('B')
+            elif isinstance(file, io.BytesIO):
+                buffer, offset = file.getbuffer(), file.tell()
+            else:
+                try:
+                    size = os.fstat(file.fileno()).st_size
+                except (AttributeError, OSError, io.UnsupportedOperation):
+                    size = 0
+                if size:
+                    buffer = memoryview(stack.enter_context(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)))
+                    offset = file.tell()
+                else:
+                    buffer = memoryview(file.read())
+            # The views are released before the mmap and file are closed
+            stack.enter_context(buffer)
+            yield stack.enter_context(buffer[offset:])
+
+    @staticmethod
+    def _upload_headers(response, content_type):
+        return {'Content-Type': content_type, **(response.payload.get('headers') or {})}
+
+    @staticmethod
+    def _check_upload(response, upload):
+        if 200 <= upload.status_code < 300:
+            return response
+        raise SellingApiException([{'code': str(upload.status_code), 'message': upload.text}], headers=upload.headers)
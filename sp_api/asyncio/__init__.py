@@ -0,0 +1,99 @@
+from sp_api.api import CatalogItemsVersion, FulfillmentInboundVersion, AmazonWarehousingAndDistributionVersion
+from sp_api.base.async_client import AsyncClient
+from .api import (
+    Finances,
+    Notifications,
+    Orders,
+    ProductFees,
+    Sellers,
+    Reports,
+    Products,
+    Sales,
+    Catalog,
+    Feeds,
+    Inventories,
+    FulfillmentInbound,
+    Upload,
+    Messaging,
+    MerchantFulfillment,
+    ListingsRestrictions,
+    CatalogItems,
+    ProductTypeDefinitions,
+    ListingsItems,
+    VendorTransactionStatus,
+    VendorShipments,
+    VendorOrders,
+    VendorInvoices,
+    VendorDirectFulfillmentTransactions,
+    VendorDirectFulfillmentShipping,
+    VendorDirectFulfillmentPayments,
+    VendorDirectFulfillmentOrders,
+    VendorDirectFulfillmentInventory,
+    Tokens,
+    Solicitations,
+    Shipping,
+    Services,
+    FbaSmallAndLight,
+    FbaInboundEligibility,
+    Authorization,
+    AplusContent,
+    FulfillmentOutbound,
+    Replenishment,
+    SupplySources,
+    DataKiosk,
+    ApplicationManagement,
+    AmazonWarehousingAndDistribution,
+)
+from .api import Reports as ReportsV2
+from .api import Feeds as FeedsV2
+
+__all__ = [
+    "AsyncClient",
+    "Finances",
+    "Notifications",
+    "Orders",
+    "ProductFees",
+    "Sellers",
+    "Reports",
+    "ReportsV2",
+    "Products",
+    "Sales",
+    "Catalog",
+    "Feeds",
+    "FeedsV2",
+    "Inventories",
+    "FulfillmentInbound",
+    "FulfillmentInboundVersion",
+    "Upload",
+    "Messaging",
+    "MerchantFulfillment",
+    "ListingsRestrictions",
+    "CatalogItems",
+    "CatalogItemsVersion",
+    "ProductTypeDefinitions",
+    "ListingsItems",
+    "VendorTransactionStatus",
+    "VendorShipments",
+    "VendorOrders",
+    "VendorInvoices",
+    "VendorDirectFulfillmentTransactions",
+    "VendorDirectFulfillmentShipping",
+    "VendorDirectFulfillmentPayments",
+    "VendorDirectFulfillmentOrders",
+    "VendorDirectFulfillmentInventory",
+    "Tokens",
+    "Solicitations",
+    "Shipping",
+    "Services",
+    "FbaSmallAndLight",
+    "FbaInboundEligibility",
+    "Authorization",
+    "AplusContent",
+    "FulfillmentOutbound",
+    "Replenishment",
+    "SupplySources",
+    "DataKiosk",
+    "ApplicationManagement",
+    "AmazonWarehousingAndDistribution",
+    "AmazonWarehousingAndDistributionVersion",
+]
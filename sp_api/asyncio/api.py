@@ -0,0 +1,355 @@
+import urllib.parse
+from typing import AsyncIterator, Iterable, Optional
+
+from sp_api import api
+from sp_api.api.reports.report_jobs import ReportJob, arun_report_job, arun_report_jobs
+from sp_api.base import sp_endpoint, fill_query_params, ApiResponse, SellingApiForbiddenException, json_codec
+from sp_api.base.async_client import AsyncClient
+from sp_api.base.document import DEFAULT_CHUNK_SIZE, DocumentDecoder, DocumentWriter, adecode_chunks, document_encoding
+from sp_api.base.helpers import create_md5, MD5_CHUNK_SIZE
+
+
+class Finances(AsyncClient, api.Finances):
+    pass
+
+
+class Notifications(AsyncClient, api.Notifications):
+    pass
+
+
+class ProductFees(AsyncClient, api.ProductFees):
+    pass
+
+
+class Sellers(AsyncClient, api.Sellers):
+    pass
+
+
+class Products(AsyncClient, api.Products):
+    pass
+
+
+class Sales(AsyncClient, api.Sales):
+    pass
+
+
+class Catalog(AsyncClient, api.Catalog):
+    pass
+
+
+class Inventories(AsyncClient, api.Inventories):
+    pass
+
+
+class FulfillmentInbound(AsyncClient, api.FulfillmentInbound):
+    pass
+
+
+class Upload(AsyncClient, api.Upload):
+    async def upload_file(self, resource, file, content_type='application/pdf', chunk_size: int = MD5_CHUNK_SIZE,
+                          **kwargs) -> ApiResponse:
+        with self._open_upload(file) as view:
+            md5 = await self._run_sync(lambda: create_md5(view, chunk_size))
+            response = await self.upload_document(resource, None, content_type, contentMD5=urllib.parse.quote(md5),
+                                                  **{**kwargs, 'raw': False})
+            upload = await self.http_client.put(
+                response.payload.get('url'),
+                content=self._aiter_upload(view, chunk_size),
+                # With a Content-Length, the body is not sent chunked, which presigned urls do not accept
+                headers={**self._upload_headers(response, content_type), 'Content-Length': str(view.nbytes)},
+            )
+        return self._check_upload(response, upload)
+
+    @staticmethod
+    async def _aiter_upload(view, chunk_size):
+        for start in range(0, view.nbytes, chunk_size):
+            yield bytes(view[start:start + chunk_size])
+
+    upload_file.__doc__ = api.Upload.upload_file.__doc__
+
+
+class Messaging(AsyncClient, api.Messaging):
+    pass
+
+
+class MerchantFulfillment(AsyncClient, api.MerchantFulfillment):
+    pass
+
+
+class ListingsRestrictions(AsyncClient, api.ListingsRestrictions):
+    pass
+
+
+class CatalogItems(AsyncClient, api.CatalogItems):
+    pass
+
+
+class ProductTypeDefinitions(AsyncClient, api.ProductTypeDefinitions):
+    pass
+
+
+class ListingsItems(AsyncClient, api.ListingsItems):
+    pass
+
+
+class VendorTransactionStatus(AsyncClient, api.VendorTransactionStatus):
+    pass
+
+
+class VendorShipments(AsyncClient, api.VendorShipments):
+    pass
+
+
+class VendorOrders(AsyncClient, api.VendorOrders):
+    pass
+
+
+class VendorInvoices(AsyncClient, api.VendorInvoices):
+    pass
+
+
+class VendorDirectFulfillmentTransactions(AsyncClient, api.VendorDirectFulfillmentTransactions):
+    pass
+
+
+class VendorDirectFulfillmentShipping(AsyncClient, api.VendorDirectFulfillmentShipping):
+    pass
+
+
+class VendorDirectFulfillmentPayments(AsyncClient, api.VendorDirectFulfillmentPayments):
+    pass
+
+
+class VendorDirectFulfillmentOrders(AsyncClient, api.VendorDirectFulfillmentOrders):
+    pass
+
+
+class VendorDirectFulfillmentInventory(AsyncClient, api.VendorDirectFulfillmentInventory):
+    pass
+
+
+class Tokens(AsyncClient, api.Tokens):
+    pass
+
+
+class Solicitations(AsyncClient, api.Solicitations):
+    pass
+
+
+class Shipping(AsyncClient, api.Shipping):
+    pass
+
+
+class Services(AsyncClient, api.Services):
+    pass
+
+
+class FbaSmallAndLight(AsyncClient, api.FbaSmallAndLight):
+    pass
+
+
+class Authorization(AsyncClient, api.Authorization):
+    pass
+
+
+class AplusContent(AsyncClient, api.AplusContent):
+    pass
+
+
+class FulfillmentOutbound(AsyncClient, api.FulfillmentOutbound):
+    pass
+
+
+class Replenishment(AsyncClient, api.Replenishment):
+    pass
+
+
+class SupplySources(AsyncClient, api.SupplySources):
+    pass
+
+
+class ApplicationManagement(AsyncClient, api.ApplicationManagement):
+    pass
+
+
+class AmazonWarehousingAndDistribution(AsyncClient, api.AmazonWarehousingAndDistribution):
+    pass
+
+
+class Orders(AsyncClient, api.Orders):
+    @sp_endpoint('/tokens/2021-03-01/restrictedDataToken', method='POST')
+    async def _get_token(self, **kwargs):
+        restricted_resources = [{
+            "method": "GET",
+            "path": kwargs.pop('restricted_path'),
+            "dataElements": kwargs.pop('RestrictedResources')
+        }]
+        headers = await self._run_sync(lambda: {**self.headers, 'x-amz-access-token': self.auth.access_token})
+        return await self._request(kwargs.pop('path'), data={'restrictedResources': restricted_resources, **kwargs},
+                                   headers=headers, raw=False)
+
+    async def _access_restricted(self, kwargs):
+        path, token_kwargs, cache_key = self._restricted_request(kwargs)
+        while True:
+            token = self.rdt_cache.get(cache_key)
+            cached = token is not None
+            if not cached:
+                token = (await self._get_token(**token_kwargs)).payload
+                self._cache_restricted_data_token(cache_key, token)
+            if self.keep_restricted_data_token:
+                self.restricted_data_token = token['restrictedDataToken']
+            # Pass the token per request, concurrent calls on this client must not share it
+            headers = {**await self._run_sync(lambda: self.headers), 'x-amz-access-token': token['restrictedDataToken']}
+            try:
+                return await self._request(path, params={**kwargs}, headers=headers)
+            except SellingApiForbiddenException:
+                # A cached token can be revoked before it expires, mint a new one once
+                self.rdt_cache.delete(cache_key)
+                if not cached:
+                    raise
+
+
+class Reports(AsyncClient, api.Reports):
+    @sp_endpoint('/reports/2021-06-30/documents/{}', method='GET')
+    async def get_report_document(self, reportDocumentId, download: bool = False, file=None,
+                                  character_code=None, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                  **kwargs) -> ApiResponse:
+        res = await self._request(fill_query_params(kwargs.pop('path'), reportDocumentId), add_marketplace=False)
+        if stream and (download or file):
+            encoding, chunks = await self._stream_document(res, character_code, chunk_size)
+            if file:
+                with DocumentWriter(file, encoding) as writer:
+                    async for chunk in chunks:
+                        writer.write(chunk)
+            else:
+                res.payload.update({
+                    'document': chunks,
+                })
+        elif download or file or ('decrypt' in kwargs and kwargs['decrypt']):
+            document_response = await self.http_client.get(res.payload.get('url'))
+            self._handle_document(res, document_response.content, document_response.charset_encoding,
+                                  download, file, character_code)
+        return res
+
+    async def iter_report_document(self, reportDocumentId, character_code=None,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[str]:
+        res = await self.get_report_document(reportDocumentId, download=True, character_code=character_code,
+                                             stream=True, chunk_size=chunk_size)
+        async for chunk in res.payload['document']:
+            yield chunk
+
+    async def _stream_document(self, res, character_code, chunk_size):
+        document_response = await self.http_client.send(
+            self.http_client.build_request('GET', res.payload.get('url')), stream=True)
+        if document_response.is_error:
+            await document_response.aclose()
+            document_response.raise_for_status()
+        encoding = document_encoding(document_response.charset_encoding, character_code)
+        decoder = DocumentDecoder('compressionAlgorithm' in res.payload, encoding)
+        return encoding, adecode_chunks(document_response.aiter_bytes(chunk_size), decoder,
+                                        close=document_response.aclose)
+
+    async def export_report_document(self, reportDocumentId, file, format: str = 'parquet', report_type=None,
+                                     batch_size: int = 65536, schema_hints: Optional[dict] = None,
+                                     compression: Optional[str] = None, character_code: Optional[str] = None,
+                                     chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                     decimal_separator: Optional[str] = None) -> int:
+        from sp_api.util.report_export import ArrowFileWriter, RecordBatchBuilder
+        reader = self.iter_report_rows(reportDocumentId, report_type=report_type, row_type=tuple,
+                                       character_code=character_code, chunk_size=chunk_size)
+        builder = RecordBatchBuilder(reader, batch_size, schema_hints, decimal_separator)
+        with ArrowFileWriter(file, format, compression) as writer:
+            async for row in reader:
+                batch = builder.append(row)
+                if batch is not None:
+                    writer.write(batch)
+            batch = builder.flush()
+            if batch is not None:
+                writer.write(batch)
+        return writer.rows
+
+    async def run_report(self, job: Optional[ReportJob] = None, **kwargs) -> ReportJob:
+        return await arun_report_job(self, job or ReportJob(**kwargs))
+
+    def run_reports(self, jobs: Iterable, max_workers: int = 8) -> AsyncIterator[ReportJob]:
+        return arun_report_jobs(self, jobs, max_workers)
+
+    get_report_document.__doc__ = api.Reports.get_report_document.__doc__
+    run_report.__doc__ = api.Reports.run_report.__doc__
+    run_reports.__doc__ = api.Reports.run_reports.__doc__
+    iter_report_document.__doc__ = api.Reports.iter_report_document.__doc__
+    export_report_document.__doc__ = api.Reports.export_report_document.__doc__
+
+
+class Feeds(AsyncClient, api.Feeds):
+    async def submit_feed(self, feed_type, file, content_type='text/tsv', **kwargs):
+        document_response = await self.create_feed_document(file, content_type)
+        return document_response, await self.create_feed(feed_type, document_response.payload.get('feedDocumentId'),
+                                                          **kwargs)
+
+    @sp_endpoint('/feeds/2021-06-30/documents', method='POST')
+    async def create_feed_document(self, file, content_type, **kwargs) -> ApiResponse:
+        data = {
+            'contentType': kwargs.get('contentType', content_type)
+        }
+        response = await self._request(kwargs.get('path'), data={**data, **kwargs}, raw=False if file else None)
+
+        if file is None:
+            return response
+
+        upload = await self.http_client.put(
+            response.payload.get('url'),
+            content=self._read_feed_document(file),
+            headers={'Content-Type': content_type}
+        )
+        return self._check_upload(response, upload)
+
+    @sp_endpoint('/feeds/2021-06-30/documents/{}', method='GET')
+    async def get_feed_result_document(self, feedDocumentId, **kwargs) -> str:
+        response = await self._request(fill_query_params(kwargs.pop('path'), feedDocumentId), params=kwargs,
+                                       add_marketplace=False, raw=False)
+        doc_response = await self.http_client.get(response.payload.get('url'))
+        return self._decode_document(response, doc_response.content, doc_response.charset_encoding)
+
+    submit_feed.__doc__ = api.Feeds.submit_feed.__doc__
+    create_feed_document.__doc__ = api.Feeds.create_feed_document.__doc__
+    get_feed_result_document.__doc__ = api.Feeds.get_feed_result_document.__doc__
+
+
+class FbaInboundEligibility(AsyncClient, api.FbaInboundEligibility):
+    @sp_endpoint('/fba/inbound/v1/eligibility/itemPreview', method='GET')
+    async def get_item_eligibility_preview(self, **kwargs) -> ApiResponse:
+        return self._add_ineligibility_messages(await self._request(kwargs.pop('path'), params=kwargs))
+
+    get_item_eligibility_preview.__doc__ = api.FbaInboundEligibility.get_item_eligibility_preview.__doc__
+
+
+class DataKiosk(AsyncClient, api.DataKiosk):
+    @sp_endpoint('/dataKiosk/2023-11-15/documents/{}', method='GET')
+    async def get_document(self, document_id, download: bool = False, file=None, encoding='utf-8',
+                           **kwargs) -> ApiResponse:
+        process = download or file or kwargs.get('decrypt')
+        res = await self._request(fill_query_params(kwargs.pop('path'), document_id), params=kwargs,
+                                  add_marketplace=False, raw=False if process else None)
+        if process:
+            document_response = await self.http_client.get(res.payload.get('documentUrl'))
+            self._handle_document(res, document_response.content, download, file, encoding)
+        return res
+
+    async def iter_document_records(self, document_id, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                    **kwargs) -> AsyncIterator[dict]:
+        url = (await self.get_document(document_id, **kwargs)).payload.get('documentUrl')
+        async with self.http_client.stream('GET', url) as document_response:
+            document_response.raise_for_status()
+            buffer = b''
+            async for chunk in document_response.aiter_bytes(chunk_size):
+                lines = (buffer + chunk).split(b'\n')
+                buffer = lines.pop()
+                for line in lines:
+                    if line.strip():
+                        yield json_codec.loads(line)
+            if buffer.strip():
+                yield json_codec.loads(buffer)
+
+    get_document.__doc__ = api.DataKiosk.get_document.__doc__
+    iter_document_records.__doc__ = api.DataKiosk.iter_document_records.__doc__
@@ -1,9 +1,14 @@
 from .access_token_client import AccessTokenClient
 from .access_token_response import AccessTokenResponse
 from .credentials import Credentials
+from .token_cache import TokenCache, MemoryTokenCache, FileTokenCache, KeyValueTokenCache
 
 __all__ = [
     'AccessTokenResponse',
     'AccessTokenClient',
     'Credentials',
+    'TokenCache',
+    'MemoryTokenCache',
+    'FileTokenCache',
+    'KeyValueTokenCache',
 ]
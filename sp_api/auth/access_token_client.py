@@ -1,34 +1,93 @@
 import os
+import threading
+import time
 
-import requests
 import hashlib
 import logging
-from cachetools import TTLCache
 from sp_api.base import BaseClient
+from sp_api.base.session import SessionPool, default_session_pool
+from sp_api.base.json_codec import loads_response
 
 from .credentials import Credentials
 from .access_token_response import AccessTokenResponse
 from .exceptions import AuthorizationError
+from .token_cache import TokenCache, MemoryTokenCache, FileTokenCache
 
-cache = TTLCache(maxsize=int(os.environ.get('SP_API_AUTH_CACHE_SIZE', 10)), ttl=3200)
-grantless_cache = TTLCache(maxsize=int(os.environ.get('SP_API_AUTH_CACHE_SIZE', 10)), ttl=3200)
+
+def _default_cache() -> TokenCache:
+    if os.environ.get('SP_API_AUTH_CACHE_DIR'):
+        return FileTokenCache()
+    return MemoryTokenCache()
+
+
+cache = _default_cache()
+grantless_cache = _default_cache()
+
+# Tokens are refreshed in the background once they expire within this many seconds
+REFRESH_AHEAD = float(os.environ.get('SP_API_AUTH_REFRESH_AHEAD', 300))
+# Tokens are not used anymore once they expire within this many seconds
+EXPIRY_MARGIN = 30
 
 logger = logging.getLogger(__name__)
 
 
+class _RefreshLocks:
+    """
+    A lock per cache key, so refreshes of different keys do not wait for each other
+
+    A key's lock is dropped once no thread holds or waits for it, the locks do not grow with the number of keys.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # cache key -> [lock, number of threads holding or waiting for it]
+        self._locks = {}
+
+    def acquire(self, cache_key, blocking: bool = True) -> bool:
+        with self._lock:
+            entry = self._locks.setdefault(cache_key, [threading.Lock(), 0])
+            entry[1] += 1
+        if entry[0].acquire(blocking):
+            return True
+        self._leave(cache_key, entry)
+        return False
+
+    def release(self, cache_key):
+        with self._lock:
+            entry = self._locks[cache_key]
+        entry[0].release()
+        self._leave(cache_key, entry)
+
+    def _leave(self, cache_key, entry):
+        with self._lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[cache_key]
+
+    def __len__(self):
+        return len(self._locks)
+
+
+_refresh_locks = _RefreshLocks()
+
+
 class AccessTokenClient(BaseClient):
     host = 'api.amazon.com'
     grant_type = 'refresh_token'
     path = '/auth/o2/token'
 
-    def __init__(self, refresh_token=None, credentials=None, proxies=None, verify=True):
+    def __init__(self, refresh_token=None, credentials=None, proxies=None, verify=True,
+                 session_pool: SessionPool = None, token_cache: TokenCache = None):
         self.cred = Credentials(refresh_token, credentials)
         self.proxies = proxies
         self.verify = verify
+        self.session_pool = session_pool or default_session_pool
+        self.token_cache = token_cache
 
     def _request(self, url, data, headers):
-        response = requests.post(url, data=data, headers=headers, proxies=self.proxies, verify=self.verify)
-        response_data = response.json()
+        response = self.session_pool.get(url).post(url, data=data, headers=headers, proxies=self.proxies,
+                                                   verify=self.verify)
+        response_data = loads_response(response)
         if response.status_code != 200:
             error_message = response_data.get('error_description')
             error_code = response_data.get('error')
@@ -41,14 +100,7 @@ class AccessTokenClient(BaseClient):
         :return:AccessTokenResponse
         """
 
-        cache_key = self._get_cache_key()
-        try:
-            access_token = cache[cache_key]
-        except KeyError:
-            request_url = self.scheme + self.host + self.path
-            access_token = self._request(request_url, self.data, self.headers)
-            cache[cache_key] = access_token
-        return AccessTokenResponse(**access_token)
+        return AccessTokenResponse(**self._get_token(self.token_cache or cache, self._get_cache_key(), self.data))
 
     def get_grantless_auth(self, scope='sellingpartnerapi::notifications'):
         """
@@ -65,23 +117,60 @@ class AccessTokenClient(BaseClient):
         &client_secret=Y76SDl2F
         :return: AccessTokenResponse
         """
-        global grantless_cache
-        cache_key = self._get_cache_key(scope)
+        return AccessTokenResponse(**self._get_token(self.token_cache or grantless_cache, self._get_cache_key(scope),
+                                                     self.grantless_data(scope)))
+
+    def _get_token(self, token_cache, cache_key, data) -> dict:
+        """
+        Returns the cached token for cache_key.
+
+        A missing or expired token is refreshed while the caller waits; concurrent callers wait for the same refresh.
+        A token that expires soon is returned and refreshed in the background.
+        """
+        access_token = token_cache.get(cache_key)
+        now = time.time()
+        if access_token is None or access_token['expires_at'] - EXPIRY_MARGIN <= now:
+            return self._refresh(token_cache, cache_key, data)
+        if access_token['expires_at'] - REFRESH_AHEAD <= now:
+            self._refresh_in_background(token_cache, cache_key, data)
+        logger.debug('from_cache. key: %s', cache_key)
+        return access_token
+
+    def _refresh(self, token_cache, cache_key, data) -> dict:
+        _refresh_locks.acquire(cache_key)
         try:
-            access_token = grantless_cache[cache_key]
-            logger.debug('from_cache. scope: %s', scope)
-        except KeyError:
-            request_url = self.scheme + self.host + self.path
-            access_token = self._request(
-                request_url,
-                data=self.grantless_data(scope),
-                headers=self.headers
-            )
-            logger.debug('token_refreshed')
-            grantless_cache.clear()
-            grantless_cache[cache_key] = access_token
-
-        return AccessTokenResponse(**access_token)
+            access_token = token_cache.get(cache_key)
+            # Another thread refreshed the token while this one waited for the lock
+            if access_token is not None and access_token['expires_at'] - EXPIRY_MARGIN > time.time():
+                return access_token
+            return self._fetch(token_cache, cache_key, data)
+        finally:
+            _refresh_locks.release(cache_key)
+
+    def _refresh_in_background(self, token_cache, cache_key, data):
+        if not _refresh_locks.acquire(cache_key, blocking=False):
+            # This key is being refreshed already
+            return
+
+        def refresh():
+            try:
+                self._fetch(token_cache, cache_key, data)
+            except Exception as e:
+                # The cached token stays valid until it expires, the next call retries the refresh
+                logger.warning('background token refresh failed: %s', e)
+            finally:
+                _refresh_locks.release(cache_key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _fetch(self, token_cache, cache_key, data) -> dict:
+        request_url = self.scheme + self.host + self.path
+        access_token = self._request(request_url, data, self.headers)
+        expires_in = int(access_token.get('expires_in') or 3600)
+        access_token['expires_at'] = time.time() + expires_in
+        logger.debug('token_refreshed')
+        token_cache.set(cache_key, access_token, expires_in)
+        return access_token
 
     def authorize_auth_code(self, auth_code):
         request_url = self.scheme + self.host + self.path
@@ -0,0 +1,163 @@
+import abc
+import json
+import os
+import threading
+import time
+from typing import Optional
+
+from cachetools import LRUCache
+
+from sp_api.base.local_files import private_temp_directory, write_json
+
+
+class TokenCache(abc.ABC):
+    """
+    Storage for access tokens
+
+    Values are the token responses of the LWA api, each key expires after the `ttl` passed to `set`.
+    Implementations must be safe to use from several threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the token stored for key, or None if it is missing or expired
+        """
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: str, value: dict, ttl: float):
+        """
+        Store the token for ttl seconds
+        """
+        pass
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        pass
+
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value, value['expires_at'] - time.time() if 'expires_at' in value else 3600)
+
+
+class MemoryTokenCache(TokenCache):
+    """
+    Keeps tokens in the memory of the process, evicting the least recently used once maxsize is reached
+
+    Args:
+        maxsize: int | The maximum number of tokens, defaults to `SP_API_AUTH_CACHE_SIZE` or 1000
+    """
+
+    def __init__(self, maxsize: int = None):
+        self._cache = LRUCache(maxsize=maxsize or int(os.environ.get('SP_API_AUTH_CACHE_SIZE', 1000)))
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._cache[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._cache[key] = (value, time.time() + ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+class FileTokenCache(TokenCache):
+    """
+    Keeps each token in a json file, so it survives restarts and is shared by all processes using the same directory
+
+    Files are written atomically and are only readable by the current user.
+
+    Examples:
+        literal blocks::
+
+            Orders(token_cache=FileTokenCache('/var/cache/sp-api'))
+
+    Args:
+        directory: str | Where tokens are stored, defaults to `SP_API_AUTH_CACHE_DIR` or `sp_api_tokens` in the
+                   temp dir, which must be owned by the current user and have mode 0700
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or os.environ.get('SP_API_AUTH_CACHE_DIR') or private_temp_directory('sp_api_tokens')
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('expires_at', 0) <= time.time():
+            self.delete(key)
+            return None
+        return entry.get('value')
+
+    def set(self, key, value, ttl):
+        write_json(self._path(key), {'value': value, 'expires_at': time.time() + ttl})
+
+    def delete(self, key):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+
+class KeyValueTokenCache(TokenCache):
+    """
+    Keeps tokens in a key-value store with expiring keys, e.g. Redis or a compatible server
+
+    The client needs `get(key)`, `set(key, value, ex=seconds)` and `delete(key)`, like `redis.Redis`.
+
+    Examples:
+        literal blocks::
+
+            import redis
+
+            Orders(token_cache=KeyValueTokenCache(redis.Redis()))
+
+    Args:
+        client: The key-value store's client
+        prefix: str | Prepended to every key
+    """
+
+    def __init__(self, client, prefix: str = 'sp_api:'):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        return json.loads(value)
+
+    def set(self, key, value, ttl):
+        ttl = int(ttl)
+        if ttl > 0:
+            self.client.set(self.prefix + key, json.dumps(value), ex=ttl)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
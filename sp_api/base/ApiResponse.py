@@ -1,5 +1,9 @@
 import pprint
 
+_UNSET = object()
+# Keys of a response body that are not part of the payload
+_FIELDS = frozenset(('payload', 'errors', 'pagination', 'headers', 'nextToken'))
+
 
 class ApiResponse:
     """
@@ -7,6 +11,10 @@ class ApiResponse:
 
     Wrapper around all responses from the API.
 
+    Responses are slotted and keep a reference to the parsed body instead of copying it. `headers` is kept as
+    returned by the HTTP client, `rate_limit` and `next_token` are looked up on first access.
+    Clients with `keep_response_headers = False` drop the headers, keeping only the rate limit.
+
     Examples:
         literal blocks::
 
@@ -30,6 +38,7 @@ class ApiResponse:
         kwargs: any
 
     """
+    __slots__ = ('payload', 'errors', 'pagination', 'headers', '_extra', '_next_token', '_rate_limit')
 
     def __init__(
         self,
@@ -44,23 +53,117 @@ class ApiResponse:
         self.errors = errors
         self.pagination = pagination
         self.headers = headers
-        self.rate_limit = headers.get("x-amzn-RateLimit-Limit")
+        self._extra = kwargs
+        self._next_token = nextToken or _UNSET
+        self._rate_limit = _UNSET
+
+    @classmethod
+    def from_json(cls, js: dict, headers=None, keep_headers: bool = True) -> 'ApiResponse':
+        """
+        Returns the response for a parsed json body, sharing the body instead of copying it
+
+        Args:
+            js: dict | The response body
+            headers: any | The response headers
+            keep_headers: bool | If False, only the rate limit is kept of the headers
+        """
+        if _FIELDS.isdisjoint(js):
+            response = cls.__new__(cls)
+            response.payload = js or {}
+            response.errors = None
+            response.pagination = None
+            response.headers = headers
+            response._extra = response.payload
+            response._next_token = _UNSET
+            response._rate_limit = _UNSET
+        else:
+            response = cls(**js, headers=headers)
+        if not keep_headers:
+            response._rate_limit = response.rate_limit
+            response.headers = None
+        return response
+
+    @property
+    def next_token(self):
+        if self._next_token is _UNSET:
+            self._next_token = self._find_next_token()
+        return self._next_token
+
+    @next_token.setter
+    def next_token(self, value):
+        self._next_token = value
+
+    @property
+    def rate_limit(self):
+        if self._rate_limit is _UNSET:
+            self._rate_limit = self.headers.get("x-amzn-RateLimit-Limit") if self.headers is not None else None
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, value):
+        self._rate_limit = value
+
+    @property
+    def kwargs(self):
+        if self._extra is self.payload or self._extra == self.payload:
+            return self.__getattr__('kwargs')
+        return self._extra
+
+    def hydrate(self, model, key: str = None):
+        """
+        Returns the payload, or one of its properties, parsed into typed models
+
+        Examples:
+            literal blocks::
+
+                from sp_api.api.orders.orders_definitions import Order
+
+                orders = Orders().get_orders(CreatedAfter='TEST_CASE_200').hydrate(Order, 'Orders')
+
+        Args:
+            model: Model | The model class, e.g. `Order`
+            key: str | optional, the property of the payload to parse, e.g. `Orders`
+
+        Returns:
+            a list of models if the value is a list, a model otherwise
+        """
+        value = self.payload.get(key) if key else self.payload
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [model.from_dict(v) for v in value]
+        return model.from_dict(value)
+
+    def _find_next_token(self):
         try:
-            self.next_token = (
-                nextToken
-                or self.payload.get('pagination', {}).get("nextToken", None)
+            return (
+                self.payload.get('pagination', {}).get("nextToken", None)
                 or self.payload.get("NextToken", None)
-                or self.pagination.get("nextToken", None)
+                or (self.pagination or {}).get("nextToken", None)
                 or self.payload.get('nextPageToken', None)
             )
-
         except AttributeError:
-            self.next_token = None
-        if kwargs != self.payload:
-            self.kwargs = kwargs
+            return None
+
+    def _asdict(self):
+        d = {'payload': self.payload, 'errors': self.errors, 'pagination': self.pagination, 'headers': self.headers,
+             'rate_limit': self.rate_limit, 'next_token': self.next_token}
+        if not (self._extra is self.payload or self._extra == self.payload):
+            d['kwargs'] = self._extra
+        return d
+
+    def __getstate__(self):
+        # The lazy fields are resolved, the sentinel does not survive pickling
+        return {'payload': self.payload, 'errors': self.errors, 'pagination': self.pagination,
+                'headers': self.headers, '_extra': self._extra, '_next_token': self.next_token,
+                '_rate_limit': self.rate_limit}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def __str__(self):
-        return pprint.pformat(vars(self))
+        return pprint.pformat(self._asdict())
 
     def __call__(self, item=None, **kwargs):
         if not item:
@@ -68,4 +171,6 @@ class ApiResponse:
         return self.payload.get(item)
 
     def __getattr__(self, item):
+        if item.startswith('__') or item in ApiResponse.__slots__:
+            raise AttributeError(item)
         return self.payload.get(item)
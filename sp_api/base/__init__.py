@@ -1,5 +1,6 @@
 from .base_client import BaseClient
 from .client import Client
+from .async_client import AsyncClient
 from .helpers import fill_query_params, sp_endpoint, create_md5, nest_dict, _nest_dict_rec, deprecated
 from .marketplaces import Marketplaces
 from .exceptions import SellingApiException
@@ -20,13 +21,19 @@ from .included_data import IncludedData, ListingItemsIncludedData, CatalogItemsI
 from .notifications import NotificationType
 from .credential_provider import CredentialProvider, MissingCredentials
 from .ApiResponse import ApiResponse
+from .raw_response import RawResponse
+from .model import Model, Nested
 from .processing_status import ProcessingStatus
-from .reportTypes import ReportType
+from .reportTypes import ReportType, ReportFormat, report_format
 from .feedTypes import FeedType
 from sp_api.auth import AccessTokenClient, Credentials
 from sp_api.auth.exceptions import AuthorizationError
 from sp_api.base.inegibility_reasons import IneligibilityReasonList
 from .marketplaces import AwsEnv
+from .session import SessionPool
+from .rate_limiter import RateLimiter, TokenBucket, RateLimitBackend, MemoryRateLimitBackend, SQLiteRateLimitBackend
+from .circuit_breaker import CircuitBreaker, CircuitState, CircuitOpenException
+from .json_codec import JsonCodec, OrjsonCodec, get_codec, set_codec
 
 
 __all__ = [
@@ -34,10 +41,16 @@ __all__ = [
     'AuthorizationError',
     'AccessTokenClient',
     'ReportType',
+    'ReportFormat',
+    'report_format',
     'FeedType',
     'ProcessingStatus',
     'ApiResponse',
+    'RawResponse',
+    'Model',
+    'Nested',
     'Client',
+    'AsyncClient',
     'BaseClient',
     'Marketplaces',
     'fill_query_params',
@@ -69,5 +82,18 @@ __all__ = [
     'IncludedData',
     'ListingItemsIncludedData',
     'CatalogItemsIncludedData',
-    'AwsEnv'
+    'AwsEnv',
+    'SessionPool',
+    'RateLimiter',
+    'TokenBucket',
+    'RateLimitBackend',
+    'MemoryRateLimitBackend',
+    'SQLiteRateLimitBackend',
+    'CircuitBreaker',
+    'CircuitState',
+    'CircuitOpenException',
+    'JsonCodec',
+    'OrjsonCodec',
+    'get_codec',
+    'set_codec',
 ]
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Union
+from json import JSONDecodeError
+
+from requests import PreparedRequest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .ApiResponse import ApiResponse
+from .raw_response import RawResponse
+from . import json_codec
+from .client import Client
+
+
+class AsyncClient(Client):
+    """
+    Asyncio variant of `Client`
+
+    `_request` and `_check_response` are coroutines, so every endpoint method inherited from the
+    synchronous client returns an awaitable instead of an `ApiResponse`.
+    Requests are sent with an `httpx.AsyncClient`, which can be shared between endpoint clients.
+    Requires the `async` extra: `pip install python-amazon-sp-api[async]`
+
+    Examples:
+        literal blocks::
+
+            from sp_api.asyncio import Orders
+
+            async with Orders() as orders:
+                res = await orders.get_order_items('TEST_CASE_200')
+
+    Args:
+        http_client: httpx.AsyncClient | optional, the client used to send requests.
+                     If omitted, one is created on first use and closed by `aclose`
+        **kwargs: see `Client`
+    """
+
+    def __init__(self, *args, http_client=None, **kwargs):
+        if httpx is None:
+            raise ImportError('AsyncClient requires httpx. Install it with `pip install python-amazon-sp-api[async]`')
+        super().__init__(*args, **kwargs)
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+
+    @property
+    def http_client(self):
+        if self._http_client is None:
+            self._http_client = self._make_http_client()
+        return self._http_client
+
+    def _make_http_client(self):
+        limits = httpx.Limits(max_connections=self.session_pool.pool_maxsize,
+                              max_keepalive_connections=self.session_pool.pool_maxsize if self.session_pool.keep_alive else 0)
+        mounts = None
+        if self.proxies:
+            mounts = {
+                (scheme if '://' in scheme else scheme + '://'): httpx.AsyncHTTPTransport(proxy=proxy, verify=self.verify,
+                                                                                        limits=limits)
+                for scheme, proxy in self.proxies.items()
+            }
+        return httpx.AsyncClient(verify=self.verify, limits=limits, mounts=mounts, timeout=self._make_timeout())
+
+    def _make_timeout(self):
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(self.timeout)
+
+    async def _request(self, path: str, *, data: dict = None, params: dict = None, headers=None,
+                       add_marketplace=True, res_no_data: bool = False, bulk: bool = False,
+                       wrap_list: bool = False, raw: bool = None) -> Union[ApiResponse, RawResponse]:
+        if params is None:
+            params = {}
+        if data is None:
+            data = {}
+
+        # The method is kept local, the client can be shared by tasks
+        method = params.pop('method', data.pop('method', 'GET') if isinstance(data, dict) else 'GET')
+        raw = self._pop_raw(params, data, raw)
+
+        if add_marketplace:
+            self._add_marketplaces(data if method in ('POST', 'PUT') else params, method)
+
+        if self.circuit_breaker:
+            circuit_key = self._circuit_key(path, method)
+            self.circuit_breaker.before(circuit_key)
+
+        try:
+            if self.rate_limiter:
+                rate_limit_key, rate, burst = self._rate_limit(path, method)
+                await self.rate_limiter.acquire_async(rate_limit_key, rate, burst)
+
+            # Encode the query string exactly like the synchronous client does
+            prepared = PreparedRequest()
+            prepared.prepare_url(self.endpoint + self._check_version(path), params)
+
+            res = await self.http_client.request(
+                method,
+                prepared.url,
+                content=json_codec.dumps(data) if data and method in ('POST', 'PUT', 'PATCH') else None,
+                headers=headers or await self._run_sync(lambda: self.headers),
+            )
+        except BaseException as e:
+            if self.circuit_breaker:
+                self._record_circuit_error(circuit_key, e)
+            raise
+        self.res = res
+        if self.rate_limiter:
+            self._update_rate_limit(rate_limit_key, res, burst)
+        if self.circuit_breaker:
+            self.circuit_breaker.record(circuit_key, res.status_code >= 500)
+
+        if raw:
+            return self._raw_response(res)
+        return await self._check_response(res, res_no_data, bulk, wrap_list, method)
+
+    async def _check_response(self, res, res_no_data: bool = False, bulk: bool = False,
+                              wrap_list: bool = False, method: str = None) -> ApiResponse:
+        if (method == 'DELETE' or res_no_data) and 200 <= res.status_code < 300:
+            try:
+                js = json_codec.loads_response(res) or {}
+            except JSONDecodeError:
+                js = {'status_code': res.status_code}
+        else:
+            try:
+                js = json_codec.loads_response(res) or {}
+            except JSONDecodeError:
+                js = {}
+
+        return self._parse_response(js, res, wrap_list)
+
+    async def _request_grantless_operation(self, path: str, *, data: dict = None, params: dict = None):
+        headers = await self._run_sync(lambda: self.grantless_headers)
+        return await self._request(path, data=data, params=params, headers=headers)
+
+    @staticmethod
+    async def _run_sync(function):
+        # Access tokens are fetched with the blocking AccessTokenClient, keep it off the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, function)
+
+    async def aclose(self):
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self):
+        self.keep_restricted_data_token = True
+        return self
+
+    async def __aexit__(self, *args, **kwargs):
+        self.restricted_data_token = None
+        self.keep_restricted_data_token = False
+        await self.aclose()
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Hashable
+
+
+class CircuitState(str, Enum):
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+
+
+class CircuitOpenException(Exception):
+    """
+    Raised instead of sending a request to an operation whose circuit is open
+
+    Not a `SellingApiException`, so `sp_retry` does not wait for the circuit to close.
+
+    Parameters:
+
+        key: The circuit's key, see `Client.circuit_breaker_key`
+        retry_after: float Seconds until the circuit lets a trial request through
+    """
+
+    def __init__(self, key: Hashable, retry_after: float):
+        super().__init__('Circuit of %s is open, retry in %.1f seconds' % (key, retry_after))
+        self.key = key
+        self.retry_after = retry_after
+
+
+class _Circuit:
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.calls = deque()
+        self.failures = 0
+        self.opened_at = None
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """
+    Fail fast on operations that keep failing
+
+    Keeps a circuit per key, made of the region and operation (see `Client.circuit_breaker_key`).
+    A circuit is closed while requests succeed. Server errors (5xx) and transport errors count as failures; once
+    at least minimum_calls requests were sent in the last `window` seconds and failure_rate of them failed,
+    the circuit opens and requests raise `CircuitOpenException` without being sent. After open_duration seconds
+    the circuit is half-open and lets up to half_open_calls trial requests through: if they succeed the circuit
+    closes, if one fails it opens again.
+
+    Pass the same instance to all clients that should share the circuits.
+
+    Examples:
+        literal blocks::
+
+            breaker = CircuitBreaker(failure_rate=0.5, window=60, minimum_calls=10, open_duration=30)
+            Orders(circuit_breaker=breaker).get_orders(CreatedAfter='TEST_CASE_200')
+
+    Args:
+        failure_rate: float | The share of failed requests that opens the circuit
+        window: float | The seconds over which the failure rate is measured
+        minimum_calls: int | The number of requests in the window needed before the circuit can open
+        open_duration: float | The seconds a circuit stays open before trial requests are let through
+        half_open_calls: int | The number of concurrent trial requests of a half-open circuit
+        clock: callable | Returns the current time in seconds
+    """
+
+    def __init__(self, failure_rate: float = 0.5, window: float = 60, minimum_calls: int = 10,
+                 open_duration: float = 30, half_open_calls: int = 1, clock=time.monotonic):
+        self.failure_rate = failure_rate
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.clock = clock
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, key: Hashable) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CircuitState.CLOSED
+            self._update(circuit, self.clock())
+            return circuit.state
+
+    def before(self, key: Hashable):
+        """
+        Call before sending a request, raises `CircuitOpenException` if the circuit of `key` does not allow it
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return
+            now = self.clock()
+            self._update(circuit, now)
+            if circuit.state == CircuitState.OPEN:
+                raise CircuitOpenException(key, circuit.opened_at + self.open_duration - now)
+            if circuit.state == CircuitState.HALF_OPEN:
+                if circuit.trials >= self.half_open_calls:
+                    raise CircuitOpenException(key, 0)
+                circuit.trials += 1
+
+    def record(self, key: Hashable, failed: bool):
+        """
+        Record the outcome of a request sent after `before`
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                # Successes count too, failures are measured against all calls of the window
+                circuit = self._circuits[key] = _Circuit()
+            now = self.clock()
+            if circuit.state == CircuitState.HALF_OPEN:
+                circuit.trials = max(circuit.trials - 1, 0)
+                if failed:
+                    self._open(circuit, now)
+                else:
+                    self._close(circuit)
+                return
+            if circuit.state == CircuitState.OPEN:
+                return
+            circuit.calls.append((now, failed))
+            circuit.failures += failed
+            self._expire(circuit, now)
+            if len(circuit.calls) >= self.minimum_calls and circuit.failures >= self.failure_rate * len(circuit.calls):
+                self._open(circuit, now)
+
+    def release(self, key: Hashable):
+        """
+        Free the half-open slot taken by `before` for a request that was not sent
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == CircuitState.HALF_OPEN:
+                circuit.trials = max(circuit.trials - 1, 0)
+
+    def reset(self, key: Hashable):
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def _update(self, circuit: _Circuit, now: float):
+        if circuit.state == CircuitState.OPEN and now >= circuit.opened_at + self.open_duration:
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.trials = 0
+
+    def _expire(self, circuit: _Circuit, now: float):
+        while circuit.calls and circuit.calls[0][0] <= now - self.window:
+            circuit.failures -= circuit.calls.popleft()[1]
+
+    def _open(self, circuit: _Circuit, now: float):
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = now
+        circuit.calls.clear()
+        circuit.failures = 0
+
+    @staticmethod
+    def _close(circuit: _Circuit):
+        circuit.state = CircuitState.CLOSED
+        circuit.calls.clear()
+        circuit.failures = 0
+        circuit.trials = 0
@@ -1,21 +1,31 @@
 import hashlib
 import json
 from datetime import datetime
+from typing import Union
 import logging
 import os
 from json import JSONDecodeError
 
-from requests import request
-
-from sp_api.auth import AccessTokenClient, AccessTokenResponse
+from sp_api.auth import AccessTokenClient, AccessTokenResponse, TokenCache, MemoryTokenCache
 from .ApiResponse import ApiResponse
+from . import json_codec
+from .raw_response import RawResponse
 from .base_client import BaseClient
 from .exceptions import get_exception_for_code, MissingScopeException
+from .helpers import current_operation
 from .marketplaces import Marketplaces
+from .session import SessionPool, default_session_pool
+from .rate_limiter import RateLimiter
+from .circuit_breaker import CircuitBreaker
 from sp_api.base.credential_provider import CredentialProvider
 
 log = logging.getLogger(__name__)
 
+# Restricted data tokens are shared by all clients that are not passed their own rdt_cache
+default_rdt_cache = MemoryTokenCache()
+# Cached restricted data tokens are not used anymore once they expire within this many seconds
+RDT_EXPIRY_MARGIN = 60
+
 
 def show_donation_message():
     import os
@@ -36,6 +46,8 @@ def show_donation_message():
 class Client(BaseClient):
     grantless_scope: str = ''
     keep_restricted_data_token: bool = False
+    # Set to False to keep only the rate limit of the response headers, e.g. when holding many responses in memory
+    keep_response_headers: bool = True
     version = None
 
     def __init__(
@@ -53,6 +65,11 @@ class Client(BaseClient):
             version=None,
             credential_providers=None,
             auth_token_client_class=AccessTokenClient,
+            session_pool: SessionPool = None,
+            rate_limiter: RateLimiter = None,
+            circuit_breaker: CircuitBreaker = None,
+            token_cache: TokenCache = None,
+            rdt_cache: TokenCache = None,
     ):
         if os.environ.get('SP_API_DEFAULT_MARKETPLACE', None):
             marketplace = Marketplaces[os.environ.get('SP_API_DEFAULT_MARKETPLACE')]
@@ -66,11 +83,18 @@ class Client(BaseClient):
         self.marketplace_id = marketplace.marketplace_id
         self.region = marketplace.region
         self.restricted_data_token = restricted_data_token
-        self._auth = auth_token_client_class(refresh_token=refresh_token, credentials=self.credentials, proxies=proxies, verify=verify)
+        self.session_pool = session_pool or default_session_pool
+        auth_kwargs = {k: v for k, v in (('session_pool', session_pool), ('token_cache', token_cache))
+                       if v is not None}
+        self._auth = auth_token_client_class(refresh_token=refresh_token, credentials=self.credentials, proxies=proxies,
+                                             verify=verify, **auth_kwargs)
         self.proxies = proxies
         self.timeout = timeout
         self.version = version
         self.verify = verify
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.rdt_cache = rdt_cache if rdt_cache is not None else default_rdt_cache
         self.res = None
 
         show_donation_message()
@@ -85,6 +109,20 @@ class Client(BaseClient):
             'content-type': 'application/json'
         }
 
+    @property
+    def grantless_headers(self):
+        return {
+            'host': self.endpoint[8:],
+            'user-agent': self.user_agent,
+            'x-amz-access-token': self.grantless_auth.access_token,
+            'x-amz-date': datetime.utcnow().strftime('%Y%m%dT%H%M%SZ'),
+            'content-type': 'application/json'
+        }
+
+    @property
+    def session(self):
+        return self.session_pool.get(self.endpoint)
+
     @property
     def auth(self) -> AccessTokenResponse:
         return self._auth.get_auth()
@@ -97,7 +135,7 @@ class Client(BaseClient):
 
     def _request(self, path: str, *, data: dict = None, params: dict = None, headers=None,
                  add_marketplace=True, res_no_data: bool = False, bulk: bool = False,
-                 wrap_list: bool = False) -> ApiResponse:
+                 wrap_list: bool = False, raw: bool = None) -> Union[ApiResponse, RawResponse]:
         if params is None:
             params = {}
         if data is None:
@@ -105,36 +143,135 @@ class Client(BaseClient):
 
         # Note: The use of isinstance here is to support request schemas that are an array at the
         # top level, eg get_product_fees_estimate
-        self.method = params.pop('method', data.pop('method', 'GET') if isinstance(data, dict) else 'GET')
+        # The method is kept local, the client can be shared by threads
+        method = params.pop('method', data.pop('method', 'GET') if isinstance(data, dict) else 'GET')
+        self.method = method
+        raw = self._pop_raw(params, data, raw)
 
         if add_marketplace:
-            self._add_marketplaces(data if self.method in ('POST', 'PUT') else params)
-
-        res = request(self.method,
-                      self.endpoint + self._check_version(path),
-                      params=params,
-                      data=json.dumps(data) if data and self.method in ('POST', 'PUT', 'PATCH') else None,
-                      headers=headers or self.headers,
-                      timeout=self.timeout,
-                      proxies=self.proxies,
-                      verify=self.verify)
+            self._add_marketplaces(data if method in ('POST', 'PUT') else params, method)
+
+        if self.circuit_breaker:
+            circuit_key = self._circuit_key(path, method)
+            self.circuit_breaker.before(circuit_key)
+
+        try:
+            if self.rate_limiter:
+                rate_limit_key, rate, burst = self._rate_limit(path, method)
+                self.rate_limiter.acquire(rate_limit_key, rate, burst)
+
+            res = self.session.request(method,
+                                       self.endpoint + self._check_version(path),
+                                       params=params,
+                                       data=json_codec.dumps(data) if data and method in ('POST', 'PUT', 'PATCH') else None,
+                                       headers=headers or self.headers,
+                                       timeout=self.timeout,
+                                       proxies=self.proxies,
+                                       verify=self.verify)
+        except BaseException as e:
+            if self.circuit_breaker:
+                self._record_circuit_error(circuit_key, e)
+            raise
         self.res = res
-        
-        return self._check_response(res, res_no_data, bulk, wrap_list)
+        if self.rate_limiter:
+            self._update_rate_limit(rate_limit_key, res, burst)
+        if self.circuit_breaker:
+            self.circuit_breaker.record(circuit_key, res.status_code >= 500)
+
+        if raw:
+            return self._raw_response(res)
+        return self._check_response(res, res_no_data, bulk, wrap_list, method)
+
+    def rate_limit_key(self, method: str, path: str):
+        """
+        The key the rate limiter uses for an operation: (selling partner, region, method, path template)
+        """
+        seller = hashlib.md5((self._auth.cred.refresh_token or '__grantless__').encode('utf-8')).hexdigest()
+        return seller, self.region, method, self._check_version(path)
+
+    def _rate_limit(self, path, method=None):
+        operation = current_operation()
+        if operation is None:
+            return self.rate_limit_key(method or self.method, path), None, None
+        return self.rate_limit_key(operation.method, operation.path), operation.rate, operation.burst
+
+    def restricted_data_token_key(self, method: str, path: str, data_elements: list = None) -> str:
+        """
+        The key restricted data tokens are cached under: (selling partner, region, method, path, dataElements)
+        """
+        key = json.dumps([self._auth.cred.refresh_token or '__grantless__', self.region, method, path,
+                          sorted(data_elements or [])])
+        return 'rdt_' + hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    def _cache_restricted_data_token(self, cache_key: str, token: dict):
+        ttl = int(token.get('expiresIn') or 3600) - RDT_EXPIRY_MARGIN
+        if ttl > 0:
+            self.rdt_cache.set(cache_key, token, ttl)
+
+    def circuit_breaker_key(self, method: str, path: str):
+        """
+        The key the circuit breaker uses for an operation: (region, method, path template)
+        """
+        return self.region, method, self._check_version(path)
+
+    def _circuit_key(self, path, method=None):
+        operation = current_operation()
+        if operation is None:
+            return self.circuit_breaker_key(method or self.method, path)
+        return self.circuit_breaker_key(operation.method, operation.path)
+
+    def _record_circuit_error(self, circuit_key, error):
+        # Transport errors count as failures, a cancelled or interrupted call only frees its half-open slot
+        if isinstance(error, Exception):
+            self.circuit_breaker.record(circuit_key, True)
+        else:
+            self.circuit_breaker.release(circuit_key)
+
+    def _update_rate_limit(self, rate_limit_key, res, burst):
+        self.rate_limiter.update(rate_limit_key, res.headers.get('x-amzn-RateLimit-Limit'), burst)
+        if res.status_code == 429:
+            self.rate_limiter.throttled(rate_limit_key)
 
     def _check_response(self, res, res_no_data: bool = False, bulk: bool = False,
-                        wrap_list: bool = False) -> ApiResponse:
-        if (self.method == 'DELETE' or res_no_data) and 200 <= res.status_code < 300:
+                        wrap_list: bool = False, method: str = None) -> ApiResponse:
+        if ((method or self.method) == 'DELETE' or res_no_data) and 200 <= res.status_code < 300:
             try:
-                js = res.json() or {}
+                js = json_codec.loads_response(res) or {}
             except JSONDecodeError:
                 js = {'status_code': res.status_code}
         else:
             try:
-                js = res.json() or {}
+                js = json_codec.loads_response(res) or {}
             except JSONDecodeError:
                 js = {}
 
+        return self._parse_response(js, res, wrap_list)
+
+    @staticmethod
+    def _pop_raw(params, data, raw=None) -> bool:
+        # `raw` is passed with the operation's kwargs, like `method`, and must not be sent.
+        # Helpers that read the response themselves pass raw=False, which takes precedence.
+        raw_param = params.pop('raw', None)
+        raw_data = data.pop('raw', None) if isinstance(data, dict) else None
+        for value in (raw, raw_param, raw_data):
+            if value is not None:
+                return bool(value)
+        return False
+
+    def _raw_response(self, res) -> RawResponse:
+        if 200 <= res.status_code < 300:
+            return RawResponse(res.content, res.status_code, res.headers)
+        # Only failed responses are decoded, to raise the same exception as in the default mode
+        try:
+            js = json_codec.loads_response(res) or {}
+        except JSONDecodeError:
+            js = {}
+        if not isinstance(js, dict):
+            js = {}
+        exception = get_exception_for_code(res.status_code)
+        raise exception(js.get('errors') or ([js] if js else []), headers=res.headers)
+
+    def _parse_response(self, js, res, wrap_list: bool = False) -> ApiResponse:
         if isinstance(js, list):
             if wrap_list:
                 # Support responses that are an array at the top level, eg get_product_fees_estimate
@@ -150,13 +287,13 @@ class Client(BaseClient):
 
         show_donation_message()
 
-        return ApiResponse(**js, headers=res.headers)
+        return ApiResponse.from_json(js, res.headers, self.keep_response_headers)
 
-    def _add_marketplaces(self, data):
+    def _add_marketplaces(self, data, method: str = None):
         POST = ['marketplaceIds', 'MarketplaceIds']
         GET = ['MarketplaceId', 'MarketplaceIds', 'marketplace_ids', 'marketplaceIds']
 
-        if self.method == 'POST':
+        if (method or self.method) == 'POST':
             if any(x in data.keys() for x in POST):
                 return
             return data.update({k: self.marketplace_id if not k.endswith('s') else [self.marketplace_id] for k in POST})
@@ -165,15 +302,7 @@ class Client(BaseClient):
         return data.update({k: self.marketplace_id if not k.endswith('s') else [self.marketplace_id] for k in GET})
 
     def _request_grantless_operation(self, path: str, *, data: dict = None, params: dict = None):
-        headers = {
-            'host': self.endpoint[8:],
-            'user-agent': self.user_agent,
-            'x-amz-access-token': self.grantless_auth.access_token,
-            'x-amz-date': datetime.utcnow().strftime('%Y%m%dT%H%M%SZ'),
-            'content-type': 'application/json'
-        }
-
-        return self._request(path, data=data, params=params, headers=headers)
+        return self._request(path, data=data, params=params, headers=self.grantless_headers)
 
     def _check_version(self, path):
         if '<version>' not in path:
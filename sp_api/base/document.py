@@ -0,0 +1,157 @@
+import codecs
+import zlib
+from io import BytesIO, StringIO, TextIOBase
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+def document_encoding(encoding: Optional[str], character_code: Optional[str] = None) -> str:
+    """
+    Returns the character code used to decode a document
+
+    Args:
+        encoding: str | The encoding of the document's response, if any
+        character_code: str | The character code requested by the caller, takes precedence
+
+    Returns:
+        str
+    """
+    if character_code:
+        return character_code
+    character_code = encoding or 'iso-8859-1'
+    if character_code.lower() == 'windows-31j':
+        return 'cp932'
+    return character_code
+
+
+class DocumentDecoder:
+    """
+    Incrementally decompresses and decodes a document
+
+    Feed it the document's raw chunks in order, then call `flush` for the remainder. Memory use is bounded by
+    the chunk size. Like the non-streaming download, a document that is not gzip compressed despite
+    `compressionAlgorithm` being set is passed through unchanged, so only feed it the body of successful responses.
+
+    Args:
+        compressed: bool | If the document is gzip compressed
+        encoding: str | The character code to decode with, if None, chunks are returned as bytes
+        errors: str | The error handling scheme of the decoder
+    """
+
+    def __init__(self, compressed: bool = False, encoding: Optional[str] = None, errors: str = 'strict'):
+        self._decompressor = zlib.decompressobj(15 + 32) if compressed else None
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors) if encoding else None
+        self._started = False
+
+    def feed(self, chunk: bytes) -> Union[str, bytes]:
+        if self._decompressor is not None:
+            try:
+                chunk = self._decompressor.decompress(chunk)
+            except zlib.error:
+                if self._started:
+                    raise
+                self._decompressor = None
+        self._started = True
+        return self._decoder.decode(chunk) if self._decoder else chunk
+
+    def flush(self) -> Union[str, bytes]:
+        chunk = self._decompressor.flush() if self._decompressor is not None else b''
+        return self._decoder.decode(chunk, final=True) if self._decoder else chunk
+
+
+def decode_chunks(chunks: Iterable[bytes], decoder: DocumentDecoder, close=None) -> Iterator[Union[str, bytes]]:
+    """
+    Yields the decompressed and decoded content of raw document chunks, skipping empty ones
+
+    Args:
+        chunks: iterable of bytes | The raw chunks of the document
+        decoder: DocumentDecoder
+        close: callable | Called once the chunks are consumed or the generator is closed, e.g. to release the connection
+    """
+    try:
+        for chunk in chunks:
+            chunk = decoder.feed(chunk)
+            if chunk:
+                yield chunk
+        chunk = decoder.flush()
+        if chunk:
+            yield chunk
+    finally:
+        if close is not None:
+            close()
+
+
+async def adecode_chunks(chunks: AsyncIterable[bytes], decoder: DocumentDecoder,
+                         close=None) -> AsyncIterator[Union[str, bytes]]:
+    """
+    Asyncio variant of `decode_chunks`, close is awaited
+    """
+    try:
+        async for chunk in chunks:
+            chunk = decoder.feed(chunk)
+            if chunk:
+                yield chunk
+        chunk = decoder.flush()
+        if chunk:
+            yield chunk
+    finally:
+        if close is not None:
+            await close()
+
+
+class DocumentWriter:
+    """
+    Writes document chunks to a path or file like object
+
+    Paths are opened as text files with the document's encoding, text is encoded for binary files and
+    `BytesIO` / `StringIO` objects are rewound when the writer is closed.
+
+    Args:
+        file: str, BytesIO, StringIO or any file like object
+        encoding: str | The document's encoding
+    """
+
+    def __init__(self, file, encoding: str):
+        self.file = file
+        self.encoding = encoding
+        if isinstance(file, str):
+            self._fp = open(file, "w+", encoding=encoding)
+            self.binary = False
+        else:
+            self._fp = file
+            self.binary = isinstance(file, BytesIO) or (
+                    not isinstance(file, (StringIO, TextIOBase)) and 'b' in getattr(file, 'mode', ''))
+
+    def write(self, chunk: Union[str, bytes]):
+        if self.binary and isinstance(chunk, str):
+            chunk = chunk.encode(self.encoding)
+        elif not self.binary and isinstance(chunk, bytes):
+            chunk = chunk.decode(self.encoding)
+        self._fp.write(chunk)
+
+    def close(self):
+        if isinstance(self.file, str):
+            self._fp.close()
+        elif isinstance(self.file, (BytesIO, StringIO)):
+            self.file.seek(0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
+def write_chunks(file, chunks: Iterable[Union[str, bytes]], encoding: str):
+    """
+    Write document chunks to a path or file like object, without joining them
+
+    Args:
+        file: str, BytesIO, StringIO or any file like object
+        chunks: iterable of str (or bytes, if the document was not decoded)
+        encoding: str | The document's encoding
+    """
+    with DocumentWriter(file, encoding) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
@@ -1,10 +1,39 @@
 from io import BytesIO
+import contextvars
 import hashlib
 import base64
+import inspect
+import re
 import warnings
 import functools
+from typing import NamedTuple, Optional
 from urllib import parse
 
+# Files are hashed in chunks of this size
+MD5_CHUNK_SIZE = 1024 * 1024
+
+
+class Operation(NamedTuple):
+    """
+    The operation an endpoint method calls, as declared by `sp_endpoint`
+
+    rate and burst are taken from the usage plan in the method's docstring, if documented.
+    """
+    method: str
+    path: str
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+
+
+_current_operation = contextvars.ContextVar('sp_api_operation', default=None)
+
+
+def current_operation() -> Optional[Operation]:
+    """
+    Returns the `Operation` of the endpoint method currently being called, if any
+    """
+    return _current_operation.get()
+
 
 def fill_query_params(query, *args):
     return query.format(*[parse.quote(arg, safe='') for arg in args])
@@ -12,32 +41,82 @@ def fill_query_params(query, *args):
 
 def sp_endpoint(path, method='GET'):
     def decorator(function):
+        operation = Operation(method, path, *parse_usage_plan(function.__doc__))
+
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
             kwargs.update({
                 'path': path,
                 'method': method
             })
-            return function(*args, **kwargs)
-
+            token = _current_operation.set(operation)
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                _current_operation.reset(token)
+            if inspect.isawaitable(result):
+                return _await_operation(result, operation)
+            return result
+
+        wrapper.operation = operation
         return wrapper
 
     return decorator
 
 
-def create_md5(file):
+async def _await_operation(awaitable, operation: Operation):
+    # Coroutines run after the wrapper has returned, so the operation is set again while they are awaited
+    token = _current_operation.set(operation)
+    try:
+        return await awaitable
+    finally:
+        _current_operation.reset(token)
+
+
+def parse_usage_plan(doc: Optional[str]):
+    """
+    Parse the documented rate (requests per second) and burst from an endpoint's usage plan table
+
+    Args:
+        doc: str | The docstring of the endpoint method
+
+    Returns:
+        (rate, burst), (None, None) if the docstring has no usage plan
+    """
+    if not doc or 'Rate (requests per second)' not in doc:
+        return None, None
+    lines = doc.split('Rate (requests per second)', 1)[1].splitlines()[1:6]
+    for line in lines:
+        if not line.strip(' =|-\t'):
+            continue
+        numbers = re.findall(r'\d*\.?\d+', line)
+        if not numbers:
+            break
+        return float(numbers[0]), int(float(numbers[1])) if len(numbers) > 1 else 1
+    return None, None
+
+
+def create_md5(file, chunk_size: int = MD5_CHUNK_SIZE):
+    """
+    Returns the base64 encoded MD5 of a file path, file like object or bytes like object, read in chunks of chunk_size
+    """
     hash_md5 = hashlib.md5()
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        view = memoryview(file).cast('B')
+        for start in range(0, len(view), chunk_size):
+            hash_md5.update(view[start:start + chunk_size])
+        return base64.b64encode(hash_md5.digest()).decode()
     if isinstance(file, BytesIO):
-        for chunk in iter(lambda: file.read(4096), b''):
+        for chunk in iter(lambda: file.read(chunk_size), b''):
             hash_md5.update(chunk)
         file.seek(0)
         return base64.b64encode(hash_md5.digest()).decode()
     if isinstance(file, str):
         with open(file, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b''):
+            for chunk in iter(lambda: f.read(chunk_size), b''):
                 hash_md5.update(chunk)
         return base64.b64encode(hash_md5.digest()).decode()
-    for chunk in iter(lambda: file.read(4096), b''):
+    for chunk in iter(lambda: file.read(chunk_size), b''):
         hash_md5.update(chunk)
     return base64.b64encode(hash_md5.digest()).decode()
 
@@ -0,0 +1,98 @@
+import json
+import os
+from typing import Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec:
+    """
+    Encodes and decodes the json bodies the library sends and receives, using the `json` module of the standard library
+    """
+    name = 'json'
+
+    def dumps(self, obj) -> Union[str, bytes]:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Encodes and decodes json with `orjson`, several times faster than the standard library on large bodies
+
+    Decode errors are `orjson.JSONDecodeError`, a subclass of `json.JSONDecodeError`.
+    Requires orjson: `pip install python-amazon-sp-api[orjson]`
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires orjson. Install it with `pip install python-amazon-sp-api[orjson]`')
+
+    def dumps(self, obj) -> bytes:
+        # Like the standard library, accept dict keys that are not strings
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[str, bytes]):
+        return orjson.loads(data)
+
+
+_codecs = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def _default_codec() -> JsonCodec:
+    name = os.environ.get('SP_API_JSON_CODEC')
+    if name:
+        return _codecs[name]()
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+codec = _default_codec()
+
+
+def get_codec() -> JsonCodec:
+    return codec
+
+
+def set_codec(new_codec: Union[str, JsonCodec]):
+    """
+    Set the codec used for all json bodies
+
+    Examples:
+        literal blocks::
+
+            set_codec('json')  # use the standard library even if orjson is installed
+
+    Args:
+        new_codec: str or JsonCodec | 'json', 'orjson' or a codec instance.
+                   Defaults to `SP_API_JSON_CODEC`, or orjson if installed.
+    """
+    global codec
+    codec = _codecs[new_codec]() if isinstance(new_codec, str) else new_codec
+
+
+def dumps(obj) -> Union[str, bytes]:
+    return codec.dumps(obj)
+
+
+def loads(data: Union[str, bytes]):
+    return codec.loads(data)
+
+
+def loads_response(res):
+    """
+    Decodes the json body of a requests or httpx response
+    """
+    content = getattr(res, 'content', None)
+    if not isinstance(content, (bytes, bytearray)):
+        # e.g. streamed or fake responses, let them decode themselves
+        return res.json()
+    return codec.loads(content)
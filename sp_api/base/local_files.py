@@ -0,0 +1,43 @@
+import json
+import os
+import stat
+import tempfile
+
+
+def private_temp_directory(name: str) -> str:
+    """
+    Returns the directory `name` in the temp dir, created if needed, once it is checked that only the current user
+    can access it
+
+    The temp dir is shared by all users, another user could create the directory first to read or replace the
+    files stored in it.
+
+    Raises:
+        PermissionError: if the directory is not owned by the current user, or has a mode other than 0700
+    """
+    path = os.path.join(tempfile.gettempdir(), name)
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    # Windows has no file owners, its temp dir is private to the user
+    if hasattr(os, 'getuid') and (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+                                  or stat.S_IMODE(st.st_mode) != 0o700):
+        raise PermissionError('%s must be a directory owned by the current user with mode 0700, '
+                              'or pass a directory explicitly' % path)
+    return path
+
+
+def write_json(path: str, value):
+    """
+    Writes value to path as json, atomically: readers see either the previous file or the new one
+
+    The file is only readable by the current user.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.%s.' % name)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,169 @@
+import sys
+
+
+class Nested:
+    """
+    A field holding another model, or a list of models, parsed from the raw value on first access
+
+    Args:
+        model: Model | The model of the value
+        many: bool | If True, the value is a list of models, returned as tuple
+    """
+
+    def __init__(self, model, many: bool = False):
+        self.model = model
+        self.many = many
+        self.name = None
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        # Raw values are dicts and lists, parsed values are models and tuples
+        if isinstance(value, dict):
+            value = self.model.from_dict(value)
+            setattr(instance, self.slot, value)
+        elif isinstance(value, list):
+            value = tuple(self.model.from_dict(v) for v in value)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+    def raw(self, instance):
+        """
+        Returns the value of the field as in the response
+        """
+        value = getattr(instance, self.slot)
+        if isinstance(value, Model):
+            return value.to_dict()
+        if isinstance(value, tuple):
+            return [v.to_dict() for v in value]
+        return value
+
+
+def _annotations(namespace):
+    annotations = namespace.get('__annotations__')
+    if annotations is None and '__annotate__' in namespace:
+        # Python 3.14 evaluates annotations lazily
+        annotations = namespace['__annotate__'](1)
+    return annotations or {}
+
+
+class _ModelMeta(type):
+
+    def __new__(mcs, name, bases, namespace):
+        annotations = _annotations(namespace)
+        fields = tuple(field for field in annotations if not field.startswith('_'))
+        namespace['__slots__'] = tuple(namespace.get('__slots__', ())) + tuple(
+            '_' + field if isinstance(namespace.get(field), Nested) else field for field in fields
+        )
+        cls = super().__new__(mcs, name, bases, namespace)
+        inherited = getattr(cls, '_fields', ())
+        values = tuple((field, annotations[field]) for field in fields
+                       if isinstance(annotations[field], type) and issubclass(annotations[field], Model))
+        cls._fields = inherited + fields
+        cls._field_set = frozenset(cls._fields)
+        cls._values = getattr(cls, '_values', ()) + values
+        return cls
+
+
+class Model(metaclass=_ModelMeta):
+    """
+    Base class of typed, slotted models of API payloads
+
+    Fields are declared with annotations, like dataclasses, and stored in slots instead of a dict. Values of fields
+    annotated with another model, e.g. Money or Address, are small and parsed right away, lists of models are declared
+    with `Nested` and parsed on first access. Keys of the payload that are not declared as field are kept and can be
+    accessed as attributes too. Fields listed in `_interned` hold one of a few values, e.g. a status, and are interned
+    so all models share the same string.
+
+    Examples:
+        literal blocks::
+
+            class Money(Model):
+                CurrencyCode: str
+                Amount: str
+
+            Money.from_dict({'CurrencyCode': 'USD', 'Amount': '10.00'}).Amount  # '10.00'
+    """
+    __slots__ = ('_extra',)
+    _interned = frozenset()
+
+    def __init__(self, **kwargs):
+        self._load(kwargs)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """
+        Returns the model of a payload
+        """
+        model = cls.__new__(cls)
+        model._load(data)
+        return model
+
+    def _load(self, data):
+        cls = type(self)
+        get = data.get
+        for field in cls._fields:
+            setattr(self, field, get(field))
+        for field, model in cls._values:
+            value = get(field)
+            if isinstance(value, dict):
+                setattr(self, field, model.from_dict(value))
+        for field in cls._interned:
+            value = get(field)
+            if type(value) is str:
+                setattr(self, field, sys.intern(value))
+        if cls._field_set.issuperset(data):
+            self._extra = None
+        else:
+            self._extra = {key: value for key, value in data.items() if key not in cls._field_set}
+
+    def to_dict(self) -> dict:
+        """
+        Returns the payload of the model, with the fields that are not None
+        """
+        data = {}
+        for field, value in self._items():
+            data[field] = value.to_dict() if isinstance(value, Model) else value
+        return data
+
+    def _items(self):
+        cls = type(self)
+        for field in cls._fields:
+            attribute = getattr(cls, field, None)
+            value = attribute.raw(self) if isinstance(attribute, Nested) else getattr(self, field)
+            if value is not None:
+                yield field, value
+        if self._extra:
+            yield from self._extra.items()
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            extra = object.__getattribute__(self, '_extra')
+        except AttributeError:
+            extra = None
+        return extra.get(item) if extra else None
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self._load(state)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join('%s=%r' % item for item in self._items()))
@@ -0,0 +1,286 @@
+import abc
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Hashable, Optional
+
+from .sqlite_connections import SQLiteStore
+
+
+class TokenBucket:
+    """
+    Token bucket for a single operation
+
+    Tokens are refilled at `rate` per second up to `burst`. A reservation takes one token;
+    if none is left, the token count goes negative and the caller waits until it is refilled.
+
+    Args:
+        rate: float | Tokens added per second
+        burst: int | Maximum number of tokens
+        now: float | The current time
+    """
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Take a token and return the number of seconds to wait before it may be used
+        """
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0
+        return -self.tokens / self.rate
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimitBackend(abc.ABC):
+    """
+    Storage of the token buckets used by `RateLimiter`
+
+    Implementations must apply each method atomically, as it may be called from several threads (or processes) at once.
+    """
+    clock = staticmethod(time.monotonic)
+
+    @abc.abstractmethod
+    def reserve(self, key: Hashable, rate: Optional[float], burst: Optional[int], now: float) -> float:
+        """
+        Take a token from the bucket of `key`, creating it from rate and burst if needed,
+        and return the number of seconds to wait. Returns 0 if the bucket does not exist and rate is None.
+        """
+        pass
+
+    @abc.abstractmethod
+    def update(self, key: Hashable, rate: float, burst: Optional[int], now: float):
+        """
+        Set the rate of the bucket of `key`, creating it if needed
+        """
+        pass
+
+    @abc.abstractmethod
+    def throttled(self, key: Hashable, now: float):
+        """
+        Empty the bucket of `key`, if it exists
+        """
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Keeps the token buckets in memory, shared by all threads of the process
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key, rate, burst, now):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if not rate:
+                    return 0
+                bucket = self._buckets[key] = TokenBucket(rate, burst or 1, now)
+            return bucket.reserve(now)
+
+    def update(self, key, rate, burst, now):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = TokenBucket(rate, burst or 1, now)
+                return
+            bucket._refill(now)
+            bucket.rate = rate
+
+    def throttled(self, key, now):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket._refill(now)
+                bucket.tokens = min(bucket.tokens, 0)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend, SQLiteStore):
+    """
+    Keeps the token buckets in a SQLite database, so all processes on a host using the same file share the limits
+
+    Every operation runs in an immediate transaction, which locks the database file while the bucket is updated.
+    Call `close`, or use the backend as context manager, to close the connections of all threads.
+
+    Examples:
+        literal blocks::
+
+            with SQLiteRateLimitBackend('/var/run/sp-api/rate_limits.sqlite') as backend:
+                Orders(rate_limiter=RateLimiter(backend)).get_orders(CreatedAfter='TEST_CASE_200')
+
+    Args:
+        path: str | The database file, defaults to `SP_API_RATE_LIMIT_DB` or `sp_api_rate_limits.sqlite` in the temp dir
+        timeout: float | Seconds to wait for the lock of another process
+    """
+    # Wall clock time, so timestamps written by different processes are comparable
+    clock = staticmethod(time.time)
+
+    def __init__(self, path: str = None, timeout: float = 30):
+        if path is None:
+            import tempfile
+            path = os.environ.get('SP_API_RATE_LIMIT_DB',
+                                  os.path.join(tempfile.gettempdir(), 'sp_api_rate_limits.sqlite'))
+        super().__init__(path, timeout)
+        with self._transaction() as db:
+            db.execute('CREATE TABLE IF NOT EXISTS buckets '
+                       '(key TEXT PRIMARY KEY, rate REAL, burst INTEGER, tokens REAL, updated REAL)')
+
+    def reserve(self, key, rate, burst, now):
+        with self._transaction() as db:
+            bucket = self._load(db, key)
+            if bucket is None:
+                if not rate:
+                    return 0
+                bucket = TokenBucket(rate, burst or 1, now)
+            delay = bucket.reserve(now)
+            self._save(db, key, bucket)
+            return delay
+
+    def update(self, key, rate, burst, now):
+        with self._transaction() as db:
+            bucket = self._load(db, key)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst or 1, now)
+            else:
+                bucket._refill(now)
+                bucket.rate = rate
+            self._save(db, key, bucket)
+
+    def throttled(self, key, now):
+        with self._transaction() as db:
+            bucket = self._load(db, key)
+            if bucket is not None:
+                bucket._refill(now)
+                bucket.tokens = min(bucket.tokens, 0)
+                self._save(db, key, bucket)
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, default=str)
+
+    def _load(self, db, key) -> Optional[TokenBucket]:
+        row = db.execute('SELECT rate, burst, tokens, updated FROM buckets WHERE key = ?', (self._key(key),)).fetchone()
+        if row is None:
+            return None
+        bucket = TokenBucket(row[0], row[1], row[3])
+        bucket.tokens = row[2]
+        return bucket
+
+    def _save(self, db, key, bucket: TokenBucket):
+        db.execute('INSERT OR REPLACE INTO buckets (key, rate, burst, tokens, updated) VALUES (?, ?, ?, ?, ?)',
+                   (self._key(key), bucket.rate, bucket.burst, bucket.tokens, bucket.updated))
+
+    def _transaction(self):
+        return _Transaction(self._connection())
+
+
+class _Transaction:
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute('BEGIN IMMEDIATE')
+        return self.connection
+
+    def __exit__(self, exc_type, *args):
+        self.connection.execute('ROLLBACK' if exc_type else 'COMMIT')
+
+
+class RateLimiter:
+    """
+    Client side rate limiting of SP-API calls
+
+    Keeps a token bucket per key, where a key is made of the selling partner, region and operation
+    (see `Client.rate_limit_key`). Buckets are seeded with the usage plan documented on the endpoint method and
+    updated with the rate Amazon reports in the `x-amzn-RateLimit-Limit` header.
+    Operations without a known rate are not limited until their first response arrives.
+
+    Pass the same instance to all clients that should share the limits. The buckets are kept in memory by default,
+    use `SQLiteRateLimitBackend` to share them between processes.
+
+    Examples:
+        literal blocks::
+
+            limiter = RateLimiter()
+            Orders(rate_limiter=limiter).get_orders(CreatedAfter='TEST_CASE_200')
+
+    Args:
+        backend: RateLimitBackend | Where the buckets are stored, defaults to `MemoryRateLimitBackend`
+        clock: callable | Returns the current time in seconds, defaults to the backend's clock
+    """
+
+    def __init__(self, backend: RateLimitBackend = None, clock=None):
+        self.backend = backend or MemoryRateLimitBackend()
+        self.clock = clock or self.backend.clock
+
+    def reserve(self, key: Hashable, rate: Optional[float] = None, burst: Optional[int] = None) -> float:
+        """
+        reserve(self, key: Hashable, rate: Optional[float] = None, burst: Optional[int] = None) -> float
+
+        Take a token for `key` and return the number of seconds to wait before sending the request.
+
+        Args:
+            key: The bucket's key
+            rate: float | The documented rate, used to create the bucket on first use
+            burst: int | The documented burst, used to create the bucket on first use
+
+        Returns:
+            float
+        """
+        return self.backend.reserve(key, rate, burst, self.clock())
+
+    def acquire(self, key: Hashable, rate: Optional[float] = None, burst: Optional[int] = None) -> float:
+        """
+        Wait until a request for `key` may be sent, returns the time waited in seconds
+        """
+        delay = self.reserve(key, rate, burst)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, key: Hashable, rate: Optional[float] = None, burst: Optional[int] = None) -> float:
+        """
+        Asyncio variant of `acquire`
+        """
+        delay = self.reserve(key, rate, burst)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def update(self, key: Hashable, rate, burst: Optional[int] = None):
+        """
+        Update the rate of `key`, e.g. from the `x-amzn-RateLimit-Limit` header
+
+        Args:
+            key: The bucket's key
+            rate: float or str | The rate in requests per second, ignored if empty or invalid
+            burst: int | The burst, used if the bucket does not exist yet
+        """
+        try:
+            rate = float(rate)
+        except (TypeError, ValueError):
+            return
+        if rate <= 0:
+            return
+        self.backend.update(key, rate, burst, self.clock())
+
+    def throttled(self, key: Hashable):
+        """
+        Empty the bucket of `key` after Amazon throttled a request
+        """
+        self.backend.throttled(key, self.clock())
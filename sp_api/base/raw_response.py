@@ -0,0 +1,40 @@
+from . import json_codec
+
+
+class RawResponse:
+    """
+    Raw Response
+
+    The undecoded body of a successful response, returned instead of `ApiResponse` in raw mode.
+    Pass `raw=True` to a call to forward its payload without decoding it.
+
+    Examples:
+        literal blocks::
+
+            response = Orders().get_orders(CreatedAfter='TEST_CASE_200', raw=True)
+            producer.send('orders', response.content)
+
+    Args:
+        content: bytes | the response body as received
+        status_code: int | the HTTP status code
+        headers: any | headers returned by the API
+    """
+    __slots__ = ('content', 'status_code', 'headers')
+
+    def __init__(self, content: bytes, status_code: int, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers
+
+    @property
+    def rate_limit(self):
+        return self.headers.get("x-amzn-RateLimit-Limit") if self.headers is not None else None
+
+    def json(self):
+        """
+        Returns the decoded body
+        """
+        return json_codec.loads(self.content)
+
+    def __repr__(self):
+        return '<RawResponse [%s] %s bytes>' % (self.status_code, len(self.content))
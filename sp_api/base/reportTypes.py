@@ -120,3 +120,74 @@ class ReportType(str, Enum):
     GET_XML_VAT_INVOICE_DATA_REPORT = "GET_XML_VAT_INVOICE_DATA_REPORT"
     GET_B2B_PRODUCT_OPPORTUNITIES_RECOMMENDED_FOR_YOU = "GET_B2B_PRODUCT_OPPORTUNITIES_RECOMMENDED_FOR_YOU"
     GET_B2B_PRODUCT_OPPORTUNITIES_NOT_YET_ON_AMAZON = "GET_B2B_PRODUCT_OPPORTUNITIES_NOT_YET_ON_AMAZON"
+
+
+class ReportFormat(str, Enum):
+    TAB_DELIMITED = 'tsv'
+    CSV = 'csv'
+    JSON = 'json'
+    XML = 'xml'
+    PDF = 'pdf'
+
+
+JSON_REPORT_TYPES = frozenset({
+    ReportType.GET_V2_SELLER_PERFORMANCE_REPORT,
+    ReportType.GET_BRAND_ANALYTICS_SEARCH_TERMS_REPORT,
+    ReportType.GET_BRAND_ANALYTICS_MARKET_BASKET_REPORT,
+    ReportType.GET_BRAND_ANALYTICS_REPEAT_PURCHASE_REPORT,
+    ReportType.GET_BRAND_ANALYTICS_ALTERNATE_PURCHASE_REPORT,
+    ReportType.GET_BRAND_ANALYTICS_ITEM_COMPARISON_REPORT,
+    ReportType.GET_VENDOR_FORECASTING_REPORT,
+    ReportType.GET_VENDOR_SALES_DIAGNOSTIC_REPORT,
+    ReportType.GET_VENDOR_SALES_REPORT,
+    ReportType.GET_VENDOR_REAL_TIME_SALES_REPORT,
+    ReportType.GET_VENDOR_TRAFFIC_REPORT,
+    ReportType.GET_VENDOR_REAL_TIME_TRAFFIC_REPORT,
+    ReportType.GET_VENDOR_INVENTORY_HEALTH_AND_PLANNING_REPORT,
+    ReportType.GET_VENDOR_INVENTORY_REPORT,
+    ReportType.GET_VENDOR_REAL_TIME_INVENTORY_REPORT,
+    ReportType.GET_VENDOR_DEMAND_FORECAST_REPORT,
+    ReportType.GET_VENDOR_NET_PURE_PRODUCT_MARGIN_REPORT,
+    ReportType.GET_PROMOTION_PERFORMANCE_REPORT,
+    ReportType.GET_COUPON_PERFORMANCE_REPORT,
+    ReportType.GET_SALES_AND_TRAFFIC_REPORT,
+})
+
+XML_REPORT_TYPES = frozenset({
+    ReportType.GET_V1_SELLER_PERFORMANCE_REPORT,
+    ReportType.GET_ORDER_REPORT_DATA_INVOICING,
+    ReportType.GET_ORDER_REPORT_DATA_TAX,
+    ReportType.GET_ORDER_REPORT_DATA_SHIPPING,
+    ReportType.GET_PENDING_ORDERS_DATA,
+    *(report_type for report_type in ReportType if '_XML_' in report_type.value),
+})
+
+CSV_REPORT_TYPES = frozenset({
+    ReportType.GET_CSV_MFN_PRIME_RETURNS_REPORT,
+    ReportType.GET_GST_MTR_B2B_CUSTOM,
+    ReportType.GET_GST_MTR_B2C_CUSTOM,
+    ReportType.GET_GST_STR_ADHOC,
+    ReportType.SC_VAT_TAX_REPORT,
+    ReportType.GET_VAT_TRANSACTION_DATA,
+})
+
+
+def report_format(report_type) -> ReportFormat:
+    """
+    Returns the format of a report type's documents, reports not listed otherwise are tab-delimited flat files
+
+    Args:
+        report_type: ReportType or str
+
+    Returns:
+        ReportFormat
+    """
+    if report_type in JSON_REPORT_TYPES:
+        return ReportFormat.JSON
+    if report_type in XML_REPORT_TYPES:
+        return ReportFormat.XML
+    if report_type in CSV_REPORT_TYPES:
+        return ReportFormat.CSV
+    if report_type == ReportType.GET_EASYSHIP_DOCUMENTS:
+        return ReportFormat.PDF
+    return ReportFormat.TAB_DELIMITED
@@ -0,0 +1,110 @@
+import os
+import threading
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    Connection-pooled transport shared by all clients
+
+    Keeps one `requests.Session` per endpoint host, so consecutive calls against
+    `sellingpartnerapi-*.amazon.com` (or `api.amazon.com`) reuse open TCP+TLS connections
+    instead of performing a new handshake for every request.
+
+    Examples:
+        literal blocks::
+
+            pool = SessionPool(pool_maxsize=50, max_retries=Retry(total=3, connect=3, read=False, status=False))
+            orders = Orders(session_pool=pool)
+            reports = Reports(session_pool=pool)
+
+    Args:
+        pool_connections: int | The number of urllib3 connection pools to cache per session
+        pool_maxsize: int | The maximum number of connections kept open per host
+        max_retries: int or urllib3.util.Retry | Retry configuration of the transport adapter
+        pool_block: bool | Block when no free connection is available instead of opening a new one
+        keep_alive: bool | If False, connections are closed after each request
+    """
+
+    def __init__(self,
+                 pool_connections: int = int(os.environ.get('SP_API_POOL_CONNECTIONS', 10)),
+                 pool_maxsize: int = int(os.environ.get('SP_API_POOL_MAXSIZE', 10)),
+                 max_retries=int(os.environ.get('SP_API_MAX_RETRIES', 0)),
+                 pool_block: bool = False,
+                 keep_alive: bool = True):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Session:
+        """
+        get(self, url: str) -> Session
+
+        Returns the session for the host of `url`, creating it on first use.
+
+        Args:
+            url: str | Any url or endpoint on the host, e.g. `https://sellingpartnerapi-na.amazon.com`
+
+        Returns:
+            Session
+        """
+        host = self._host(url)
+        session = self._sessions.get(host)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._sessions[host] = self._make_session()
+        return session
+
+    def close(self):
+        """
+        Close all sessions and release their connections
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def _make_session(self) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+            pool_block=self.pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    @staticmethod
+    def _host(url: str) -> str:
+        parts = urlsplit(url)
+        return '%s://%s' % (parts.scheme, parts.netloc)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
+default_session_pool = SessionPool()
+
+
+def get_session(url: str) -> Session:
+    """
+    Returns the pooled session of the shared default `SessionPool` for the host of `url`
+    """
+    return default_session_pool.get(url)
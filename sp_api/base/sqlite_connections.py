@@ -0,0 +1,95 @@
+import os
+import sqlite3
+import threading
+import weakref
+
+
+class _Holder:
+    # Lives in a thread local, so it is dropped, and its connection closed, when the thread ends
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.pid = os.getpid()
+        self._finalizer = weakref.finalize(self, _close, connection, self.pid)
+
+    def close(self):
+        self._finalizer()
+
+
+def _close(connection: sqlite3.Connection, pid: int):
+    # A connection inherited by a forked process belongs to the parent, only the parent closes it
+    if os.getpid() == pid:
+        connection.close()
+
+
+class SQLiteConnections:
+    """
+    Opens a sqlite connection per thread and process, on first use
+
+    sqlite connections must not be shared between threads, or inherited by forked processes. The connection of a
+    thread is closed when the thread ends, `close` closes the connections of all threads.
+
+    Args:
+        path: str | The database file
+        timeout: float | Seconds to wait for the lock of another connection
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._holders = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        holder = getattr(self._local, 'holder', None)
+        if holder is None or holder.pid != os.getpid() or not holder._finalizer.alive:
+            # Each connection is only used by its thread, but may be closed by another one
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None,
+                                         check_same_thread=False)
+            holder = self._local.holder = _Holder(connection)
+            with self._lock:
+                self._holders.add(holder)
+        return holder.connection
+
+    def close(self):
+        """
+        Closes the connections of all threads, they are opened again on next use
+        """
+        with self._lock:
+            holders = list(self._holders)
+        for holder in holders:
+            holder.close()
+
+
+class SQLiteStore:
+    """
+    Base of the stores keeping their data in a SQLite database
+
+    Each thread uses its own connection, closed when the thread ends. Call `close`, or use the store as context
+    manager, to close all of them.
+
+    Args:
+        path: str | The database file
+        timeout: float | Seconds to wait for the lock of another process
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self._connections = SQLiteConnections(path, timeout)
+
+    def close(self):
+        """
+        Closes the connections of all threads, they are opened again on next use
+        """
+        self._connections.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        return self._connections.get()
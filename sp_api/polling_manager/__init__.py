@@ -1,4 +1,6 @@
 from .manager import PollingManager
+from .sync import OrderSync
+from .watermark import WatermarkStore, FileWatermarkStore, SQLiteWatermarkStore
 
-__all__ = ["PollingManager"]
+__all__ = ["PollingManager", "OrderSync", "WatermarkStore", "FileWatermarkStore", "SQLiteWatermarkStore"]
 __version__ = "0.1.0"
\ No newline at end of file
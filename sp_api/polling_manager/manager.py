@@ -1,6 +1,8 @@
 from loguru import logger
 from sp_api.base import Marketplaces
-from .orders import fetch_all_orders, fetch_all_order_items, fetch_all_order_addresses
+from .orders import fetch_all_orders, fetch_all_order_items, fetch_all_order_addresses, \
+    fetch_order_attributes_concurrently, fetch_one_order_items, fetch_one_order_address
+from .sync import OrderSync
 
 class PollingManager:
     def __init__(self, credentials: dict, marketplace: Marketplaces=Marketplaces.US, logging_configs=None):
@@ -50,4 +52,31 @@ class PollingManager:
                 credentials=self.manager.credentials,
                 marketplace=self.manager.marketplace,
                 **kwargs
-            )
\ No newline at end of file
+            )
+
+        def fetch_order_items_concurrently(self, **kwargs):
+            # Fetch order items on a thread pool, returns (results, failures) keyed by AmazonOrderId
+            return fetch_order_attributes_concurrently(
+                credentials=self.manager.credentials,
+                marketplace=self.manager.marketplace,
+                fetch_attribute_func=fetch_one_order_items,
+                **kwargs
+            )
+
+        def fetch_order_addresses_concurrently(self, **kwargs):
+            # Fetch order addresses on a thread pool, returns (results, failures) keyed by AmazonOrderId
+            return fetch_order_attributes_concurrently(
+                credentials=self.manager.credentials,
+                marketplace=self.manager.marketplace,
+                fetch_attribute_func=fetch_one_order_address,
+                **kwargs
+            )
+
+        def sync_orders(self, store, **kwargs):
+            # Incremental sync of the orders changed since the last committed run, see OrderSync
+            return OrderSync(
+                credentials=self.manager.credentials,
+                store=store,
+                marketplace=self.manager.marketplace,
+                **kwargs
+            )
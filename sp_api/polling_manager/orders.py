@@ -1,7 +1,9 @@
-from typing import Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
 from loguru import logger
 from sp_api.util.handle_api_error import handle_api_error
-from sp_api.base import Marketplaces, ApiResponse
+from sp_api.base import Marketplaces, ApiResponse, RateLimiter
 from sp_api.api import Orders
 
 def refresh_client(credentials: dict, marketplace: Marketplaces) -> Orders:
@@ -152,7 +154,7 @@ def fetch_all_order_attributes(
         while should_continue:
             try:
                 response = fetch_attribute_func(order['AmazonOrderId'], orders_client, next_token)
-                print("Fetching order attribute for order:", order['AmazonOrderId'])
+                logger.debug("Fetched order attribute for order: {order_id}", order_id=order['AmazonOrderId'])
                 order_count += 1
                 all_order_attributes.append(response.payload)
                 next_token = response.next_token
@@ -179,11 +181,117 @@ def fetch_all_order_attributes(
             logger.error(f"{total_orders - order_count} orders left to fetch, {order_count/ total_orders}% finished ")
             break  # Exit the outer loop if the flag is set to false
         
-    print(f"Order fetching completed, total orders fetched: {order_count}")
+    logger.info("Order fetching completed, total orders fetched: {order_count}", order_count=order_count)
         
     return all_order_attributes
 
 
+def fetch_order_attributes_concurrently(
+        orders: list,
+        credentials: dict,
+        fetch_attribute_func: Callable,
+        marketplace: Marketplaces=Marketplaces.US,
+        max_workers: int=8,
+        rate_limiter: Optional[RateLimiter]=None,
+        max_attempts: int=5,
+        max_client_refreshes: int=3,
+        base_sleep_time: float=5,
+        progress: Optional[Callable[[int, int], None]]=None
+    ) -> Tuple[Dict[str, List[dict]], Dict[str, Exception]]:
+    """
+    Fetch order attributes for many orders at once, on a thread pool.
+
+    Each worker thread uses its own client, all clients share one rate limiter, so requests stay within the
+    usage plan of the operation. An order that fails after all retries is recorded as failure, the other orders
+    are still fetched.
+
+    Args:
+
+        orders (list): A list of AmazonOrderIds, or of orders that contain an AmazonOrderId.
+        credentials (dict): The credentials to use for the API client.
+        fetch_attribute_func (Callable): The function to fetch order attributes, e.g. fetch_one_order_items.
+        marketplace (Marketplaces): The marketplace to fetch orders from.
+        max_workers (int): The number of orders fetched at once. Default is 8.
+        rate_limiter (RateLimiter): The rate limiter shared by the workers. Default is a new RateLimiter.
+        max_attempts (int): The maximum number of attempts per request. Default is 5.
+        max_client_refreshes (int): The maximum number of times a worker's client can be refreshed. Default is 3.
+        base_sleep_time (float): The base sleep time in seconds. Default is 5.
+        progress (Callable): Called with the number of finished orders and the total after each order.
+
+    Returns:
+        Tuple[dict, dict]: The payloads of all pages keyed by AmazonOrderId, and the exception of each failed order
+        keyed by AmazonOrderId.
+
+    Examples:
+
+        results, failures = fetch_order_attributes_concurrently(
+            orders=orders,
+            credentials=credentials,
+            fetch_attribute_func=fetch_one_order_items,
+            max_workers=8,
+            progress=lambda done, total: logger.info(f"{done}/{total} orders fetched")
+        )
+
+    """
+    rate_limiter = rate_limiter or RateLimiter()
+    local = threading.local()
+
+    def make_client(credentials, marketplace):
+        return Orders(credentials=credentials, marketplace=marketplace, rate_limiter=rate_limiter)
+
+    def fetch(order_id):
+        if getattr(local, 'client', None) is None:
+            local.client = make_client(credentials, marketplace)
+        pages = []
+        next_token = None
+        attempt = 1
+        client_refresh = 0
+        while True:
+            try:
+                response = fetch_attribute_func(order_id, local.client, next_token)
+            except Exception as e:
+                should_continue, client_refresh, local.client = handle_api_error(
+                    e=e,
+                    api_client=local.client,
+                    attempt=attempt,
+                    max_attempts=max_attempts,
+                    base_sleep_time=base_sleep_time,
+                    backoff_base=4,
+                    client_refresh=client_refresh,
+                    max_client_refreshes=max_client_refreshes,
+                    credentials=credentials,
+                    marketplace=marketplace,
+                    refresh_client=make_client
+                )
+                if not should_continue:
+                    raise e
+                attempt += 1
+                continue
+            pages.append(response.payload)
+            next_token = response.next_token
+            if not next_token:
+                return pages
+
+    order_ids = [order if isinstance(order, str) else order['AmazonOrderId'] for order in orders]
+    results, failures = {}, {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, order_id): order_id for order_id in order_ids}
+        for done, future in enumerate(as_completed(futures), 1):
+            order_id = futures[future]
+            try:
+                results[order_id] = future.result()
+            except Exception as e:
+                failures[order_id] = e
+                logger.error("Failed to fetch order attributes for order: {order_id}: {error}",
+                             order_id=order_id, error=e)
+            if progress:
+                progress(done, len(order_ids))
+
+    logger.info("Order fetching completed, {fetched} orders fetched, {failed} failed",
+                fetched=len(results), failed=len(failures))
+    return results, failures
+
+
 def fetch_one_order_address(order_id: str, order_client: Orders, next_token: str) -> ApiResponse:
     """
     Fetch one order address from the API.
@@ -0,0 +1,139 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from sp_api.util.handle_api_error import handle_api_error
+from sp_api.base import Marketplaces
+from sp_api.api import Orders
+from .orders import refresh_client
+from .watermark import WatermarkStore
+
+
+class OrderSync:
+    """
+    Incremental order sync: yields the orders changed since the last committed run.
+
+    The watermark, the time up to which changes were processed, is stored per seller and marketplace.
+    Each run queries orders with `LastUpdatedAfter` set to the watermark minus `overlap`, because orders can show up
+    in the API a little after their LastUpdateDate, and `LastUpdatedBefore` set to 2 minutes ago, the latest time the
+    API accepts. `commit` stores that upper bound as new watermark, once all changes of the run were consumed.
+    Orders updated within the overlap can be yielded again by the next run, so processing should be idempotent.
+
+    Args:
+
+        credentials (dict): The credentials to use for the API client.
+        store (WatermarkStore): Where the watermarks are kept, e.g. FileWatermarkStore or SQLiteWatermarkStore.
+        marketplace (Marketplaces): The marketplace to sync. Default is US.
+        overlap (timedelta): How far before the watermark each run starts. Default is 5 minutes.
+        initial_lookback (timedelta): How far back the first run starts. Default is 1 day.
+        base_sleep_time (float): The base sleep time in seconds. Default is 5.
+        max_attempts (int): The maximum number of attempts per request. Default is 5.
+        backoff_base (float): The base for exponential backoff. Default is 4.
+        max_client_refreshes (int): The maximum number of times the client can be refreshed. Default is 3.
+        **kwargs: Additional keyword arguments to pass to get_orders, e.g. OrderStatuses.
+
+    Examples:
+
+        sync = OrderSync(credentials=credentials, store=SQLiteWatermarkStore('/var/lib/sp-api/watermarks.sqlite'))
+        for order in sync.changes():
+            upsert(order)
+        sync.commit()
+
+    """
+    clock = staticmethod(lambda: datetime.now(timezone.utc))
+
+    def __init__(
+            self,
+            credentials: dict,
+            store: WatermarkStore,
+            marketplace: Marketplaces=Marketplaces.US,
+            overlap: timedelta=timedelta(minutes=5),
+            initial_lookback: timedelta=timedelta(days=1),
+            base_sleep_time: float=5,
+            max_attempts: int=5,
+            backoff_base: float=4,
+            max_client_refreshes: int=3,
+            **kwargs
+        ):
+        self.credentials = credentials
+        self.store = store
+        self.marketplace = marketplace
+        self.overlap = overlap
+        self.initial_lookback = initial_lookback
+        self.base_sleep_time = base_sleep_time
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.max_client_refreshes = max_client_refreshes
+        self.kwargs = kwargs
+        self.client = Orders(credentials=credentials, marketplace=marketplace)
+        seller = hashlib.md5((self.client._auth.cred.refresh_token or '').encode('utf-8')).hexdigest()
+        self.key = '%s:%s' % (seller, marketplace.marketplace_id)
+        self._pending = None
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        value = self.store.get(self.key)
+        return parse_timestamp(value) if value else None
+
+    def changes(self) -> Iterator[dict]:
+        """
+        Yield the orders changed since the watermark, page by page
+        """
+        self._pending = None
+        before = self.clock() - timedelta(minutes=2)
+        watermark = self.watermark
+        after = watermark - self.overlap if watermark else before - self.initial_lookback
+        next_token = None
+        attempt = 1
+        client_refresh = 0
+
+        while True:
+            try:
+                response = self.client.get_orders(
+                    NextToken=next_token,
+                    LastUpdatedAfter=format_timestamp(after),
+                    LastUpdatedBefore=format_timestamp(before),
+                    **self.kwargs
+                )
+            except Exception as e:
+                should_continue, client_refresh, self.client = handle_api_error(
+                    e=e,
+                    api_client=self.client,
+                    attempt=attempt,
+                    max_attempts=self.max_attempts,
+                    base_sleep_time=self.base_sleep_time,
+                    backoff_base=self.backoff_base,
+                    client_refresh=client_refresh,
+                    max_client_refreshes=self.max_client_refreshes,
+                    credentials=self.credentials,
+                    marketplace=self.marketplace,
+                    refresh_client=refresh_client
+                )
+                if not should_continue:
+                    raise e
+                attempt += 1
+                continue
+
+            attempt = 1
+            yield from response.payload.get('Orders', [])
+            next_token = response.next_token
+            if not next_token:
+                break
+
+        self._pending = before
+
+    def commit(self):
+        """
+        Store the end of the last run as watermark, call after all changes were processed
+        """
+        if self._pending is None:
+            raise RuntimeError('All changes must be consumed before the watermark is committed')
+        self.store.set(self.key, format_timestamp(self._pending))
+        self._pending = None
+
+
+def format_timestamp(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
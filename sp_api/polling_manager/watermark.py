@@ -0,0 +1,77 @@
+import abc
+import json
+import os
+import tempfile
+from typing import Optional
+from urllib.parse import quote
+
+from sp_api.base.local_files import private_temp_directory, write_json
+from sp_api.base.sqlite_connections import SQLiteStore
+
+
+class WatermarkStore(abc.ABC):
+    """
+    Storage for the watermarks of `OrderSync`, the ISO 8601 timestamp up to which changes were processed
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the watermark of key, or None if no run was committed yet
+        """
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: str, value: str):
+        pass
+
+
+class FileWatermarkStore(WatermarkStore):
+    """
+    Keeps each watermark in a json file, written atomically
+
+    Args:
+        directory: str | Where watermarks are stored, defaults to `SP_API_WATERMARK_DIR` or `sp_api_watermarks`
+                   in the temp dir, which must be owned by the current user and have mode 0700
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = (directory or os.environ.get('SP_API_WATERMARK_DIR')
+                          or private_temp_directory('sp_api_watermarks'))
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)['watermark']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key, value):
+        write_json(self._path(key), {'watermark': value})
+
+    def _path(self, key):
+        return os.path.join(self.directory, quote(key, safe='') + '.json')
+
+
+class SQLiteWatermarkStore(WatermarkStore, SQLiteStore):
+    """
+    Keeps the watermarks in a SQLite database
+
+    Args:
+        path: str | The database file, defaults to `SP_API_WATERMARK_DB` or `sp_api_watermarks.sqlite` in the temp dir
+        timeout: float | Seconds to wait for the lock of another process
+    """
+
+    def __init__(self, path: str = None, timeout: float = 30):
+        super().__init__(path or os.environ.get('SP_API_WATERMARK_DB',
+                                                os.path.join(tempfile.gettempdir(), 'sp_api_watermarks.sqlite')),
+                         timeout)
+        self._connection().execute('CREATE TABLE IF NOT EXISTS watermarks (key TEXT PRIMARY KEY, watermark TEXT)')
+
+    def get(self, key):
+        row = self._connection().execute('SELECT watermark FROM watermarks WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key, value):
+        self._connection().execute('INSERT OR REPLACE INTO watermarks (key, watermark) VALUES (?, ?)', (key, value))
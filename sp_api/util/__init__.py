@@ -1,15 +1,26 @@
-from .retry import retry, sp_retry, throttle_retry
+from .retry import retry, sp_retry, throttle_retry, Retry, RetryState
 from .load_all_pages import load_all_pages
+from .checkpoint import Checkpoint, CheckpointStore, FileCheckpointStore, SQLiteCheckpointStore, \
+    ExpiredCheckpointException
 from .key_maker import KeyMaker
 from .load_date_bound import load_date_bound
+from .report_reader import ReportReader
 
 __all__ = [
     'retry',
     'sp_retry',
     'throttle_retry',
+    'Retry',
+    'RetryState',
     'load_all_pages',
+    'Checkpoint',
+    'CheckpointStore',
+    'FileCheckpointStore',
+    'SQLiteCheckpointStore',
+    'ExpiredCheckpointException',
     'KeyMaker',
     'load_date_bound',
+    'ReportReader',
     "backoff",
     "handle_api_error",
 ]
@@ -0,0 +1,151 @@
+import abc
+import json
+import os
+import tempfile
+import time
+from typing import Optional
+from urllib.parse import quote
+
+from sp_api.base.local_files import private_temp_directory, write_json
+from sp_api.base.sqlite_connections import SQLiteStore
+
+
+class ExpiredCheckpointException(Exception):
+    """
+    Raised when a scan would resume from a next token older than `token_ttl`, and `on_expired_token='raise'`
+    """
+
+    def __init__(self, checkpoint: 'Checkpoint'):
+        super().__init__('The next token of scan %s is %.0f seconds old'
+                         % (checkpoint.scan_id, time.time() - checkpoint.updated))
+        self.checkpoint = checkpoint
+
+
+class Checkpoint:
+    """
+    The progress of a scan: the parameters it was started with, and the next token of the last page processed
+
+    Args:
+        scan_id: str | The name of the scan
+        params: dict | The parameters of the first request, as json
+        next_token: str | The token of the next page
+        pages: int | The number of pages processed so far
+        updated: float | When the checkpoint was saved, as unix timestamp
+    """
+
+    def __init__(self, scan_id: str, params: dict, next_token: str, pages: int = 0, updated: float = None):
+        self.scan_id = scan_id
+        self.params = params
+        self.next_token = next_token
+        self.pages = pages
+        self.updated = time.time() if updated is None else updated
+
+    def to_dict(self) -> dict:
+        return {'scan_id': self.scan_id, 'params': self.params, 'next_token': self.next_token,
+                'pages': self.pages, 'updated': self.updated}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> 'Checkpoint':
+        return cls(d['scan_id'], d['params'], d['next_token'], d.get('pages', 0), d.get('updated'))
+
+    @staticmethod
+    def dump_params(params: dict) -> dict:
+        # Parameters are compared as json, datetimes and enums are stored as strings
+        return json.loads(json.dumps(params, sort_keys=True, default=str))
+
+
+class CheckpointStore(abc.ABC):
+    """
+    Storage for the checkpoints of `load_all_pages`
+
+    Implementations must be safe to use from several threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, scan_id: str) -> Optional[Checkpoint]:
+        """
+        Returns the checkpoint of scan_id, or None if there is none
+        """
+        pass
+
+    @abc.abstractmethod
+    def save(self, checkpoint: Checkpoint):
+        pass
+
+    @abc.abstractmethod
+    def delete(self, scan_id: str):
+        pass
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps each checkpoint in a json file, written atomically after every page
+
+    Examples:
+        literal blocks::
+
+            @load_all_pages(checkpoint=FileCheckpointStore('/var/lib/sp-api/checkpoints'))
+            def load_all_orders(**kwargs):
+                return Orders().get_orders(**kwargs)
+
+    Args:
+        directory: str | Where checkpoints are stored, defaults to `SP_API_CHECKPOINT_DIR` or `sp_api_checkpoints`
+                   in the temp dir, which must be owned by the current user and have mode 0700
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = (directory or os.environ.get('SP_API_CHECKPOINT_DIR')
+                          or private_temp_directory('sp_api_checkpoints'))
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def get(self, scan_id):
+        try:
+            with open(self._path(scan_id)) as f:
+                return Checkpoint.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, checkpoint):
+        write_json(self._path(checkpoint.scan_id), checkpoint.to_dict())
+
+    def delete(self, scan_id):
+        try:
+            os.unlink(self._path(scan_id))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, scan_id):
+        return os.path.join(self.directory, quote(scan_id, safe='') + '.json')
+
+
+class SQLiteCheckpointStore(CheckpointStore, SQLiteStore):
+    """
+    Keeps the checkpoints in a SQLite database, e.g. to keep the progress of many scans in one file
+
+    Args:
+        path: str | The database file, defaults to `SP_API_CHECKPOINT_DB` or `sp_api_checkpoints.sqlite` in the temp dir
+        timeout: float | Seconds to wait for the lock of another process
+    """
+
+    def __init__(self, path: str = None, timeout: float = 30):
+        super().__init__(path or os.environ.get('SP_API_CHECKPOINT_DB',
+                                                os.path.join(tempfile.gettempdir(), 'sp_api_checkpoints.sqlite')),
+                         timeout)
+        self._connection().execute('CREATE TABLE IF NOT EXISTS checkpoints (scan_id TEXT PRIMARY KEY, params TEXT, '
+                                   'next_token TEXT, pages INTEGER, updated REAL)')
+
+    def get(self, scan_id):
+        row = self._connection().execute('SELECT params, next_token, pages, updated FROM checkpoints '
+                                         'WHERE scan_id = ?', (scan_id,)).fetchone()
+        if row is None:
+            return None
+        return Checkpoint(scan_id, json.loads(row[0]), row[1], row[2], row[3])
+
+    def save(self, checkpoint):
+        self._connection().execute('INSERT OR REPLACE INTO checkpoints (scan_id, params, next_token, pages, updated) '
+                                   'VALUES (?, ?, ?, ?, ?)',
+                                   (checkpoint.scan_id, json.dumps(checkpoint.params), checkpoint.next_token,
+                                    checkpoint.pages, checkpoint.updated))
+
+    def delete(self, scan_id):
+        self._connection().execute('DELETE FROM checkpoints WHERE scan_id = ?', (scan_id,))
@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from typing import Iterable, Iterator
 
 
 class KeyMaker:
@@ -42,6 +44,21 @@ class KeyMaker:
         self.key_mapping = key_mapping
         self.deep = deep
 
+    @property
+    def key_mapping(self):
+        return self._key_mapping
+
+    @key_mapping.setter
+    def key_mapping(self, key_mapping):
+        self._key_mapping = key_mapping
+        # Reverse index of the mapping, the first entry a key matches wins
+        index = {}
+        for k, v in key_mapping.items():
+            for alias in ([v] if isinstance(v, str) else v):
+                index.setdefault(alias, k)
+            index.setdefault(k, k)
+        self._index = index
+
     def convert_keys(self, data: dict or list):
         """
         convert_keys(self, data: dict or list)
@@ -55,22 +72,68 @@ class KeyMaker:
         Returns:
             Transformed data
         """
-        if isinstance(data, list):
-            return [self.convert_keys(d) for d in data]
-        if not isinstance(data, dict):
+        if not isinstance(data, (list, dict)):
             return data
-        return {
-            self._map_to_key_mapping(k): self.convert_keys(v) if self.deep else v
-            for k, v in data.items()
-        }
+        index = self._index
+        deep = self.deep
+        result = [] if isinstance(data, list) else {}
+        # Converted iteratively, so deeply nested data does not hit the recursion limit
+        stack = [(data, result)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, list):
+                for value in source:
+                    if isinstance(value, (list, dict)):
+                        converted = [] if isinstance(value, list) else {}
+                        stack.append((value, converted))
+                        value = converted
+                    target.append(value)
+            else:
+                for key, value in source.items():
+                    if deep and isinstance(value, (list, dict)):
+                        converted = [] if isinstance(value, list) else {}
+                        stack.append((value, converted))
+                        value = converted
+                    mapped = index.get(key)
+                    target[_replace_dash(key) if mapped is None else mapped] = value
+        return result
+
+    def convert_iter(self, rows: Iterable) -> Iterator:
+        """
+        convert_iter(self, rows: Iterable)
+
+        Like `convert_keys` for each row, converting one row at a time, e.g. of a report read line by line
+
+        Examples:
+            literal blocks::
+
+                key_maker = KeyMaker(key_mapping)
+                for row in key_maker.convert_iter(csv.DictReader(report, delimiter='\\t')):
+                    ...
+
+        Args:
+            rows: iterable of dict or list
+
+        Returns:
+            Generator of transformed rows
+        """
+        convert_keys = self.convert_keys
+        for row in rows:
+            yield convert_keys(row)
 
     def _map_to_key_mapping(self, key):
-        for k, v in self.key_mapping.items():
-            if key in v or k == key:
-                return k
-        return self._replace_dash(key)
+        mapped = self._index.get(key)
+        if mapped is None:
+            return _replace_dash(key)
+        return mapped
 
     @staticmethod
     def _replace_dash(key):
-        return key[0].lower() + ''.join(
-            word.title() if i > 0 else word for i, word in enumerate(re.sub(r'[-\s]', '_', key[1:]).split('_')))
+        return _replace_dash(key)
+
+
+@lru_cache(maxsize=4096)
+def _replace_dash(key):
+    # Reports have the same few columns in every row, so the normalized keys are memoized
+    return key[0].lower() + ''.join(
+        word.title() if i > 0 else word for i, word in enumerate(re.sub(r'[-\s]', '_', key[1:]).split('_')))
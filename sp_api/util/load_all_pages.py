@@ -1,4 +1,9 @@
+import threading
 import time
+from queue import Full, Queue
+from typing import Iterator
+
+from .checkpoint import Checkpoint, CheckpointStore, ExpiredCheckpointException
 
 
 def make_sleep_time(rate_limit, use_rate_limit_header, throttle_by_seconds):
@@ -7,29 +12,153 @@ def make_sleep_time(rate_limit, use_rate_limit_header, throttle_by_seconds):
     return throttle_by_seconds
 
 
+_DONE = object()
+
+
+def prefetch(pages: Iterator, size: int = 1) -> Iterator:
+    """
+    Iterates pages in a background thread, fetching up to `size` pages ahead of the consumer
+
+    The next page is requested while the consumer still processes the current one. Exceptions are raised in the
+    consumer, once it reaches the page that failed. Closing the returned generator stops the background thread.
+
+    Args:
+        pages: iterator | e.g. a generator returned by a function decorated with `load_all_pages`
+        size: int | The maximum number of pages fetched ahead
+
+    Returns:
+        Iterator
+    """
+    queue = Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((None, e))
+        finally:
+            if hasattr(pages, 'close'):
+                pages.close()
+
+    thread = threading.Thread(target=produce, name='sp-api-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, error = queue.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        stop.set()
+
 
 def load_all_pages(throttle_by_seconds: float = 2, next_token_param='NextToken', use_rate_limit_header: bool = False,
-                   extras: dict = None):
+                   extras: dict = None, prefetch_pages: int = 0, checkpoint: CheckpointStore = None,
+                   token_ttl: float = None, on_expired_token: str = 'restart'):
     """
     Load all pages if a next token is returned
 
+    With a checkpoint store, pass `scan_id` to the decorated function to name the scan. After every page the consumer
+    processed, the next token is saved under that name; calling the function again with the same scan_id and
+    parameters resumes after the last saved page. A checkpoint saved with other parameters is discarded, and the
+    checkpoint is deleted once the last page was loaded.
+
+    Examples:
+        literal blocks::
+
+            @load_all_pages(checkpoint=FileCheckpointStore('/var/lib/sp-api/checkpoints'))
+            def load_all_orders(**kwargs):
+                return Orders().get_orders(**kwargs)
+
+            for page in load_all_orders(scan_id='orders-2024-01', CreatedAfter='2024-01-01T00:00:00Z'):
+                process(page)
+
     Args:
         throttle_by_seconds: float
         next_token_param: str | The param amazon expects to hold the next token
         use_rate_limit_header: if the function should try to use amazon's rate limit header
         extras: additional data to be sent with NextToken, e.g `dict(QueryType='NEXT_TOKEN')` for `FulfillmentInbound`
+        prefetch_pages: int | If set, the next pages are fetched in a background thread while the current page is
+                        processed, up to this many pages ahead. Throttling and the client's rate limiter still apply.
+                        Checkpoints are still saved by the consumer, only for the pages it processed.
+        checkpoint: CheckpointStore | Where the progress of named scans is saved, see `FileCheckpointStore`
+                    and `SQLiteCheckpointStore`
+        token_ttl: float | Saved next tokens older than this many seconds are treated as expired
+        on_expired_token: str | 'restart' starts an expired scan over from the first page, 'raise' raises
+                          `ExpiredCheckpointException`, or the error of a rejected token, and keeps the checkpoint.
+                          A token counts as expired if it is older than token_ttl or the first request with it
+                          fails with `SellingApiBadRequestException`
     Returns:
         Transforms the function in a generator, returning all pages
     """
     if not extras:
         extras = {}
+    if on_expired_token not in ('restart', 'raise'):
+        raise ValueError("on_expired_token must be 'restart' or 'raise'")
+
+    def resume(scan_id, params):
+        saved = checkpoint.get(scan_id)
+        if saved is None:
+            return None
+        if saved.params != params:
+            checkpoint.delete(scan_id)
+            return None
+        if token_ttl is not None and time.time() - saved.updated > token_ttl:
+            if on_expired_token == 'raise':
+                raise ExpiredCheckpointException(saved)
+            checkpoint.delete(scan_id)
+            return None
+        return saved
+
+    def record(progress):
+        if progress is None:
+            return
+        if progress.next_token:
+            checkpoint.save(progress)
+        else:
+            checkpoint.delete(progress.scan_id)
 
     def decorator(function):
-        def wrapper(*args, **kwargs):
+        def scan(*args, scan_id: str = None, **kwargs):
+            # Yields each page with the checkpoint to record once the consumer processed it
+            from sp_api.base import SellingApiBadRequestException
+
+            params = Checkpoint.dump_params(kwargs) if checkpoint is not None and scan_id else None
+            first_kwargs = dict(kwargs)
+            count = 0
+            saved = resume(scan_id, params) if params is not None else None
+            if saved:
+                kwargs.update({next_token_param: saved.next_token, **extras})
+                count = saved.pages
             done = False
             while not done:
-                res = function(*args, **kwargs)
-                yield res
+                try:
+                    res = function(*args, **kwargs)
+                except SellingApiBadRequestException:
+                    if not saved or on_expired_token == 'raise':
+                        raise
+                    # The saved token was rejected, start the scan over
+                    checkpoint.delete(scan_id)
+                    kwargs, count, saved = dict(first_kwargs), 0, None
+                    continue
+                saved = None
+                count += 1
+                yield res, Checkpoint(scan_id, params, res.next_token, count) if params is not None else None
                 if res.next_token:
                     sleep_time = make_sleep_time(res.rate_limit, use_rate_limit_header, throttle_by_seconds)
                     if sleep_time > 0:
@@ -38,6 +167,16 @@ def load_all_pages(throttle_by_seconds: float = 2, next_token_param='NextToken',
                 else:
                     done = True
 
+        def pages(scanned):
+            for res, progress in scanned:
+                yield res
+                record(progress)
+
+        def wrapper(*args, **kwargs):
+            if prefetch_pages > 0:
+                return pages(prefetch(scan(*args, **kwargs), prefetch_pages))
+            return pages(scan(*args, **kwargs))
+
         wrapper.__doc__ = function.__doc__
         return wrapper
 
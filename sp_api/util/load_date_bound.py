@@ -1,37 +1,109 @@
+import asyncio
 import datetime
+import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-def load_date_bound(interval_days: int = 30):
-    def make_end_date(s: datetime, e: datetime, i: int):
-        end_date = s + datetime.timedelta(days=i)
-        if end_date > e:
-            return e
-        return end_date
+def make_end_date(s: datetime, e: datetime, i: int):
+    end_date = s + datetime.timedelta(days=i)
+    if end_date > e:
+        return e
+    return end_date
 
-    def parse_if_needed(dt: datetime or str):
-        if isinstance(dt, datetime.datetime):
-            return dt
-        return datetime.datetime.fromisoformat(dt)
 
-    date_range = {}
+def parse_if_needed(dt: datetime or str):
+    if isinstance(dt, datetime.datetime):
+        return dt
+    return datetime.datetime.fromisoformat(dt)
+
+
+def make_windows(data_start_time, data_end_time, interval_days: int) -> list:
+    """
+    Splits the range from data_start_time to data_end_time into windows of at most interval_days
+
+    Returns:
+        list of (dataStartTime, dataEndTime) tuples
+    """
+    start, end = parse_if_needed(data_start_time), parse_if_needed(data_end_time)
+    windows = []
+    while start < end:
+        window_end = make_end_date(start, end, interval_days)
+        windows.append((start, window_end))
+        start = window_end
+    return windows
+
+
+def load_date_bound(interval_days: int = 30, max_workers: int = 0, ordered: bool = True):
+    """
+    Split the range from dataStartTime to dataEndTime into windows of interval_days and call the function once
+    per window
+
+    By default, windows are loaded one after the other. With max_workers, up to that many windows are loaded at once,
+    on a thread pool or, if the decorated function is a coroutine function, as asyncio tasks.
+
+    Examples:
+        literal blocks::
+
+            @load_date_bound(interval_days=30, max_workers=4)
+            def create_reports(**kwargs):
+                return Reports().create_report(reportType=ReportType.GET_SALES_AND_TRAFFIC_REPORT, **kwargs)
+
+            for res in create_reports(dataStartTime=datetime(2022, 1, 1), dataEndTime=datetime(2024, 1, 1)):
+                print(res.payload)
+
+    Args:
+        interval_days: int | The length of a window
+        max_workers: int | The number of windows loaded concurrently, 0 loads them sequentially
+        ordered: bool | Yield results in the order of the windows, if False, in the order they complete
+    Returns:
+        Transforms the function in a generator (or async generator) of the results of all windows
+    """
 
     def decorator(function):
-        def wrapper(*args, **kwargs):
-            date_range.update({
-                'dataStartTime': parse_if_needed(kwargs['dataStartTime']),
-                'dataEndTime': parse_if_needed(kwargs.get('dataEndTime', datetime.datetime.utcnow()))
-            })
-            kwargs.update({
-                'dataEndTime': make_end_date(date_range['dataStartTime'], date_range['dataEndTime'], interval_days)
-            })
-            while kwargs['dataStartTime'] < kwargs['dataEndTime']:
-                yield function(*args, **kwargs)
-                kwargs.update({
-                    'dataStartTime': parse_if_needed(kwargs['dataEndTime']),
-                    'dataEndTime': make_end_date(parse_if_needed(kwargs['dataEndTime']), date_range['dataEndTime'],
-                                                 interval_days)
-                })
+        def make_calls(kwargs):
+            windows = make_windows(kwargs['dataStartTime'],
+                                   kwargs.get('dataEndTime', datetime.datetime.utcnow()), interval_days)
+            calls = [{**kwargs, 'dataStartTime': start, 'dataEndTime': end} for start, end in windows]
+            if calls:
+                # The first window starts exactly as passed
+                calls[0]['dataStartTime'] = kwargs['dataStartTime']
+            return calls
+
+        def load_sequential(*args, **kwargs):
+            for call in make_calls(kwargs):
+                yield function(*args, **call)
+
+        def load_parallel(*args, **kwargs):
+            calls = make_calls(kwargs)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            futures = [executor.submit(function, *args, **call) for call in calls]
+            try:
+                for future in (futures if ordered else as_completed(futures)):
+                    yield future.result()
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        async def load_async(*args, **kwargs):
+            semaphore = asyncio.Semaphore(max_workers or 1)
+
+            async def run(call):
+                async with semaphore:
+                    return await function(*args, **call)
+
+            tasks = [asyncio.ensure_future(run(call)) for call in make_calls(kwargs)]
+            try:
+                for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
 
+        if inspect.iscoroutinefunction(function):
+            wrapper = load_async
+        elif max_workers:
+            wrapper = load_parallel
+        else:
+            wrapper = load_sequential
         wrapper.__doc__ = function.__doc__
         return wrapper
 
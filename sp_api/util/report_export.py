@@ -0,0 +1,438 @@
+import datetime
+import json
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterator, Optional
+
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from sp_api.base.reportTypes import ReportType
+
+DEFAULT_BATCH_SIZE = 65536
+
+_ORDER_HINTS = {
+    'purchase-date': 'timestamp',
+    'last-updated-date': 'timestamp',
+    'quantity': 'int64',
+    'item-price': 'decimal',
+    'item-tax': 'decimal',
+    'shipping-price': 'decimal',
+    'shipping-tax': 'decimal',
+    'gift-wrap-price': 'decimal',
+    'gift-wrap-tax': 'decimal',
+    'item-promotion-discount': 'decimal',
+    'ship-promotion-discount': 'decimal',
+}
+
+_LISTING_HINTS = {
+    'price': 'decimal',
+    'quantity': 'int64',
+    'open-date': 'timestamp',
+    'pending-quantity': 'int64',
+    'zshop-shipping-fee': 'decimal',
+}
+
+_INVENTORY_HINTS = {
+    'your-price': 'decimal',
+    'mfn-fulfillable-quantity': 'int64',
+    'afn-warehouse-quantity': 'int64',
+    'afn-fulfillable-quantity': 'int64',
+    'afn-unsellable-quantity': 'int64',
+    'afn-reserved-quantity': 'int64',
+    'afn-total-quantity': 'int64',
+    'per-unit-volume': 'float64',
+    'afn-inbound-working-quantity': 'int64',
+    'afn-inbound-shipped-quantity': 'int64',
+    'afn-inbound-receiving-quantity': 'int64',
+}
+
+_SETTLEMENT_HINTS = {
+    'settlement-start-date': 'timestamp',
+    'settlement-end-date': 'timestamp',
+    'deposit-date': 'timestamp',
+    'posted-date': 'timestamp',
+    'posted-date-time': 'timestamp',
+    'total-amount': 'decimal',
+    'amount': 'decimal',
+    'quantity-purchased': 'int64',
+}
+
+SCHEMA_HINTS: Dict[str, Dict[str, str]] = {
+    ReportType.GET_MERCHANT_LISTINGS_ALL_DATA: _LISTING_HINTS,
+    ReportType.GET_MERCHANT_LISTINGS_DATA: _LISTING_HINTS,
+    ReportType.GET_MERCHANT_LISTINGS_INACTIVE_DATA: _LISTING_HINTS,
+    ReportType.GET_FLAT_FILE_ALL_ORDERS_DATA_BY_ORDER_DATE_GENERAL: _ORDER_HINTS,
+    ReportType.GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_GENERAL: _ORDER_HINTS,
+    ReportType.GET_FLAT_FILE_ARCHIVED_ORDERS_DATA_BY_ORDER_DATE: _ORDER_HINTS,
+    ReportType.GET_FBA_MYI_ALL_INVENTORY_DATA: _INVENTORY_HINTS,
+    ReportType.GET_FBA_MYI_UNSUPPRESSED_INVENTORY_DATA: _INVENTORY_HINTS,
+    ReportType.GET_AFN_INVENTORY_DATA: {'Quantity Available': 'int64'},
+    ReportType.GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE: _SETTLEMENT_HINTS,
+    ReportType.GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE_V2: _SETTLEMENT_HINTS,
+}
+"""
+Column types of common flat file reports, see `arrow_type` for the names of the types
+"""
+
+_TIMEZONES = {
+    'UTC': 0, 'GMT': 0, 'Z': 0,
+    'PST': -8, 'PDT': -7, 'MST': -7, 'MDT': -6, 'CST': -6, 'CDT': -5, 'EST': -5, 'EDT': -4,
+    'BST': 1, 'CET': 1, 'CEST': 2, 'EET': 2, 'EEST': 3, 'IST': 5.5, 'JST': 9, 'AEST': 10, 'AEDT': 11,
+}
+
+_TIMESTAMP_FORMATS = ('%d.%m.%Y %H:%M:%S', '%d.%m.%Y %H:%M', '%d.%m.%Y', '%Y/%m/%d %H:%M:%S', '%Y/%m/%d')
+# Dates of reports not in ISO 8601, e.g. 05.03.2024 10:15:00 UTC in settlement reports of European marketplaces.
+# dd/mm/yyyy and mm/dd/yyyy can not be told apart, and are left to schema hints
+
+
+def _require_pyarrow():
+    if pyarrow is None:
+        raise ImportError('Exporting reports requires pyarrow. Install it with `pip install pyarrow`')
+
+
+def arrow_type(hint: str):
+    """
+    arrow_type(hint: str) -> pyarrow.DataType
+
+    Returns the arrow type of a schema hint: `string`, `int64`, `float64`, `bool`, `date`, `timestamp`
+    (ISO 8601, or dd.mm.yyyy and yyyy/mm/dd as used by some marketplaces, followed by an optional timezone
+    abbreviation; converted to UTC, values without timezone are taken as UTC), `decimal` (18 digits, 4 of them decimals)
+    or `decimal(precision, scale)`.
+
+    Args:
+        hint: str
+
+    Returns:
+        pyarrow.DataType
+    """
+    _require_pyarrow()
+    match = re.fullmatch(r'decimal\((\d+),\s*(\d+)\)', hint)
+    if match:
+        return pyarrow.decimal128(int(match.group(1)), int(match.group(2)))
+    types = {
+        'string': pyarrow.string(),
+        'int64': pyarrow.int64(),
+        'float64': pyarrow.float64(),
+        'bool': pyarrow.bool_(),
+        'date': pyarrow.date32(),
+        'timestamp': pyarrow.timestamp('s', tz='UTC'),
+        'decimal': pyarrow.decimal128(18, 4),
+    }
+    if hint not in types:
+        raise ValueError('Unknown schema hint %r' % hint)
+    return types[hint]
+
+
+def _decimal_separator(value: str) -> str:
+    # Guesses the separator of a number in the format of an unknown marketplace, e.g. 1,234.56 or 1.234,56
+    comma, dot = value.rfind(','), value.rfind('.')
+    if comma < 0:
+        return ',' if value.count('.') > 1 else '.'
+    if dot >= 0:
+        return ',' if comma > dot else '.'
+    if value.count(',') > 1:
+        return '.'
+    if len(value) - comma == 4:
+        raise ValueError('%r is ambiguous, pass decimal_separator' % value)
+    return ','
+
+
+def _parse_number(value: str, decimal_separator: Optional[str] = None) -> str:
+    decimal_separator = decimal_separator or _decimal_separator(value)
+    thousands_separator = ',' if decimal_separator == '.' else '.'
+    integer, separator, fraction = value.partition(decimal_separator)
+    if thousands_separator in fraction or decimal_separator in fraction:
+        raise ValueError('%r is not a number with the decimal separator %r' % (value, decimal_separator))
+    return integer.replace(thousands_separator, '') + ('.' + fraction if separator else '')
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for timestamp_format in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, timestamp_format)
+        except ValueError:
+            pass
+    raise ValueError('%r is not a date in a known format' % value)
+
+
+def _parse_timestamp(value: str) -> datetime.datetime:
+    try:
+        parsed = _parse_datetime(value)
+    except ValueError:
+        value, _, zone = value.rpartition(' ')
+        if zone not in _TIMEZONES:
+            raise
+        parsed = _parse_datetime(value).replace(
+            tzinfo=datetime.timezone(datetime.timedelta(hours=_TIMEZONES[zone])))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+_NUMBERS = {
+    'int64': int,
+    'float64': float,
+    'decimal': Decimal,
+}
+
+_PARSERS = {
+    'bool': lambda value: value.lower() in ('true', 'yes', 'y', '1'),
+    'date': lambda value: datetime.date.fromisoformat(value[:10]),
+    'timestamp': _parse_timestamp,
+}
+
+
+def _convert(values: list, hint: str, column: str, decimal_separator: Optional[str] = None):
+    data_type = arrow_type(hint)
+    if hint == 'string':
+        return pyarrow.array(values, type=data_type)
+    values = [value if value != '' else None for value in values]
+    kind = 'decimal' if hint.startswith('decimal') else hint
+    if kind in _NUMBERS:
+        # Arrow parses well formed numbers much faster than python, but takes a dot as decimal separator
+        if decimal_separator != ',':
+            try:
+                return pyarrow.compute.cast(pyarrow.array(values, type=pyarrow.string()), data_type)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError, pyarrow.ArrowTypeError):
+                pass
+        number = _NUMBERS[kind]
+
+        def parse(value):
+            return number(_parse_number(value, decimal_separator))
+    else:
+        parse = _PARSERS[hint]
+    try:
+        return pyarrow.array([parse(value) if isinstance(value, str) else value for value in values],
+                             type=data_type)
+    except (ValueError, InvalidOperation, pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+        raise ValueError('Column %r can not be converted to %s: %s' % (column, hint, e)) from e
+
+
+class RecordBatchBuilder:
+    """
+    Collects report rows into arrow record batches of batch_size rows
+
+    Columns of flat files are strings, unless a schema hint names their type. Hints for the report type
+    are taken from `SCHEMA_HINTS`, `schema_hints` adds to or overrides them. Columns typed by `SCHEMA_HINTS` whose
+    values of the first batch can not be converted, e.g. dates in an unknown format, stay strings. Columns typed by
+    `schema_hints`, and later batches, raise ValueError instead.
+    Rows of JSON reports are converted with the types inferred from the first batch. Keys without a value in the
+    first batch are strings, values of other types are stored JSON encoded. Keys that first appear in later batches
+    raise ValueError, pass a schema hint for them.
+
+    Numbers are parsed with `decimal_separator`, the other one of `.` and `,` separates thousands. By default the
+    separator is guessed per value, values like `1,234` are ambiguous and can not be converted.
+
+    Args:
+        reader: ReportReader | The reader the rows come from, used for the header and report type
+        batch_size: int | The number of rows per batch
+        schema_hints: dict | Column name to schema hint, see `arrow_type`
+        decimal_separator: str | `.` or `,`, the decimal separator of the report's marketplace
+    """
+
+    def __init__(self, reader, batch_size: int = DEFAULT_BATCH_SIZE, schema_hints: Optional[Dict[str, str]] = None,
+                 decimal_separator: Optional[str] = None):
+        _require_pyarrow()
+        if decimal_separator not in (None, '.', ','):
+            raise ValueError('decimal_separator must be . or ,')
+        self.reader = reader
+        self.batch_size = batch_size
+        self.schema_hints = {**SCHEMA_HINTS.get(reader.report_type, {}), **(schema_hints or {})}
+        self._explicit_hints = set(schema_hints or ())
+        self.decimal_separator = decimal_separator
+        self.schema = None
+        self.rows = 0
+        self._batch = []
+        self._json_columns = set()
+
+    def append(self, row):
+        """
+        Add a row, returns a record batch once batch_size rows were collected, else None
+        """
+        self._batch.append(row)
+        if len(self._batch) >= self.batch_size:
+            return self._build()
+        return None
+
+    def flush(self):
+        """
+        Returns a record batch of the remaining rows, or None. If no rows were added at all,
+        the batch of a flat file is empty, but has its columns.
+        """
+        if self._batch or (self.schema is None and self.reader.header):
+            return self._build()
+        return None
+
+    def _build(self):
+        rows, self._batch = self._batch, []
+        if rows and isinstance(rows[0], dict):
+            keys = dict.fromkeys(key for row in rows for key in row)
+            if self.schema is None:
+                columns = list(keys) + [column for column in self.schema_hints if column not in keys]
+            else:
+                columns = list(self.schema.names)
+                unknown = [key for key in keys if key not in self.schema.names]
+                if unknown:
+                    raise ValueError('Keys %s are not in the first batch, pass schema hints for them' % unknown)
+            values = [[row.get(column) for row in rows] for column in columns]
+        else:
+            columns = self.reader.header
+            width = len(columns)
+            rows = [row if len(row) == width else (tuple(row) + ('',) * width)[:width] for row in rows]
+            values = [list(column) for column in zip(*rows)] if rows else [[] for _ in columns]
+        arrays = []
+        for index, column in enumerate(columns):
+            hint = self.schema_hints.get(column)
+            if hint:
+                arrays.append(self._convert_hinted(values[index], hint, column))
+            elif self.schema is not None:
+                arrays.append(self._convert_inferred(values[index], column, self.schema.field(index).type))
+            else:
+                array = pyarrow.array(values[index]) if values[index] else pyarrow.array([], pyarrow.string())
+                if pyarrow.types.is_null(array.type):
+                    self._json_columns.add(column)
+                    array = array.cast(pyarrow.string())
+                arrays.append(array)
+        batch = pyarrow.RecordBatch.from_arrays(arrays, names=columns)
+        if self.schema is None:
+            self.schema = batch.schema
+        self.rows += batch.num_rows
+        return batch
+
+    def _convert_hinted(self, values, hint, column):
+        try:
+            return _convert(values, hint, column, self.decimal_separator)
+        except ValueError:
+            # The hints of the report type do not know the formats of every marketplace. Once the schema is set,
+            # the column can not become a string anymore
+            if column in self._explicit_hints or self.schema is not None:
+                raise
+            self.schema_hints[column] = 'string'
+            return _convert(values, 'string', column)
+
+    def _convert_inferred(self, values, column, data_type):
+        if column in self._json_columns:
+            values = [value if value is None or isinstance(value, str) else json.dumps(value)
+                      for value in values]
+        try:
+            return pyarrow.array(values, type=data_type)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+            raise ValueError('Column %r does not match the type %s of the first batch, pass a schema hint: %s'
+                             % (column, data_type, e)) from e
+
+
+def iter_record_batches(reader, batch_size: int = DEFAULT_BATCH_SIZE,
+                        schema_hints: Optional[Dict[str, str]] = None,
+                        decimal_separator: Optional[str] = None) -> Iterator:
+    """
+    iter_record_batches(reader, batch_size: int = DEFAULT_BATCH_SIZE, schema_hints: Optional[Dict[str, str]] = None, decimal_separator: Optional[str] = None) -> Iterator[pyarrow.RecordBatch]
+
+    Converts the rows of a `ReportReader` to arrow record batches, holding at most one batch in memory.
+
+    Args:
+        reader: ReportReader
+        batch_size: int | The number of rows per batch
+        schema_hints: dict | Column name to schema hint, see `arrow_type`
+        decimal_separator: str | see `RecordBatchBuilder`
+
+    Returns:
+        Iterator[pyarrow.RecordBatch]
+    """  # noqa: E501
+    builder = RecordBatchBuilder(reader, batch_size, schema_hints, decimal_separator)
+    for row in reader:
+        batch = builder.append(row)
+        if batch is not None:
+            yield batch
+    batch = builder.flush()
+    if batch is not None:
+        yield batch
+
+
+class ArrowFileWriter:
+    """
+    Writes record batches to a Parquet or Feather file, opened with the schema of the first batch
+
+    Args:
+        file: str or binary file like object
+        format: str | `parquet` or `feather`
+        compression: str | The codec, defaults to snappy for Parquet and lz4 for Feather
+    """
+
+    def __init__(self, file, format: str = 'parquet', compression: Optional[str] = None):
+        _require_pyarrow()
+        if format not in ('parquet', 'feather'):
+            raise ValueError('format must be parquet or feather')
+        self.file = file
+        self.format = format
+        self.compression = compression
+        self.rows = 0
+        self._writer = None
+
+    def write(self, batch):
+        if self._writer is None:
+            if self.format == 'parquet':
+                self._writer = pyarrow.parquet.ParquetWriter(self.file, batch.schema,
+                                                             compression=self.compression or 'snappy')
+            else:
+                # Feather V2 is the arrow IPC file format
+                options = pyarrow.ipc.IpcWriteOptions(compression=self.compression or 'lz4')
+                self._writer = pyarrow.ipc.new_file(self.file, batch.schema, options=options)
+        if self.format == 'parquet':
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+        self.rows += batch.num_rows
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+
+def export_report(reader, file, format: str = 'parquet', batch_size: int = DEFAULT_BATCH_SIZE,
+                  schema_hints: Optional[Dict[str, str]] = None, compression: Optional[str] = None,
+                  decimal_separator: Optional[str] = None) -> int:
+    """
+    export_report(reader, file, format: str = 'parquet', batch_size: int = DEFAULT_BATCH_SIZE, schema_hints: Optional[Dict[str, str]] = None, compression: Optional[str] = None, decimal_separator: Optional[str] = None) -> int
+
+    Writes the rows of a `ReportReader` to a Parquet or Feather file, batch by batch.
+
+    Examples:
+        literal blocks::
+
+            reader = ReportReader.from_file('listings.txt.gz', report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA,
+                                            row_type=tuple)
+            export_report(reader, 'listings.parquet', schema_hints={'item-is-marketplace': 'string'})
+
+    Args:
+        reader: ReportReader | Readers of flat files should use row_type=tuple
+        file: str or binary file like object
+        format: str | `parquet` or `feather`
+        batch_size: int | The number of rows per batch
+        schema_hints: dict | Column name to schema hint, see `arrow_type`
+        compression: str | see `ArrowFileWriter`
+        decimal_separator: str | `.` or `,`, see `RecordBatchBuilder`
+
+    Returns:
+        int | The number of rows written
+    """  # noqa: E501
+    with ArrowFileWriter(file, format, compression) as writer:
+        for batch in iter_record_batches(reader, batch_size, schema_hints, decimal_separator):
+            writer.write(batch)
+    return writer.rows
@@ -0,0 +1,293 @@
+import csv
+import json
+from typing import Iterable, List, Optional
+
+from sp_api.base.document import DEFAULT_CHUNK_SIZE, DocumentDecoder, decode_chunks
+from sp_api.base.reportTypes import ReportFormat, report_format
+
+
+class ReportReader:
+    """
+    Lazily parses the rows of a report document
+
+    Feed it the document's text chunks, e.g. from `Reports.iter_report_document`, and iterate over it;
+    only the rows of the current chunk are held in memory.
+
+    Tab-delimited and CSV flat files use their first line as header, rows are yielded as dicts mapping the header
+    to the row's values, or as tuples in the order of `header` if row_type is tuple.
+    JSON reports yield the objects of their top level arrays, e.g. `salesAndTrafficByAsin`,
+    other top level values like `reportSpecification` are collected in `metadata`.
+
+    The format is derived from the report type, if neither is passed, it is detected from the document.
+
+    Examples:
+        literal blocks::
+
+            reader = ReportReader(Reports().iter_report_document(document_id),
+                                  report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA)
+            for row in reader:
+                print(row['seller-sku'], row['price'])
+
+            reader = ReportReader.from_file('listings.txt.gz', row_type=tuple)
+
+    Args:
+        chunks: iterable or async iterable of str | The document's text chunks
+        report_type: ReportType or str | The type of the report
+        format: ReportFormat or str | The format of the document, takes precedence over report_type
+        row_type: dict or tuple | The type of the rows of flat files
+        json_key: str | Only yield the rows of this top level array of a JSON report
+    """
+
+    def __init__(self, chunks=None, report_type=None, format=None, row_type: type = dict,
+                 json_key: Optional[str] = None):
+        if row_type not in (dict, tuple):
+            raise ValueError('row_type must be dict or tuple')
+        self.chunks = chunks
+        self.report_type = report_type
+        self.format = ReportFormat(format) if format else report_format(report_type) if report_type else None
+        if self.format in (ReportFormat.XML, ReportFormat.PDF):
+            raise ValueError('%s reports can not be read row by row' % self.format.name)
+        self.row_type = row_type
+        self.json_key = json_key
+        self.metadata = {}
+        self._parser = None
+
+    @classmethod
+    def from_file(cls, file, encoding: str = 'utf-8', chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs):
+        """
+        from_file(cls, file, encoding: str = 'utf-8', chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs) -> ReportReader
+
+        Read a report document that was saved to disk, gzip compressed or not.
+
+        Args:
+            file: str or binary file like object
+            encoding: str | The document's character code
+            chunk_size: int | The size of the chunks read from the file, in bytes
+            **kwargs: see `ReportReader`
+
+        Returns:
+            ReportReader
+        """
+        return cls(_read_file(file, encoding, chunk_size), **kwargs)
+
+    @property
+    def header(self) -> Optional[List[str]]:
+        """
+        The columns of a flat file, available once the first row was read
+        """
+        return getattr(self._parser, 'header', None)
+
+    def feed(self, chunk: str) -> list:
+        """
+        Parse the next chunk of the document and return the rows completed by it
+        """
+        if not chunk:
+            return []
+        if self._parser is None:
+            self._parser = self._make_parser(chunk)
+        return self._parser.feed(chunk)
+
+    def close(self) -> list:
+        """
+        Return the rows left once the document ends
+        """
+        if self._parser is None:
+            return []
+        return self._parser.close()
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    async def __aiter__(self):
+        async for chunk in self.chunks:
+            for row in self.feed(chunk):
+                yield row
+        for row in self.close():
+            yield row
+
+    def _make_parser(self, chunk: str):
+        chunk = chunk.lstrip('\ufeff \t\r\n')
+        if self.format is None:
+            self.format = ReportFormat.JSON if chunk[:1] in ('{', '[') else None
+        if self.format == ReportFormat.JSON:
+            return _JsonParser(self.json_key, self.metadata)
+        return _DelimitedParser(self.format, self.row_type)
+
+
+class _DelimitedParser:
+    def __init__(self, format: Optional[ReportFormat], row_type: type):
+        self.format = format
+        self.row_type = row_type
+        self.header = None
+        self._buffer = ''
+        self._record = ''
+
+    def feed(self, chunk: str) -> list:
+        lines = (self._buffer + chunk).split('\n')
+        self._buffer = lines.pop()
+        return self._parse(lines)
+
+    def close(self) -> list:
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ''
+        rows = self._parse(lines)
+        if self._record:
+            rows.extend(self._parse_records([self._record]))
+            self._record = ''
+        return rows
+
+    def _parse(self, lines: List[str]) -> list:
+        if self.header is None:
+            while lines and not lines[0].strip('\ufeff\r'):
+                lines.pop(0)
+            if not lines:
+                return []
+            if self.format is None:
+                self.format = ReportFormat.TAB_DELIMITED if '\t' in lines[0] or ',' not in lines[0] \
+                    else ReportFormat.CSV
+        if self.format == ReportFormat.CSV:
+            lines = self._complete_records(lines)
+        rows = self._parse_records(lines)
+        if self.header is None and rows:
+            self.header = [column.lstrip('\ufeff') for column in rows.pop(0)]
+        if self.row_type is dict:
+            header = self.header
+            return [dict(zip(header, row)) for row in rows]
+        return [tuple(row) for row in rows]
+
+    def _parse_records(self, records: List[str]) -> List[List[str]]:
+        if self.format == ReportFormat.CSV:
+            return [row for row in csv.reader(records) if row]
+        # Amazon's tab-delimited files are not quoted, quotes are part of the values
+        return [record.rstrip('\r').split('\t') for record in records if record.rstrip('\r')]
+
+    def _complete_records(self, lines: List[str]) -> List[str]:
+        # A quoted CSV value may contain line breaks, a record is complete once its quotes are balanced
+        records = []
+        for line in lines:
+            record = self._record + line if self._record else line
+            if record.count('"') % 2:
+                self._record = record + '\n'
+            else:
+                self._record = ''
+                records.append(record)
+        return records
+
+
+_INCOMPLETE = object()
+
+
+class _JsonParser:
+    _whitespace = ' \t\r\n\ufeff'
+
+    def __init__(self, json_key: Optional[str], metadata: dict):
+        self.json_key = json_key
+        self.metadata = metadata
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'start'
+        self._key = None
+        self._keep = True
+
+    def feed(self, chunk: str) -> list:
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        rows = self._parse(final=True)
+        if self._state != 'end':
+            raise ValueError('Unexpected end of JSON report document')
+        return rows
+
+    def _parse(self, final: bool) -> list:
+        rows = []
+        while True:
+            char = self._next_char()
+            if char is None:
+                return rows
+            if self._state == 'start':
+                if char == '[':
+                    self._state, self._key = 'elements', None
+                elif char == '{':
+                    self._state = 'key'
+                else:
+                    raise ValueError('JSON report documents must be an object or an array')
+                self._pos += 1
+            elif self._state == 'key':
+                if char == ',':
+                    self._pos += 1
+                elif char == '}':
+                    self._pos += 1
+                    self._state = 'end'
+                else:
+                    key = self._decode(final, require_separator=False)
+                    if key is _INCOMPLETE:
+                        return rows
+                    self._key = key
+                    self._state = 'colon'
+            elif self._state == 'colon':
+                if char != ':':
+                    raise ValueError('Invalid JSON report document')
+                self._pos += 1
+                self._state = 'value'
+            elif self._state == 'value':
+                if char == '[':
+                    self._pos += 1
+                    self._state = 'elements'
+                    self._keep = self.json_key is None or self._key == self.json_key
+                    continue
+                value = self._decode(final)
+                if value is _INCOMPLETE:
+                    return rows
+                self.metadata[self._key] = value
+                self._state = 'key'
+            elif self._state == 'elements':
+                if char == ',':
+                    self._pos += 1
+                elif char == ']':
+                    self._pos += 1
+                    self._state = 'end' if self._key is None else 'key'
+                else:
+                    row = self._decode(final)
+                    if row is _INCOMPLETE:
+                        return rows
+                    if self._keep:
+                        rows.append(row)
+            else:
+                raise ValueError('Unexpected data after the end of the JSON report document')
+
+    def _next_char(self) -> Optional[str]:
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in self._whitespace:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _decode(self, final: bool, require_separator: bool = True):
+        # The position is left unchanged if the value is incomplete
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE
+        if end == len(self._buffer) and not final and require_separator:
+            # A number at the end of the buffer may continue in the next chunk
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+
+def _read_file(file, encoding: str, chunk_size: int) -> Iterable[str]:
+    if isinstance(file, str):
+        file = open(file, 'rb')
+        close = file.close
+    else:
+        close = None
+    chunks = iter(lambda: file.read(chunk_size), b'')
+    return decode_chunks(chunks, DocumentDecoder(True, encoding), close=close)
@@ -1,9 +1,171 @@
+import asyncio
+import functools
+import inspect
+import random
+import threading
 import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
 
 
-def retry(exception_classes=None, tries=10, delay=5, rate=1.3):
+class RetryState:
     """
-    retry(exception_classes=None, tries=10, delay=5, rate=1.3)
+    The state of a single call of a function decorated with `retry`
+
+    Args:
+        started: float | The time the call started, see `Retry.clock`
+    """
+
+    def __init__(self, started: float):
+        self.started = started
+        self.attempt = 1
+        self.delay = 0
+        self.total_delay = 0
+        self.exception = None
+        self.elapsed = 0
+
+
+class Retry:
+    """
+    Retry a call against an endpoint up to <tries> times
+
+    Each call keeps its own state, so decorated functions can be used from several threads (or asyncio tasks) at once.
+    Waits grow from delay by rate per attempt, up to max_delay, and are drawn uniformly from 0 to that value
+    ("full jitter") so concurrent callers do not retry in lockstep. A `Retry-After` header of the exception is
+    always honored, as is the pause between requests allowed by its `x-amzn-RateLimit-Limit` header.
+
+    Args:
+        exception_classes: tuple | The Exceptions to be caught
+        tries: int | How often the call is attempted in total
+        delay: float | The delay after the first error
+        rate: float | The rate to increment delay by
+        max_delay: float | The maximum delay between attempts
+        jitter: bool | Draw each delay from 0 to the backoff delay, if False the backoff delay is used as is
+        deadline: float | The time budget of a call in seconds, including all attempts and delays.
+                  The last exception is raised once the next delay would exceed it
+        on_retry: callable | Called with the `RetryState` before each delay, e.g. to count or log retries
+        on_giveup: callable | Called with the `RetryState` before the last exception is raised
+    """
+    sleep = staticmethod(time.sleep)
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, exception_classes=None, tries: int = 10, delay: float = 5, rate: float = 1.3,
+                 max_delay: Optional[float] = None, jitter: bool = True, deadline: Optional[float] = None,
+                 on_retry: Optional[Callable] = None, on_giveup: Optional[Callable] = None):
+        self.exception_classes = exception_classes or (Exception,)
+        self.tries = tries
+        self.delay = delay
+        self.rate = rate
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.on_retry = on_retry
+        self.on_giveup = on_giveup
+        self.statistics = {'calls': 0, 'retries': 0, 'giveups': 0}
+        self._lock = threading.Lock()
+
+    def __call__(self, function):
+        if inspect.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def wrapper(*args, **kwargs):
+                state = self._start()
+                while True:
+                    try:
+                        return await function(*args, **kwargs)
+                    except self.exception_classes as e:
+                        await asyncio.sleep(self._next_delay(state, e))
+        else:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                state = self._start()
+                while True:
+                    try:
+                        return function(*args, **kwargs)
+                    except self.exception_classes as e:
+                        self.sleep(self._next_delay(state, e))
+
+        wrapper.retry = self
+        return wrapper
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay after the given failed attempt, before the retry-after and rate limit headers are applied
+        """
+        delay = self.delay * self.rate ** (attempt - 1)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def _start(self) -> RetryState:
+        self._count('calls')
+        return RetryState(self.clock())
+
+    def _next_delay(self, state: RetryState, exception: Exception) -> float:
+        # Returns the delay before the next attempt, or raises the exception if the call gives up
+        state.exception = exception
+        state.elapsed = self.clock() - state.started
+        delay = self.backoff(state.attempt)
+        headers = getattr(exception, 'headers', None) or {}
+        delay = max(delay, retry_after(headers) or 0, rate_limit_delay(headers) or 0)
+        state.delay = delay
+        if state.attempt >= self.tries or (self.deadline is not None and state.elapsed + delay > self.deadline):
+            self._count('giveups')
+            if self.on_giveup:
+                self.on_giveup(state)
+            raise exception
+        self._count('retries')
+        if self.on_retry:
+            self.on_retry(state)
+        state.attempt += 1
+        state.total_delay += delay
+        return delay
+
+    def _count(self, key):
+        with self._lock:
+            self.statistics[key] += 1
+
+
+def retry_after(headers) -> Optional[float]:
+    """
+    Returns the seconds to wait according to a `Retry-After` header, in seconds or as HTTP date, or None
+    """
+    value = _get_header(headers, 'Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limit_delay(headers) -> Optional[float]:
+    """
+    Returns the pause between requests allowed by a `x-amzn-RateLimit-Limit` header, or None
+    """
+    try:
+        rate = float(_get_header(headers, 'x-amzn-RateLimit-Limit'))
+    except (TypeError, ValueError):
+        return None
+    return 1 / rate if rate > 0 else None
+
+
+def _get_header(headers, name):
+    value = headers.get(name)
+    if value is None and isinstance(headers, dict):
+        # plain dicts are case sensitive, unlike the headers of requests and httpx
+        value = next((v for k, v in headers.items() if k.lower() == name.lower()), None)
+    return value
+
+
+def retry(exception_classes=None, tries=10, delay=5, rate=1.3, **kwargs) -> Retry:
+    """
+    retry(exception_classes=None, tries=10, delay=5, rate=1.3, **kwargs)
 
     Retry a call against an endpoint <tries> time
 
@@ -13,46 +175,15 @@ def retry(exception_classes=None, tries=10, delay=5, rate=1.3):
         tries: int | How often the call should be retried
         delay: float | The delay after an error was caught
         rate: float | The rate to increment delay by
+        **kwargs: max_delay, jitter, deadline, on_retry, on_giveup, see `Retry`
 
     Returns:
 
     """
-    if exception_classes is None:
-        exception_classes = (Exception,)
-
-    tries_counter = {
-        'count': 1,
-        'last_delay': delay
-    }
-
-    def decorator(function):
-        def wrapper(*args, **kwargs):
-            try:
-                return function(*args, **kwargs)
-            except exception_classes as e:
-                if tries_counter.get('count') + 1 > tries:
-                    raise e
-
-                delay_now = delay if tries_counter.get('count') == 1 else tries_counter.get('last_delay') * rate
-                tries_counter.update({
-                    'count': tries_counter.get('count') + 1,
-                    'last_delay': delay_now
-                })
-                time.sleep(delay_now)
-                return wrapper(*args, **kwargs)
-            finally:
-                tries_counter.update({
-                    'count': 1,
-                    'last_delay': delay
-                })
-
-        wrapper.__doc__ = function.__doc__
-        return wrapper
-
-    return decorator
+    return Retry(exception_classes, tries, delay, rate, **kwargs)
 
 
-def sp_retry(exception_classes=(), tries=10, delay=5, rate=1.3):
+def sp_retry(exception_classes=(), tries=10, delay=5, rate=1.3, **kwargs) -> Retry:
     """
     This is a shorthand for retry that catches all exceptions thrown by this library
 
@@ -62,15 +193,16 @@ def sp_retry(exception_classes=(), tries=10, delay=5, rate=1.3):
         tries:
         delay:
         rate:
+        **kwargs: see `retry`
 
     Returns:
 
     """
     from sp_api.base import SellingApiException
-    return retry((SellingApiException,) + exception_classes, tries, delay, rate)
+    return retry((SellingApiException,) + exception_classes, tries, delay, rate, **kwargs)
 
 
-def throttle_retry(exception_classes=(), tries=10, delay=5, rate=1.3):
+def throttle_retry(exception_classes=(), tries=10, delay=5, rate=1.3, **kwargs) -> Retry:
     """
     This is a shorthand for retry that catches SellingApiRequestThrottledException
 
@@ -80,9 +212,10 @@ def throttle_retry(exception_classes=(), tries=10, delay=5, rate=1.3):
         tries:
         delay:
         rate:
+        **kwargs: see `retry`
 
     Returns:
 
     """
     from sp_api.base import SellingApiRequestThrottledException
-    return retry((SellingApiRequestThrottledException,) + exception_classes, tries, delay, rate)
+    return retry((SellingApiRequestThrottledException,) + exception_classes, tries, delay, rate, **kwargs)
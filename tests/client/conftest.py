@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from sp_api.base import SessionPool
+
+
+class FakeResponse:
+    """
+    A requests response with a json payload, or a raw body in content
+    """
+
+    def __init__(self, status_code=200, payload=None, content=None, headers=None, text='', encoding=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.content = content
+        self.headers = {} if headers is None else headers
+        self.text = text
+        self.encoding = encoding
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content) if self.content is not None else self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError('%s Client Error' % self.status_code, response=self)
+
+    def iter_content(self, chunk_size):
+        return (self.content[i:i + chunk_size] for i in range(0, len(self.content), chunk_size))
+
+    def iter_lines(self, chunk_size=None):
+        return iter(self.content.splitlines())
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """
+    Answers requests with the queued responses, then with respond(method, url, **kwargs), and records them in calls
+
+    Queued exceptions are raised instead.
+    """
+
+    def __init__(self, *responses, respond=None):
+        self.responses = list(responses)
+        self.respond = respond
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(SimpleNamespace(method=method, url=url, **kwargs))
+        response = self.responses.pop(0) if self.responses else self.respond(method, url, **kwargs)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+
+class FakePool(SessionPool):
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    def get(self, url):
+        return self.session
+
+
+class FakeAuth:
+    """
+    An access token client that does not call LWA
+    """
+
+    def __init__(self, refresh_token=None, credentials=None, **kwargs):
+        self.cred = SimpleNamespace(refresh_token=credentials.refresh_token)
+
+    def get_auth(self):
+        return SimpleNamespace(access_token='<access_token>')
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def credentials():
+    return dict(
+        refresh_token='<refresh_token>',
+        lwa_app_id='<lwa_app_id>',
+        lwa_client_secret='<lwa_client_secret>',
+    )
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client(credentials, session):
+    """
+    Returns a factory of clients sending their requests to the session fixture, with a restricted data token
+    """
+
+    def make(client_class, **kwargs):
+        return client_class(**{'credentials': credentials, 'restricted_data_token': '<token>',
+                               'auth_token_client_class': FakeAuth, 'session_pool': FakePool(session), **kwargs})
+
+    return make
+
+
+@pytest.fixture
+def make_async_client(credentials):
+    """
+    Returns a factory of asyncio clients sending their requests to handler(request) through httpx's mock transport
+    """
+    httpx = pytest.importorskip('httpx')
+
+    def make(client_class, handler, **kwargs):
+        return client_class(**{'credentials': credentials, 'restricted_data_token': '<token>',
+                               'auth_token_client_class': FakeAuth,
+                               'http_client': httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs})
+
+    return make
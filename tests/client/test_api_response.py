@@ -0,0 +1,47 @@
+import pickle
+
+import pytest
+
+from sp_api.base import ApiResponse
+
+
+def test_api_response_shares_body():
+    js = {'items': [{'asin': 'B0'}], 'nextPageToken': 'next'}
+    res = ApiResponse.from_json(js, {'x-amzn-RateLimit-Limit': '2.0'})
+    assert res.payload is js
+    assert res.items == [{'asin': 'B0'}]
+    assert res('items') is js['items']
+    assert res.next_token == 'next'
+    assert res.rate_limit == '2.0'
+    assert res.kwargs is None
+    with pytest.raises(AttributeError):
+        res.foo = 'bar'
+
+
+def test_api_response_fields():
+    js = {'payload': {'Orders': [], 'NextToken': 'token'}, 'errors': None, 'pagination': {'nextToken': 'other'},
+          'foo': 'bar'}
+    res = ApiResponse.from_json(js, {})
+    assert res.payload is js['payload']
+    assert res.next_token == 'token'
+    assert res.kwargs == {'foo': 'bar'}
+    assert res.rate_limit is None
+
+    res = ApiResponse.from_json({'pagination': {'nextToken': 'other'}, 'items': []}, {})
+    assert res.payload == {'items': []}
+    assert res.next_token == 'other'
+    assert ApiResponse(payload={'a': 1}, headers={}, nextToken='given').next_token == 'given'
+    assert ApiResponse(payload=[1, 2], headers={}).next_token is None
+
+
+def test_api_response_without_headers():
+    res = ApiResponse.from_json({'payload': {}}, {'x-amzn-RateLimit-Limit': '0.5'}, keep_headers=False)
+    assert res.headers is None
+    assert res.rate_limit == '0.5'
+
+
+def test_api_response_pickle_and_str():
+    res = ApiResponse.from_json({'payload': {'a': 1}, 'pagination': {'nextToken': 'n'}}, {'x-amzn-RateLimit-Limit': '1'})
+    copy = pickle.loads(pickle.dumps(res))
+    assert (copy.payload, copy.next_token, copy.rate_limit) == ({'a': 1}, 'n', '1')
+    assert "'next_token': 'n'" in str(res)
@@ -0,0 +1,135 @@
+import asyncio
+import inspect
+import json
+
+import httpx
+
+from sp_api import api
+from sp_api import asyncio as sp_asyncio
+from sp_api.base import Client, SellingApiNotFoundException, RateLimiter, CircuitBreaker, CircuitOpenException
+
+
+def test_async_clients_mirror_api():
+    for name in api.__all__:
+        sync_class = getattr(api, name)
+        if inspect.isclass(sync_class) and issubclass(sync_class, Client):
+            async_class = getattr(sp_asyncio, name)
+            assert issubclass(async_class, sp_asyncio.AsyncClient)
+            assert issubclass(async_class, sync_class)
+
+
+def test_async_request(make_async_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'payload': {'OrderItems': [], 'NextToken': 'foo'}})
+
+    async def run():
+        orders = make_async_client(sp_asyncio.Orders, handler)
+        res = await orders.get_order_items('TEST_CASE_200', NextToken=None)
+        await orders.aclose()
+        return res
+
+    res = asyncio.run(run())
+    assert res.payload['OrderItems'] == []
+    assert res.next_token == 'foo'
+    assert requests[0].url.path == '/orders/v0/orders/TEST_CASE_200/orderItems'
+    assert requests[0].url.params.get_list('MarketplaceIds') == ['ATVPDKIKX0DER']
+    assert 'NextToken' not in requests[0].url.params
+    assert requests[0].headers['x-amz-access-token'] == '<token>'
+
+
+def test_async_request_body_and_errors(make_async_client):
+    def handler(request):
+        if request.method == 'POST':
+            assert json.loads(request.content)['reportType'] == 'GET_FLAT_FILE_OPEN_LISTINGS_DATA'
+            return httpx.Response(202, json={'reportId': 'ID323'})
+        return httpx.Response(404, json={'errors': [{'code': 'NotFound', 'message': 'Not found'}]})
+
+    async def run():
+        reports = make_async_client(sp_asyncio.Reports, handler)
+        res = await reports.create_report(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA')
+        try:
+            await reports.get_report('ID323')
+        except SellingApiNotFoundException as e:
+            return res, e
+
+    res, error = asyncio.run(run())
+    assert res.payload['reportId'] == 'ID323'
+    assert error.amzn_code == 'NotFound'
+
+
+def test_async_delete_without_body(make_async_client):
+    def handler(request):
+        assert request.method == 'DELETE'
+        return httpx.Response(200, content=b'')
+
+    async def run():
+        reports = make_async_client(sp_asyncio.Reports, handler)
+        return await reports.cancel_report('ID323')
+
+    assert asyncio.run(run()).payload == {'status_code': 200}
+
+
+def test_async_rate_limit(make_async_client):
+    limiter = RateLimiter()
+
+    def handler(request):
+        return httpx.Response(200, json={'payload': {}}, headers={'x-amzn-RateLimit-Limit': '0.5'})
+
+    async def run():
+        orders = make_async_client(sp_asyncio.Orders, handler)
+        orders.rate_limiter = limiter
+        await orders.get_order_items('TEST_CASE_200')
+        return orders.rate_limit_key('GET', '/orders/v0/orders/{}/orderItems')
+
+    key = asyncio.run(run())
+    assert limiter.backend._buckets[key].rate == 0.5
+
+
+def test_async_circuit_breaker(make_async_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503, json={'errors': [{'code': 'ServiceUnavailable', 'message': 'Unavailable'}]})
+
+    async def run():
+        orders = make_async_client(sp_asyncio.Orders, handler)
+        orders.circuit_breaker = CircuitBreaker(minimum_calls=1)
+        try:
+            await orders.get_order_items('TEST_CASE_200')
+        except Exception:
+            pass
+        try:
+            await orders.get_order_items('TEST_CASE_200')
+        except CircuitOpenException as e:
+            return e
+
+    error = asyncio.run(run())
+    assert error.key == ('us-east-1', 'GET', '/orders/v0/orders/{}/orderItems')
+    assert len(requests) == 1
+
+
+def test_async_stream_report_document(make_async_client):
+    import gzip
+
+    content = ''.join('SKU-%d\tÄrger\n' % i for i in range(200))
+
+    def handler(request):
+        if request.url.host == 'tortuga-prod-na.s3.amazonaws.com':
+            return httpx.Response(200, content=gzip.compress(content.encode('utf-8')),
+                                  headers={'Content-Type': 'text/plain; charset=utf-8'})
+        return httpx.Response(200, json={'payload': {'reportDocumentId': 'DOC-1', 'compressionAlgorithm': 'GZIP',
+                                                     'url': 'https://tortuga-prod-na.s3.amazonaws.com/DOC-1'}})
+
+    async def run():
+        reports = make_async_client(sp_asyncio.Reports, handler)
+        chunks = [chunk async for chunk in reports.iter_report_document('DOC-1', chunk_size=16)]
+        await reports.aclose()
+        return chunks
+
+    chunks = asyncio.run(run())
+    assert len(chunks) > 1
+    assert ''.join(chunks) == content
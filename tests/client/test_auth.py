@@ -1,4 +1,13 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sp_api.auth import access_token_client
 from sp_api.base import AccessTokenClient
+from sp_api.auth import FileTokenCache, KeyValueTokenCache
 from sp_api.base import Credentials, CredentialProvider
 from sp_api.base import AuthorizationError
 from sp_api.base.credential_provider import BaseCredentialProvider, FromCodeCredentialProvider
@@ -57,3 +66,119 @@ def test_auth_client():
         client._request('https://jsonplaceholder.typicode.com/posts/1', {}, {})
     except AuthorizationError as e:
         assert isinstance(e, AuthorizationError)
+
+
+class CountingAccessTokenClient(AccessTokenClient):
+    calls = 0
+
+    def _request(self, url, data, headers):
+        CountingAccessTokenClient.calls += 1
+        time.sleep(0.05)
+        return {'access_token': 'token_%s' % CountingAccessTokenClient.calls, 'expires_in': 3600}
+
+
+def make_counting_client(token):
+    CountingAccessTokenClient.calls = 0
+    return CountingAccessTokenClient(credentials=CredentialProvider(credentials=dict(
+        refresh_token=token,
+        lwa_app_id=lwa_app_id,
+        lwa_client_secret=lwa_client_secret,
+    )).credentials)
+
+
+def test_auth_single_flight_refresh():
+    client = make_counting_client('<single_flight_refresh_token>')
+    with ThreadPoolExecutor(32) as executor:
+        tokens = list(executor.map(lambda _: client.get_auth().access_token, range(32)))
+    assert set(tokens) == {'token_1'}
+    assert CountingAccessTokenClient.calls == 1
+
+
+def test_auth_refresh_ahead():
+    client = make_counting_client('<refresh_ahead_refresh_token>')
+    cache_key = client._get_cache_key()
+    access_token_client.cache[cache_key] = {'access_token': 'old', 'expires_at': time.time() + 60}
+    assert client.get_auth().access_token == 'old'
+    for _ in range(100):
+        if access_token_client.cache[cache_key]['access_token'] != 'old':
+            break
+        time.sleep(0.01)
+    assert client.get_auth().access_token == 'token_1'
+
+    access_token_client.cache[cache_key] = {'access_token': 'expired', 'expires_at': time.time() + 10}
+    assert client.get_auth().access_token == 'token_2'
+
+
+def test_grantless_auth_is_cached_per_scope():
+    client = make_counting_client('<grantless_refresh_token>')
+    client.get_grantless_auth('sellingpartnerapi::notifications')
+    client.get_grantless_auth('sellingpartnerapi::migration')
+    client.get_grantless_auth('sellingpartnerapi::notifications')
+    assert CountingAccessTokenClient.calls == 2
+
+
+class KeyValueStore:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key, (None,))[0]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = (value, ex)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_file_token_cache(tmp_path):
+    token_cache = FileTokenCache(str(tmp_path))
+    token_cache.set('key', {'access_token': 'foo'}, 60)
+    assert FileTokenCache(str(tmp_path)).get('key') == {'access_token': 'foo'}
+    token_cache.set('key', {'access_token': 'foo'}, -1)
+    assert token_cache.get('key') is None
+    assert token_cache.get('missing') is None
+
+    client = make_counting_client('<file_cache_refresh_token>')
+    client.token_cache = token_cache
+    assert client.get_auth().access_token == 'token_1'
+    client = make_counting_client('<file_cache_refresh_token>')
+    client.token_cache = FileTokenCache(str(tmp_path))
+    assert client.get_auth().access_token == 'token_1'
+    assert CountingAccessTokenClient.calls == 0
+
+
+
+def test_file_token_cache_default_directory_is_private(tmp_path, monkeypatch):
+    monkeypatch.delenv('SP_API_AUTH_CACHE_DIR', raising=False)
+    monkeypatch.setattr(tempfile, 'gettempdir', lambda: str(tmp_path))
+    assert os.stat(FileTokenCache().directory).st_mode & 0o777 == 0o700
+    os.chmod(tmp_path / 'sp_api_tokens', 0o777)
+    with pytest.raises(PermissionError):
+        FileTokenCache()
+    assert FileTokenCache(str(tmp_path / 'sp_api_tokens')).directory == str(tmp_path / 'sp_api_tokens')
+
+def test_key_value_token_cache():
+    store = KeyValueStore()
+    client = make_counting_client('<key_value_refresh_token>')
+    client.token_cache = KeyValueTokenCache(store)
+    assert client.get_auth().access_token == 'token_1'
+    assert client.get_auth().access_token == 'token_1'
+    value, ttl = store.data['sp_api:' + client._get_cache_key()]
+    assert ttl == 3600
+    assert CountingAccessTokenClient.calls == 1
+
+
+def test_refresh_locks_are_per_key_and_dropped():
+    locks = access_token_client._RefreshLocks()
+    assert locks.acquire('key')
+    assert not locks.acquire('key', blocking=False)
+    # Refreshes of other keys do not wait
+    assert locks.acquire('other', blocking=False)
+    locks.release('other')
+    locks.release('key')
+    assert len(locks) == 0
+
+    client = make_counting_client('<dropped_lock_refresh_token>')
+    client.get_auth()
+    assert len(access_token_client._refresh_locks) == 0
@@ -3,7 +3,7 @@ import pytest
 
 from sp_api.api import FulfillmentInbound
 from sp_api.base import AccessTokenClient
-from sp_api.base import Marketplaces, MissingCredentials, Client, SellingApiForbiddenException
+from sp_api.base import Marketplaces, MissingCredentials, Client, SellingApiForbiddenException, SessionPool
 from sp_api.base.credential_provider import FromCodeCredentialProvider, FromEnvironmentVariablesCredentialProvider, \
     FromSecretsCredentialProvider, FromConfigFileCredentialProvider, required_credentials
 from sp_api.base.exceptions import MissingScopeException
@@ -161,3 +161,23 @@ def test_client():
         client._request_grantless_operation('')
     except SellingApiForbiddenException as e:
         assert isinstance(e, SellingApiForbiddenException)
+
+
+def test_session_pool():
+    pool = SessionPool(pool_maxsize=3, keep_alive=False)
+    session = pool.get('https://sellingpartnerapi-na.amazon.com/orders/v0/orders')
+    assert session is pool.get('https://sellingpartnerapi-na.amazon.com')
+    assert session is not pool.get('https://api.amazon.com/auth/o2/token')
+    assert session.get_adapter('https://sellingpartnerapi-na.amazon.com')._pool_maxsize == 3
+    assert session.headers['Connection'] == 'close'
+
+    client = Client(session_pool=pool, credentials=dict(
+        refresh_token=refresh_token,
+        lwa_app_id=lwa_app_id,
+        lwa_client_secret=lwa_client_secret,
+    ))
+    assert client.session is pool.get(client.endpoint)
+    assert client._auth.session_pool is pool
+
+    pool.close()
+    assert pool.get(client.endpoint) is not session
@@ -0,0 +1,95 @@
+import pytest
+import requests
+
+from sp_api.api import Orders
+from sp_api.base import CircuitBreaker, CircuitOpenException, CircuitState, SellingApiServerException
+
+from .conftest import FakeResponse
+
+SERVER_ERROR = {'errors': [{'code': 'InternalFailure', 'message': 'We encountered an internal error.'}]}
+
+
+def test_circuit_states(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=10, minimum_calls=4, open_duration=30, clock=clock)
+    for failed in (True, False, True):
+        breaker.before('key')
+        breaker.record('key', failed)
+    assert breaker.state('key') == CircuitState.CLOSED
+
+    breaker.record('key', True)
+    assert breaker.state('key') == CircuitState.OPEN
+    with pytest.raises(CircuitOpenException) as e:
+        breaker.before('key')
+    assert e.value.retry_after == 30
+    assert breaker.state('other') == CircuitState.CLOSED
+
+    clock.now = 30
+    assert breaker.state('key') == CircuitState.HALF_OPEN
+    breaker.before('key')
+    with pytest.raises(CircuitOpenException):
+        breaker.before('key')
+    breaker.record('key', True)
+    assert breaker.state('key') == CircuitState.OPEN
+
+    clock.now = 60
+    breaker.before('key')
+    breaker.record('key', False)
+    assert breaker.state('key') == CircuitState.CLOSED
+
+
+def test_failures_expire_from_window(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=10, minimum_calls=2, clock=clock)
+    breaker.record('key', True)
+    clock.now = 10
+    breaker.record('key', False)
+    breaker.record('key', True)
+    assert breaker.state('key') == CircuitState.OPEN
+
+    breaker.reset('key')
+    breaker.record('key', True)
+    clock.now = 20
+    breaker.record('key', False)
+    assert breaker.state('key') == CircuitState.CLOSED
+
+
+def test_successes_count_before_first_failure(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, window=10, minimum_calls=10, clock=clock)
+    for _ in range(1000):
+        breaker.record('key', False)
+    for failed in [True] * 5 + [False] * 5:
+        breaker.record('key', failed)
+    assert breaker.state('key') == CircuitState.CLOSED
+
+    # Calls older than the window are trimmed
+    clock.now = 10
+    breaker.record('key', True)
+    assert len(breaker._circuits['key'].calls) == 1
+
+
+def test_half_open_release(clock):
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=1, clock=clock)
+    breaker.record('key', True)
+    clock.now = 1
+    breaker.before('key')
+    breaker.release('key')
+    breaker.before('key')
+    assert breaker.state('key') == CircuitState.HALF_OPEN
+
+
+def test_client_fails_fast(make_client, session):
+    breaker = CircuitBreaker(minimum_calls=2, failure_rate=1)
+    session.responses = [FakeResponse(500, payload=SERVER_ERROR), requests.ConnectionError('reset'),
+                         FakeResponse(payload={'payload': {}})]
+    orders = make_client(Orders, circuit_breaker=breaker)
+    with pytest.raises(SellingApiServerException):
+        orders.get_order_items('TEST_CASE_200')
+    with pytest.raises(requests.ConnectionError):
+        orders.get_order_items('TEST_CASE_200')
+    with pytest.raises(CircuitOpenException) as e:
+        orders.get_order_items('OTHER_ORDER')
+    assert e.value.key == ('us-east-1', 'GET', '/orders/v0/orders/{}/orderItems')
+    assert len(session.calls) == 2
+
+    # Other operations of the region are not affected
+    orders.get_order('TEST_CASE_200')
+    assert breaker.state(orders.circuit_breaker_key('GET', '/orders/v0/orders/{}')) == CircuitState.CLOSED
@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+from io import BytesIO, StringIO
+
+import pytest
+import requests
+
+from sp_api.api import Reports
+from sp_api.base.document import DocumentDecoder, decode_chunks, document_encoding, write_chunks
+
+from .conftest import FakeResponse
+
+content = 'sku\tprice\tname\n' + ''.join('SKU-%d\t%d.99\tÄrger Über Öl\n' % (i, i) for i in range(500))
+error_page = b'<?xml version="1.0" encoding="UTF-8"?><Error><Code>AccessDenied</Code></Error>'
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def make_reports(make_client, session):
+    """
+    Returns a factory of Reports clients with a report document, and the document's response
+    """
+
+    def make(compressed=True, encoding='utf-8', status_code=200):
+        payload = {'reportDocumentId': 'DOC-1', 'url': 'https://tortuga-prod-na.s3.amazonaws.com/DOC-1'}
+        data = content.encode(encoding)
+        if compressed:
+            payload['compressionAlgorithm'] = 'GZIP'
+            data = gzip.compress(data)
+        document = FakeResponse(status_code, content=error_page if status_code >= 400 else data, encoding=encoding)
+        session.responses = [FakeResponse(payload={'payload': payload}), document]
+        return make_client(Reports), document
+
+    return make
+
+
+def test_document_encoding():
+    assert document_encoding(None) == 'iso-8859-1'
+    assert document_encoding('Windows-31J') == 'cp932'
+    assert document_encoding('utf-8', 'cp1252') == 'cp1252'
+
+
+def test_decoder_gzip_split_across_chunks():
+    data = gzip.compress(content.encode('utf-8'))
+    # Small chunks split both the gzip header and multi-byte characters
+    for size in (1, 7, 1024):
+        decoder = DocumentDecoder(True, 'utf-8')
+        assert ''.join(decode_chunks(split(data, size), decoder)) == content
+
+
+def test_decoder_passthrough():
+    decoder = DocumentDecoder(True, 'utf-8')
+    assert ''.join(decode_chunks(split(content.encode('utf-8'), 5), decoder)) == content
+    decoder = DocumentDecoder(False, None)
+    assert b''.join(decode_chunks([b'a', b'', b'b'], decoder)) == b'ab'
+
+
+def test_decode_chunks_close():
+    closed = []
+    chunks = decode_chunks([b'a', b'b'], DocumentDecoder(), close=lambda: closed.append(True))
+    assert next(chunks) == b'a'
+    chunks.close()
+    assert closed == [True]
+
+
+def test_write_chunks(tmp_path):
+    chunks = ['ä', 'b']
+    bytes_io = BytesIO()
+    write_chunks(bytes_io, chunks, 'utf-8')
+    assert bytes_io.read() == 'äb'.encode('utf-8')
+    string_io = StringIO()
+    write_chunks(string_io, chunks, 'utf-8')
+    assert string_io.read() == 'äb'
+    path = str(tmp_path / 'report.txt')
+    write_chunks(path, chunks, 'cp1252')
+    with open(path, encoding='cp1252') as f:
+        assert f.read() == 'äb'
+
+
+def test_stream_report_document(make_reports, session):
+    reports, document = make_reports()
+    chunks = reports.iter_report_document('DOC-1', chunk_size=64)
+    assert ''.join(chunks) == content
+    assert session.calls[-1].stream is True
+    assert document.closed
+
+
+def test_stream_report_document_to_file(tmp_path, make_reports):
+    reports, document = make_reports(compressed=False, encoding='cp1252')
+    path = str(tmp_path / 'report.txt')
+    reports.get_report_document('DOC-1', file=path, stream=True, chunk_size=64)
+    with open(path, encoding='cp1252') as f:
+        assert f.read() == content
+    assert document.closed
+
+    reports, _ = make_reports()
+    file = BytesIO()
+    res = reports.get_report_document('DOC-1', file=file, stream=True)
+    assert file.read().decode('utf-8') == content
+    assert 'document' not in res.payload
+
+
+def test_iter_report_rows(make_reports):
+    reports, _ = make_reports()
+    rows = reports.iter_report_rows('DOC-1', report_type='GET_MERCHANT_LISTINGS_ALL_DATA', chunk_size=64)
+    iterator = iter(rows)
+    assert next(iterator) == {'sku': 'SKU-0', 'price': '0.99', 'name': 'Ärger Über Öl'}
+    assert sum(1 for _ in iterator) == 499
+    assert rows.header == ['sku', 'price', 'name']
+
+
+def test_stream_report_document_error(make_reports):
+    reports, document = make_reports(status_code=403)
+    with pytest.raises(requests.HTTPError):
+        reports.get_report_document('DOC-1', download=True, stream=True)
+    assert document.closed
+
+
+def test_async_stream_report_document_error(make_async_client):
+    import httpx
+    from sp_api import asyncio as sp_asyncio
+
+    payload = {'reportDocumentId': 'DOC-1', 'url': 'https://tortuga-prod-na.s3.amazonaws.com/DOC-1',
+               'compressionAlgorithm': 'GZIP'}
+
+    def handler(request):
+        if request.url.host == 'tortuga-prod-na.s3.amazonaws.com':
+            return httpx.Response(403, content=error_page)
+        return httpx.Response(200, json={'payload': payload})
+
+    async def run():
+        reports = make_async_client(sp_asyncio.Reports, handler)
+        return [chunk async for chunk in reports.iter_report_document('DOC-1')]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
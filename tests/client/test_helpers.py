@@ -1,11 +1,17 @@
 import enum
+import itertools
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from io import BytesIO
 
+import pytest
+
 from sp_api.api import FulfillmentInbound, Orders
-from sp_api.base import fill_query_params, sp_endpoint, create_md5, nest_dict, deprecated
-from sp_api.util import KeyMaker, load_all_pages, throttle_retry, load_date_bound
+from sp_api.base import fill_query_params, sp_endpoint, create_md5, nest_dict, deprecated, SellingApiBadRequestException
+from sp_api.util import KeyMaker, load_all_pages, throttle_retry, load_date_bound, FileCheckpointStore, \
+    SQLiteCheckpointStore, ExpiredCheckpointException
 from sp_api.util.load_all_pages import make_sleep_time
 
 key_mapping = {
@@ -59,6 +65,32 @@ def test_key_maker_from_dict_not_deep():
     assert isinstance(r.get('title').get('sellerSku'), list)
 
 
+def test_key_maker_first_mapping_wins():
+    key_maker = KeyMaker({'sku': ['seller_sku'], 'title': ['seller_sku', 'sku'], 'name': 'item-name'})
+    assert key_maker.convert_keys({'seller_sku': 1, 'sku': 2, 'item-name': 3, 'Open Date': 4}) == \
+        {'sku': 2, 'name': 3, 'openDate': 4}
+    key_maker.key_mapping = {'title': ['seller_sku']}
+    assert key_maker.convert_keys({'seller_sku': 1}) == {'title': 1}
+
+
+def test_key_maker_deeply_nested():
+    data = leaf = {}
+    for _ in range(5000):
+        leaf['seller_sku'] = {}
+        leaf = leaf['seller_sku']
+    r = KeyMaker(key_mapping).convert_keys(data)
+    for _ in range(5000):
+        r = r['sku']
+    assert r == {}
+
+
+def test_key_maker_convert_iter():
+    rows = ({'seller-sku': i, 'item-name': 'Foo'} for i in range(3))
+    converted = KeyMaker({'sku': ['seller-sku']}).convert_iter(rows)
+    assert next(converted) == {'sku': 0, 'itemName': 'Foo'}
+    assert list(converted) == [{'sku': 1, 'itemName': 'Foo'}, {'sku': 2, 'itemName': 'Foo'}]
+
+
 def test_load_all_pages():
     @throttle_retry()
     @load_all_pages(extras=dict(QueryType='NEXT_TOKEN'))
@@ -140,3 +172,211 @@ def test_load_date_bound():
     assert len(x) == 3
     assert x[1]()['dataStartTime'] == start + timedelta(days=30)
     assert x[1]()['dataEndTime'] == start + timedelta(days=60)
+
+
+def test_load_date_bound_per_call_state():
+    start = datetime(2024, 1, 1)
+    first = dummy(dataStartTime=start, dataEndTime=start + timedelta(days=60))
+    second = dummy(dataStartTime=start, dataEndTime=start + timedelta(days=90))
+    assert next(first)()['dataStartTime'] == start
+    assert len(list(second)) == 3
+    assert [window()['dataEndTime'] for window in first] == [start + timedelta(days=60)]
+
+
+def test_load_date_bound_parallel():
+    start = datetime(2022, 1, 1)
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def load(**kwargs):
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        # Later windows finish first
+        time.sleep(0.05 if kwargs['dataStartTime'] == start else 0.01)
+        with lock:
+            running.pop()
+        return kwargs['dataStartTime']
+
+    ordered = load_date_bound(interval_days=10, max_workers=3)(load)
+    results = list(ordered(dataStartTime=start, dataEndTime=start + timedelta(days=60)))
+    assert results == [start + timedelta(days=10 * i) for i in range(6)]
+    assert max(max_running) <= 3
+
+    completed = load_date_bound(interval_days=10, max_workers=3, ordered=False)(load)
+    results = list(completed(dataStartTime=start, dataEndTime=start + timedelta(days=60)))
+    assert sorted(results) == [start + timedelta(days=10 * i) for i in range(6)]
+    assert results[0] != start
+
+
+def test_load_date_bound_async():
+    import asyncio
+
+    start = datetime(2022, 1, 1)
+
+    @load_date_bound(interval_days=10, max_workers=2)
+    async def load(**kwargs):
+        await asyncio.sleep(0.01)
+        return kwargs['dataStartTime'], kwargs['dataEndTime']
+
+    async def run():
+        return [window async for window in load(dataStartTime=start.isoformat(),
+                                                dataEndTime=start + timedelta(days=25))]
+
+    assert asyncio.run(run()) == [
+        (start.isoformat(), start + timedelta(days=10)),
+        (start + timedelta(days=10), start + timedelta(days=20)),
+        (start + timedelta(days=20), start + timedelta(days=25)),
+    ]
+
+
+class Page:
+    rate_limit = None
+
+    def __init__(self, number, next_token):
+        self.number = number
+        self.next_token = next_token
+
+
+def test_load_all_pages_prefetch():
+    requested = []
+    second_page_requested = threading.Event()
+
+    @load_all_pages(throttle_by_seconds=0, prefetch_pages=2)
+    def load_pages(**kwargs):
+        number = int(kwargs.get('NextToken', 0))
+        requested.append(number)
+        if number == 1:
+            second_page_requested.set()
+        if number == 4:
+            raise ValueError('page 4 failed')
+        return Page(number, str(number + 1))
+
+    pages = load_pages()
+    assert next(pages).number == 0
+    # The next page is fetched while the first one is processed
+    assert second_page_requested.wait(5)
+    assert [page.number for page in itertools.islice(pages, 3)] == [1, 2, 3]
+    with pytest.raises(ValueError):
+        next(pages)
+
+
+def test_load_all_pages_prefetch_close():
+    requested = []
+    lock = threading.Lock()
+
+    @load_all_pages(throttle_by_seconds=0, prefetch_pages=1)
+    def load_pages(**kwargs):
+        with lock:
+            requested.append(kwargs.get('NextToken'))
+        return Page(len(requested), 'next')
+
+    pages = load_pages()
+    next(pages)
+    pages.close()
+    time.sleep(0.3)
+    with lock:
+        count = len(requested)
+    time.sleep(0.2)
+    assert len(requested) == count <= 3
+
+
+@pytest.fixture(params=['file', 'sqlite'])
+def checkpoint_store(request, tmp_path):
+    if request.param == 'file':
+        return FileCheckpointStore(str(tmp_path / 'checkpoints'))
+    return SQLiteCheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+
+
+def make_scan(store, requested, fail_at=None, **kwargs):
+    @load_all_pages(throttle_by_seconds=0, checkpoint=store, **kwargs)
+    def load_pages(**kwargs):
+        token = kwargs.get('NextToken')
+        requested.append(token)
+        if token == 'expired':
+            raise SellingApiBadRequestException([{'code': 'InvalidInput', 'message': 'Invalid NextToken'}])
+        number = int(token or 0)
+        if number == fail_at:
+            raise ValueError('worker died')
+        return Page(number, str(number + 1) if number < 4 else None)
+
+    return load_pages
+
+
+def test_load_all_pages_resumes_from_checkpoint(checkpoint_store):
+    requested = []
+    pages = make_scan(checkpoint_store, requested, fail_at=3)(scan_id='orders', CreatedAfter=datetime(2024, 1, 1))
+    with pytest.raises(ValueError):
+        for _ in pages:
+            pass
+    saved = checkpoint_store.get('orders')
+    assert (saved.next_token, saved.pages) == ('3', 3)
+    assert saved.params == {'CreatedAfter': '2024-01-01 00:00:00'}
+
+    requested.clear()
+    pages = make_scan(checkpoint_store, requested)(scan_id='orders', CreatedAfter=datetime(2024, 1, 1))
+    assert [page.number for page in pages] == [3, 4]
+    assert requested == ['3', '4']
+    assert checkpoint_store.get('orders') is None
+
+
+def test_load_all_pages_checkpoint_of_other_params(checkpoint_store):
+    from sp_api.util import Checkpoint
+
+    checkpoint_store.save(Checkpoint('orders', {'CreatedAfter': '2023'}, '3', 3))
+    requested = []
+    pages = make_scan(checkpoint_store, requested)(scan_id='orders', CreatedAfter='2024')
+    assert [page.number for page in pages] == [0, 1, 2, 3, 4]
+
+
+def test_load_all_pages_expired_checkpoint(checkpoint_store):
+    from sp_api.util import Checkpoint
+
+    checkpoint_store.save(Checkpoint('orders', {}, 'expired', 2))
+    requested = []
+    assert [page.number for page in make_scan(checkpoint_store, requested)(scan_id='orders')] == [0, 1, 2, 3, 4]
+    assert requested[:2] == ['expired', None]
+
+    checkpoint_store.save(Checkpoint('orders', {}, 'expired', 2))
+    with pytest.raises(SellingApiBadRequestException):
+        list(make_scan(checkpoint_store, [], on_expired_token='raise')(scan_id='orders'))
+    assert checkpoint_store.get('orders').next_token == 'expired'
+
+    checkpoint_store.save(Checkpoint('orders', {}, '3', 3, updated=time.time() - 600))
+    with pytest.raises(ExpiredCheckpointException):
+        list(make_scan(checkpoint_store, [], token_ttl=300, on_expired_token='raise')(scan_id='orders'))
+    requested = []
+    assert [page.number for page in make_scan(checkpoint_store, requested, token_ttl=300)(scan_id='orders')] \
+           == [0, 1, 2, 3, 4]
+
+
+def test_load_all_pages_prefetch_resumes_after_processed_pages(checkpoint_store):
+    requested = []
+    pages = make_scan(checkpoint_store, requested, prefetch_pages=2)(scan_id='orders')
+    assert [page.number for page in itertools.islice(pages, 2)] == [0, 1]
+    # Pages 2 and 3 are fetched ahead, but only the processed pages count
+    deadline = time.time() + 5
+    while len(requested) < 4 and time.time() < deadline:
+        time.sleep(0.01)
+    assert requested[:4] == [None, '1', '2', '3']
+    pages.close()
+    saved = checkpoint_store.get('orders')
+    assert (saved.next_token, saved.pages) == ('1', 1)
+
+    requested = []
+    pages = make_scan(checkpoint_store, requested, prefetch_pages=2)(scan_id='orders')
+    assert [page.number for page in pages] == [1, 2, 3, 4]
+    assert checkpoint_store.get('orders') is None
+
+
+def test_sqlite_checkpoint_store_close(tmp_path):
+    import sqlite3
+    from sp_api.util import Checkpoint
+
+    with SQLiteCheckpointStore(str(tmp_path / 'checkpoints.sqlite')) as store:
+        store.save(Checkpoint('orders', {}, '3', 3))
+        connection = store._connection()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute('SELECT 1')
+    assert store.get('orders').next_token == '3'
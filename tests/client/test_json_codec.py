@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+import requests
+
+from sp_api.api import DataKiosk, Orders
+from sp_api.base import JsonCodec, get_codec, set_codec
+from sp_api.base import json_codec
+
+from .conftest import FakeResponse
+
+@pytest.fixture(params=['json', 'orjson'])
+def codec(request):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    previous = get_codec()
+    set_codec(request.param)
+    yield get_codec()
+    set_codec(previous)
+
+
+def test_codec_round_trip(codec):
+    body = codec.dumps({'sku': 'Ä-1', 1: [True, None, 1.5]})
+    assert json.loads(body) == {'sku': 'Ä-1', '1': [True, None, 1.5]}
+    assert codec.loads(b'{"a": [1, 2]}') == {'a': [1, 2]}
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'')
+
+
+def test_client_uses_codec(codec, make_client, session):
+    session.responses = [FakeResponse(content=b'{"payload": {"AmazonOrderId": "1"}}')]
+    orders = make_client(Orders)
+    res = orders.update_shipment_status('1', marketplaceId='ATVPDKIKX0DER', shipmentStatus='ReadyForPickup')
+    assert res.payload == {'AmazonOrderId': '1'}
+    assert json.loads(session.calls[0].data)['shipmentStatus'] == 'ReadyForPickup'
+
+
+def test_stdlib_codec_is_default_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_codec, 'orjson', None)
+    monkeypatch.delenv('SP_API_JSON_CODEC', raising=False)
+    assert type(json_codec._default_codec()) is JsonCodec
+
+
+def test_data_kiosk_document_records(codec, make_client, session):
+    document = b'{"sku": "A", "units": 1}\n\n{"sku": "B", "units": 2}\n'
+    destination = b'{"documentId": "DOC", "documentUrl": "https://example.com/doc"}'
+    session.responses = [FakeResponse(content=destination), FakeResponse(content=document)]
+    data_kiosk = make_client(DataKiosk)
+    assert list(data_kiosk.iter_document_records('DOC')) == [{'sku': 'A', 'units': 1}, {'sku': 'B', 'units': 2}]
+
+    error = FakeResponse(403, content=b'<Error><Code>AccessDenied</Code></Error>')
+    session.responses = [FakeResponse(content=destination), error]
+    with pytest.raises(requests.HTTPError):
+        list(data_kiosk.iter_document_records('DOC'))
+    assert error.closed
+
+
+def test_async_data_kiosk_document_records(codec, make_async_client):
+    import httpx
+    from sp_api import asyncio as sp_asyncio
+
+    def handler(request):
+        if request.url.host == 'example.com':
+            return httpx.Response(200, content=b'{"sku": "A"}\n{"sku": "B"}')
+        return httpx.Response(200, json={'documentId': 'DOC', 'documentUrl': 'https://example.com/doc'})
+
+    async def run():
+        data_kiosk = make_async_client(sp_asyncio.DataKiosk, handler)
+        return [record async for record in data_kiosk.iter_document_records('DOC', chunk_size=5)]
+
+    assert asyncio.run(run()) == [{'sku': 'A'}, {'sku': 'B'}]
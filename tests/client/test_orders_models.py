@@ -0,0 +1,63 @@
+import pickle
+from decimal import Decimal
+
+from sp_api.api.orders.orders_definitions import Address, Money, Order, OrderItem, PaymentExecutionDetailItem
+from sp_api.base import ApiResponse
+
+ORDER = {
+    'AmazonOrderId': '902-1845936-5435065',
+    'PurchaseDate': '1970-01-19T03:58:30Z',
+    'OrderStatus': 'Unshipped',
+    'FulfillmentChannel': 'MFN',
+    'OrderTotal': {'CurrencyCode': 'USD', 'Amount': '11.01'},
+    'NumberOfItemsUnshipped': 1,
+    'PaymentExecutionDetail': [{'Payment': {'CurrencyCode': 'USD', 'Amount': '1.00'}, 'PaymentMethod': 'COD'}],
+    'IsPrime': False,
+    'ShippingAddress': {'City': 'SEATTLE', 'StateOrRegion': 'WA', 'PostalCode': '98121', 'CountryCode': 'US'},
+    'BuyerInfo': {'BuyerEmail': 'buyer@marketplace.amazon.com'},
+    'SomeNewField': {'a': 1},
+}
+
+
+def test_order_model():
+    order = Order.from_dict(ORDER)
+    assert order.AmazonOrderId == '902-1845936-5435065'
+    assert order.OrderTotal == Money(CurrencyCode='USD', Amount='11.01')
+    assert order.OrderTotal.decimal == Decimal('11.01')
+    assert isinstance(order.ShippingAddress, Address)
+    assert order.ShippingAddress.City == 'SEATTLE'
+    assert order.BuyerInfo.BuyerEmail == 'buyer@marketplace.amazon.com'
+    assert order.SellerOrderId is None
+    assert order.IsPrime is False
+    assert order.SomeNewField == {'a': 1}
+    assert not hasattr(order, '__dict__')
+    assert order.to_dict() == ORDER
+
+
+def test_nested_lists_are_parsed_lazily():
+    order = Order.from_dict(ORDER)
+    assert order._PaymentExecutionDetail is ORDER['PaymentExecutionDetail']
+    detail, = order.PaymentExecutionDetail
+    assert isinstance(detail, PaymentExecutionDetailItem)
+    assert detail.Payment.Amount == '1.00'
+    assert order.PaymentExecutionDetail[0] is detail
+    assert order.to_dict() == ORDER
+
+
+def test_enumerated_values_are_interned():
+    first, second = Order.from_dict(dict(ORDER)), Order.from_dict({'OrderStatus': ''.join(['Un', 'shipped'])})
+    assert first.OrderStatus is second.OrderStatus
+
+
+def test_model_pickle_and_repr():
+    item = OrderItem.from_dict({'ASIN': 'B00', 'ItemPrice': {'CurrencyCode': 'EUR', 'Amount': '5.00'}})
+    assert pickle.loads(pickle.dumps(item)) == item
+    assert repr(item) == "OrderItem(ASIN='B00', ItemPrice=Money(CurrencyCode='EUR', Amount='5.00'))"
+
+
+def test_api_response_hydrate():
+    response = ApiResponse.from_json({'payload': {'Orders': [ORDER], 'NextToken': 'next'}}, {})
+    orders = response.hydrate(Order, 'Orders')
+    assert [order.AmazonOrderId for order in orders] == ['902-1845936-5435065']
+    assert response.hydrate(Order, 'Missing') is None
+    assert ApiResponse.from_json({'payload': ORDER}, {}).hydrate(Order).OrderStatus == 'Unshipped'
@@ -0,0 +1,98 @@
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from sp_api.polling_manager import OrderSync, FileWatermarkStore, SQLiteWatermarkStore
+from sp_api.polling_manager.orders import fetch_order_attributes_concurrently
+
+from .conftest import FakeResponse
+
+
+class Page:
+    def __init__(self, payload, next_token=None):
+        self.payload = payload
+        self.next_token = next_token
+
+
+def test_fetch_order_attributes_concurrently(credentials):
+    calls = []
+    clients = set()
+    lock = threading.Lock()
+
+    def fetch(order_id, client, next_token):
+        with lock:
+            calls.append((order_id, next_token))
+            clients.add(id(client))
+            throttled = calls.count((order_id, next_token)) == 1 and order_id == 'THROTTLED'
+        if order_id == 'FAILING':
+            client.res = FakeResponse(500)
+            raise ValueError('boom')
+        if throttled:
+            client.res = FakeResponse(429)
+            raise ValueError('throttled')
+        if order_id == 'PAGED' and next_token is None:
+            return Page({'page': 1}, 'next')
+        return Page({'page': 2 if next_token else 1})
+
+    progress = []
+    results, failures = fetch_order_attributes_concurrently(
+        orders=['SIMPLE', {'AmazonOrderId': 'PAGED'}, 'THROTTLED', 'FAILING'],
+        credentials=credentials, fetch_attribute_func=fetch, max_workers=2, base_sleep_time=0,
+        progress=lambda done, total: progress.append((done, total)))
+
+    assert results == {'SIMPLE': [{'page': 1}], 'PAGED': [{'page': 1}, {'page': 2}], 'THROTTLED': [{'page': 1}]}
+    assert list(failures) == ['FAILING']
+    assert 'boom' in str(failures['FAILING'])
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert len(clients) <= 2
+
+
+@pytest.mark.parametrize('store_type', ['file', 'sqlite'])
+def test_order_sync(tmp_path, store_type, credentials):
+    if store_type == 'file':
+        store = FileWatermarkStore(str(tmp_path / 'watermarks'))
+    else:
+        store = SQLiteWatermarkStore(str(tmp_path / 'watermarks.sqlite'))
+    queries = []
+
+    def get_orders(**kwargs):
+        queries.append(kwargs)
+        if kwargs['NextToken'] is None:
+            return Page({'Orders': [{'AmazonOrderId': '1'}]}, 'next')
+        return Page({'Orders': [{'AmazonOrderId': '2'}]})
+
+    def make_sync(now):
+        sync = OrderSync(credentials=credentials, store=store)
+        sync.clock = lambda: now
+        sync.client.get_orders = get_orders
+        return sync
+
+    sync = make_sync(datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc))
+    changes = sync.changes()
+    assert next(changes)['AmazonOrderId'] == '1'
+    with pytest.raises(RuntimeError):
+        sync.commit()
+    assert [order['AmazonOrderId'] for order in changes] == ['2']
+    assert queries[0]['LastUpdatedAfter'] == '2024-01-01T11:58:00Z'
+    assert queries[0]['LastUpdatedBefore'] == '2024-01-02T11:58:00Z'
+    assert sync.watermark is None
+    sync.commit()
+    assert sync.watermark == datetime(2024, 1, 2, 11, 58, tzinfo=timezone.utc)
+
+    queries.clear()
+    sync = make_sync(datetime(2024, 1, 2, 12, 15, tzinfo=timezone.utc))
+    assert len(list(sync.changes())) == 2
+    assert queries[0]['LastUpdatedAfter'] == '2024-01-02T11:53:00Z'
+    assert queries[1]['NextToken'] == 'next'
+
+
+def test_sqlite_watermark_store_close(tmp_path):
+    path = str(tmp_path / 'watermarks.sqlite')
+    with SQLiteWatermarkStore(path) as store:
+        store.set('orders', '2024-01-01T00:00:00Z')
+        connection = store._connection()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute('SELECT 1')
+    assert store.get('orders') == '2024-01-01T00:00:00Z'
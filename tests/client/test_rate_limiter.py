@@ -0,0 +1,99 @@
+import gc
+import sqlite3
+import threading
+
+import pytest
+
+from sp_api.api import Orders, Reports
+from sp_api.base import RateLimiter, SQLiteRateLimitBackend
+from sp_api.base.helpers import parse_usage_plan, current_operation, sp_endpoint
+
+from .conftest import FakeResponse
+
+
+def test_parse_usage_plan():
+    assert parse_usage_plan(Orders.get_orders.__doc__) == (1, 1)
+    assert parse_usage_plan(Reports.create_report.__doc__) == (0.0167, 15)
+    assert parse_usage_plan('| Rate (requests per second) | Burst |\n| ---- | ---- |\n| .5 | 30 |') == (0.5, 30)
+    assert parse_usage_plan('no usage plan') == (None, None)
+    assert parse_usage_plan(None) == (None, None)
+
+
+def test_sp_endpoint_sets_operation():
+    @sp_endpoint('/api/call/{}', method='POST')
+    def my_endpoint(**kwargs):
+        return current_operation()
+
+    assert my_endpoint().path == '/api/call/{}'
+    assert my_endpoint().method == 'POST'
+    assert current_operation() is None
+
+
+def test_token_bucket(clock):
+    limiter = RateLimiter(clock=clock)
+    assert limiter.reserve('key') == 0
+    assert limiter.reserve('key', 2, 2) == 0
+    assert limiter.reserve('key', 2, 2) == 0
+    assert limiter.reserve('key', 2, 2) == 0.5
+    assert limiter.reserve('key', 2, 2) == 1
+    clock.now = 1
+    assert limiter.reserve('key', 2, 2) == 0.5
+
+    limiter.update('key', '4')
+    clock.now = 2
+    assert limiter.reserve('key', 2, 2) == 0
+    limiter.throttled('key')
+    assert limiter.reserve('key', 2, 2) == 0.25
+
+    limiter.update('other', None)
+    assert limiter.reserve('other') == 0
+
+
+def test_client_rate_limit(clock, make_client, session):
+    limiter = RateLimiter(clock=clock)
+    session.responses = [FakeResponse(payload={'payload': {}}, headers={'x-amzn-RateLimit-Limit': '0.5'})]
+    orders = make_client(Orders, rate_limiter=limiter)
+    orders.get_order_items('TEST_CASE_200')
+    key = orders.rate_limit_key('GET', '/orders/v0/orders/{}/orderItems')
+    assert limiter.backend._buckets[key].rate == 0.5
+    assert limiter.reserve(key) == 2
+
+
+def test_sqlite_backend_is_shared(tmp_path, clock):
+    path = str(tmp_path / 'rate_limits.sqlite')
+    worker_1 = RateLimiter(SQLiteRateLimitBackend(path), clock=clock)
+    worker_2 = RateLimiter(SQLiteRateLimitBackend(path), clock=clock)
+    key = ('seller', 'us-east-1', 'GET', '/orders/v0/orders')
+
+    assert worker_1.reserve(key, 1, 2) == 0
+    assert worker_2.reserve(key, 1, 2) == 0
+    assert worker_1.reserve(key, 1, 2) == 1
+    worker_2.update(key, '2')
+    assert worker_2.reserve(key, 1, 2) == 1
+    worker_1.throttled(key)
+    clock.now = 2
+    assert worker_2.reserve(key) == 0
+    assert worker_1.reserve('unknown') == 0
+
+
+def test_sqlite_backend_closes_connections(tmp_path):
+    backend = SQLiteRateLimitBackend(str(tmp_path / 'rate_limits.sqlite'))
+    connections = []
+
+    def worker():
+        backend.reserve('key', 1, 2, 0)
+        connections.append(backend._connections.get())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    gc.collect()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connections[0].execute('SELECT 1')
+
+    with backend:
+        connection = backend._connections.get()
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute('SELECT 1')
+    # Closed connections are opened again on next use
+    assert backend.reserve('key', 1, 2, 0) == 0
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from sp_api.api import Orders
+from sp_api.auth import MemoryTokenCache
+from sp_api.base import RawResponse, SellingApiForbiddenException, SellingApiServerException
+
+from .conftest import FakeResponse
+
+BODY = b'{"payload": {"Orders": [{"AmazonOrderId": "1"}], "NextToken": "next"}}'
+
+
+def respond(status_code=200, content=BODY):
+    return FakeResponse(status_code, content=content, headers={'x-amzn-RateLimit-Limit': '0.0167'})
+
+
+def test_raw_per_call(make_client, session):
+    session.responses = [respond()]
+    res = make_client(Orders).get_orders(CreatedAfter='TEST_CASE_200', raw=True)
+    assert isinstance(res, RawResponse)
+    assert res.content is BODY
+    assert (res.status_code, res.rate_limit) == (200, '0.0167')
+    assert res.json()['payload']['NextToken'] == 'next'
+    assert 'raw' not in session.calls[0].params
+
+
+def test_raw_post_body(make_client, session):
+    session.responses = [respond(content=b'{"payload": {}}')]
+    res = make_client(Orders).update_shipment_status('1', marketplaceId='ATVPDKIKX0DER',
+                                                     shipmentStatus='ReadyForPickup', raw=True)
+    assert res.content == b'{"payload": {}}'
+    assert b'raw' not in session.calls[0].data
+
+
+def test_not_raw_by_default(make_client, session):
+    session.responses = [respond()]
+    res = make_client(Orders).get_orders(CreatedAfter='TEST_CASE_200')
+    assert res.payload['Orders'] == [{'AmazonOrderId': '1'}]
+    assert res.next_token == 'next'
+
+
+def test_raw_restricted_call(make_client, session):
+    session.responses = [respond(content=b'{"restrictedDataToken": "RDT", "expiresIn": 3600}'), respond()]
+    client = make_client(Orders, restricted_data_token=None, rdt_cache=MemoryTokenCache())
+    res = client.get_order_items('1', RestrictedResources=['buyerInfo'], raw=True)
+    assert isinstance(res, RawResponse)
+    assert res.content is BODY
+    token, items = session.calls
+    assert token.url.endswith('/restrictedDataToken')
+    assert b'raw' not in token.data
+    assert items.url.endswith('/orders/v0/orders/1/orderItems')
+
+
+@pytest.mark.parametrize('status_code, content, exception', [
+    (403, b'{"errors": [{"code": "Unauthorized", "message": "Access denied"}]}', SellingApiForbiddenException),
+    (500, b'<html>Internal Server Error</html>', SellingApiServerException),
+])
+def test_raw_errors(status_code, content, exception, make_client, session):
+    session.responses = [respond(status_code, content)]
+    with pytest.raises(exception) as info:
+        make_client(Orders).get_orders(CreatedAfter='TEST_CASE_200', raw=True)
+    if status_code == 403:
+        assert info.value.amzn_code == 'Unauthorized'
+
+
+def test_async_raw(make_async_client):
+    import httpx
+    from sp_api import asyncio as sp_asyncio
+
+    def handler(request):
+        assert 'raw' not in request.url.params
+        return httpx.Response(200, content=BODY)
+
+    async def run():
+        async with make_async_client(sp_asyncio.Orders, handler) as client:
+            return await client.get_orders(CreatedAfter='TEST_CASE_200', raw=True)
+
+    res = asyncio.run(run())
+    assert res.content == BODY
+    assert repr(res) == '<RawResponse [200] %d bytes>' % len(BODY)
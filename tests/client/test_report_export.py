@@ -0,0 +1,140 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from sp_api.base import ReportType
+from sp_api.util import ReportReader
+
+pyarrow = pytest.importorskip('pyarrow')
+import pyarrow.ipc  # noqa: E402
+import pyarrow.parquet  # noqa: E402
+
+from sp_api.util.report_export import RecordBatchBuilder, export_report, iter_record_batches  # noqa: E402
+
+listings = 'item-name\tseller-sku\tprice\tquantity\topen-date\n' + ''.join(
+    'Item %d\tSKU-%d\t%s\t%s\t2024-01-02 03:04:05 PST\n' % (i, i, '%d.99' % i if i % 10 else '', i)
+    for i in range(250))
+
+
+def make_reader(document=listings, **kwargs):
+    chunks = [document[i:i + 100] for i in range(0, len(document), 100)]
+    return ReportReader(chunks, report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, row_type=tuple, **kwargs)
+
+
+def test_record_batches_with_schema_hints():
+    batches = list(iter_record_batches(make_reader(), batch_size=100))
+    assert [batch.num_rows for batch in batches] == [100, 100, 50]
+    schema = batches[0].schema
+    assert schema.field('seller-sku').type == pyarrow.string()
+    assert schema.field('price').type == pyarrow.decimal128(18, 4)
+    assert schema.field('quantity').type == pyarrow.int64()
+    assert all(batch.schema == schema for batch in batches)
+    row = batches[0].slice(1, 1).to_pylist()[0]
+    assert row['price'] == Decimal('1.99')
+    assert row['open-date'] == datetime.datetime(2024, 1, 2, 11, 4, 5, tzinfo=datetime.timezone.utc)
+    assert batches[0].column('price')[0].as_py() is None
+
+
+def test_schema_hints_override():
+    document = 'sku\tamount\tdate\n1\t1,5\t2024-01-02\n2\t\t2024-01-03\n'
+    reader = ReportReader([document], row_type=tuple)
+    batch, = iter_record_batches(reader, schema_hints={'sku': 'int64', 'amount': 'decimal(10,2)', 'date': 'date'})
+    assert batch.to_pylist() == [{'sku': 1, 'amount': Decimal('1.50'), 'date': datetime.date(2024, 1, 2)},
+                                 {'sku': 2, 'amount': None, 'date': datetime.date(2024, 1, 3)}]
+    with pytest.raises(ValueError):
+        list(iter_record_batches(ReportReader([document], row_type=tuple), schema_hints={'amount': 'unknown'}))
+
+
+def test_export_parquet_and_feather(tmp_path):
+    path = str(tmp_path / 'listings.parquet')
+    assert export_report(make_reader(), path, batch_size=64) == 250
+    table = pyarrow.parquet.read_table(path)
+    assert table.num_rows == 250
+    assert table.column('quantity').to_pylist()[-1] == 249
+    assert pyarrow.parquet.ParquetFile(path).num_row_groups == 4
+
+    path = str(tmp_path / 'listings.feather')
+    assert export_report(make_reader(), path, format='feather') == 250
+    with pyarrow.ipc.open_file(path) as f:
+        assert f.read_all().column('seller-sku').to_pylist()[:2] == ['SKU-0', 'SKU-1']
+
+
+def test_export_empty_and_json(tmp_path):
+    path = str(tmp_path / 'empty.parquet')
+    assert export_report(make_reader('item-name\tseller-sku\tprice\tquantity\topen-date\n'), path) == 0
+    assert pyarrow.parquet.read_table(path).column_names == ['item-name', 'seller-sku', 'price', 'quantity',
+                                                            'open-date']
+
+    document = json.dumps({'reportSpecification': {}, 'salesAndTrafficByDate': [
+        {'date': '2024-01-%02d' % i, 'salesByDate': {'unitsOrdered': i}} for i in range(1, 11)]})
+    reader = ReportReader([document], report_type=ReportType.GET_SALES_AND_TRAFFIC_REPORT)
+    builder = RecordBatchBuilder(reader, batch_size=4, schema_hints={'date': 'date'})
+    batches = [batch for batch in map(builder.append, reader) if batch is not None] + [builder.flush()]
+    assert [batch.num_rows for batch in batches] == [4, 4, 2]
+    assert batches[2].to_pylist()[-1] == {'date': datetime.date(2024, 1, 10), 'salesByDate': {'unitsOrdered': 10}}
+
+
+def test_decimal_separator():
+    document = 'sku\tprice\tquantity\n1\t1.234,56\t1.234\n2\t1,5\t2\n'
+    hints = {'price': 'decimal(10,2)', 'quantity': 'int64'}
+    batch, = iter_record_batches(ReportReader([document], row_type=tuple), schema_hints=hints, decimal_separator=',')
+    assert batch.column('price').to_pylist() == [Decimal('1234.56'), Decimal('1.50')]
+    assert batch.column('quantity').to_pylist() == [1234, 2]
+
+    document = 'sku\tprice\n1\t1,234.56\n2\t1,234\n'
+    batch, = iter_record_batches(ReportReader([document], row_type=tuple), schema_hints=hints, decimal_separator='.')
+    assert batch.column('price').to_pylist() == [Decimal('1234.56'), Decimal('1234.00')]
+    with pytest.raises(ValueError, match='ambiguous'):
+        list(iter_record_batches(ReportReader([document], row_type=tuple), schema_hints=hints))
+    with pytest.raises(ValueError):
+        list(iter_record_batches(ReportReader(['sku\tprice\n1\t1.234,56\n'], row_type=tuple), schema_hints=hints,
+                                 decimal_separator='.'))
+
+
+
+def test_non_iso_settlement():
+    document = ('settlement-id\tsettlement-start-date\tdeposit-date\ttotal-amount\tposted-date\tamount\n'
+                '1\t05.03.2024 10:15:00 UTC\t21.03.2024 10:15:00 CET\t1.234,56\t06.03.2024\t1,234\n'
+                '1\t\t\t\t2024/03/07\t1,234\n')
+    reader = ReportReader([document], report_type=ReportType.GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE, row_type=tuple)
+    batch, = iter_record_batches(reader)
+    utc = datetime.timezone.utc
+    assert batch.to_pylist()[0] == {
+        'settlement-id': '1',
+        'settlement-start-date': datetime.datetime(2024, 3, 5, 10, 15, tzinfo=utc),
+        'deposit-date': datetime.datetime(2024, 3, 21, 9, 15, tzinfo=utc),
+        'total-amount': Decimal('1234.56'),
+        'posted-date': datetime.datetime(2024, 3, 6, tzinfo=utc),
+        # Ambiguous without decimal_separator, the column stays a string
+        'amount': '1,234',
+    }
+    assert batch.column('posted-date')[1].as_py() == datetime.datetime(2024, 3, 7, tzinfo=utc)
+    with pytest.raises(ValueError, match='ambiguous'):
+        list(iter_record_batches(ReportReader([document], row_type=tuple), schema_hints={'amount': 'decimal'}))
+
+def make_json_reader(records):
+    document = json.dumps({'reportSpecification': {}, 'salesAndTrafficByDate': records})
+    return ReportReader([document], report_type=ReportType.GET_SALES_AND_TRAFFIC_REPORT)
+
+
+def test_json_column_empty_in_first_batch():
+    records = [{'date': '2024-01-01', 'note': None}, {'date': '2024-01-02', 'note': None},
+               {'date': '2024-01-03', 'note': 'late'}, {'date': '2024-01-04', 'note': {'code': 1}}]
+    batches = list(iter_record_batches(make_json_reader(records), batch_size=2))
+    assert all(batch.schema.field('note').type == pyarrow.string() for batch in batches)
+    assert batches[1].column('note').to_pylist() == ['late', '{"code": 1}']
+
+
+def test_json_keys_after_first_batch():
+    records = [{'date': '2024-01-01'}, {'date': '2024-01-02'}, {'date': '2024-01-03', 'units': 3}]
+    with pytest.raises(ValueError, match='units'):
+        list(iter_record_batches(make_json_reader(records), batch_size=2))
+    batches = list(iter_record_batches(make_json_reader(records), batch_size=2, schema_hints={'units': 'int64'}))
+    assert batches[0].column('units').to_pylist() == [None, None]
+    assert batches[1].column('units').to_pylist() == [3]
+
+    records = [{'date': '2024-01-01', 'units': 1}, {'date': '2024-01-02', 'units': 'many'}]
+    with pytest.raises(ValueError, match='units'):
+        list(iter_record_batches(make_json_reader(records), batch_size=1))
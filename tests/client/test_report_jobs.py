@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import threading
+import time
+import urllib.parse
+
+from sp_api import asyncio as sp_asyncio
+from sp_api.api import Reports
+from sp_api.api.reports.report_jobs import ReportJob
+from sp_api.base import ApiResponse, ProcessingStatus, ReportType
+
+from .conftest import FakeResponse
+
+def response(payload):
+    return ApiResponse(payload=payload, headers={})
+
+
+class FakeReports(Reports):
+    """
+    Reports finish after the number of polls in their reportOptions, with the status given there
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reports = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def create_report(self, **kwargs):
+        with self.lock:
+            report_id = kwargs.get('reportOptions', {}).get('id', 'R%d' % len(self.reports))
+            self.reports[report_id] = dict(kwargs.get('reportOptions', {}), polls=0)
+            self.calls.append(('create_report', report_id))
+        return response({'reportId': report_id})
+
+    def get_report(self, reportId, **kwargs):
+        report = self.reports[reportId]
+        self.calls.append(('get_report', reportId))
+        report['polls'] += 1
+        if report['polls'] < report.get('polls_until_done', 1):
+            status = 'IN_QUEUE' if report['polls'] < 2 else 'IN_PROGRESS'
+            return response({'reportId': reportId, 'processingStatus': status})
+        return response({'reportId': reportId, 'processingStatus': report.get('status', 'DONE'),
+                         'reportDocumentId': 'DOC-' + reportId})
+
+    def get_report_document(self, reportDocumentId, download=False, file=None, **kwargs):
+        self.calls.append(('get_report_document', reportDocumentId))
+        if file is not None:
+            file.write(reportDocumentId)
+        return response({'reportDocumentId': reportDocumentId, 'document': 'rows'})
+
+
+class AsyncFakeReports(sp_asyncio.AsyncClient, FakeReports):
+    async def create_report(self, **kwargs):
+        return FakeReports.create_report(self, **kwargs)
+
+    async def get_report(self, reportId, **kwargs):
+        await asyncio.sleep(0)
+        return FakeReports.get_report(self, reportId, **kwargs)
+
+    async def get_report_document(self, reportDocumentId, **kwargs):
+        return FakeReports.get_report_document(self, reportDocumentId, **kwargs)
+
+    run_report = sp_asyncio.Reports.run_report
+    run_reports = sp_asyncio.Reports.run_reports
+
+
+def test_adaptive_polling():
+    job = ReportJob(poll_interval=1, max_poll_interval=3, backoff=2)
+    job.report_id = 'R0'
+    intervals = [job._polled(response({'processingStatus': status}))
+                 for status in ('IN_QUEUE', 'IN_QUEUE', 'IN_QUEUE', 'IN_PROGRESS', 'IN_PROGRESS', 'DONE')]
+    assert intervals == [1, 2, 3, 1, 2, None]
+    assert job.status == ProcessingStatus.DONE
+    assert job.polls == 6
+
+
+def test_run_report(tmp_path, credentials):
+    reports = FakeReports(credentials=credentials)
+    path = tmp_path / 'report.txt'
+    with open(path, 'w') as file:
+        job = reports.run_report(reportType=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA, file=file,
+                                 reportOptions={'polls_until_done': 3}, poll_interval=0.001)
+    assert job.status == ProcessingStatus.DONE
+    assert job.polls == 3
+    assert job.document.payload['reportDocumentId'] == 'DOC-R0'
+    assert path.read_text() == 'DOC-R0'
+    assert [call[0] for call in reports.calls] == ['create_report'] + ['get_report'] * 3 + ['get_report_document']
+
+
+def test_run_report_fatal_and_without_download(credentials):
+    reports = FakeReports(credentials=credentials)
+    job = reports.run_report(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', download=True,
+                             reportOptions={'status': 'FATAL'}, poll_interval=0)
+    assert job.status == ProcessingStatus.FATAL
+    assert job.document is None
+    assert job.document_id == 'DOC-R0'
+
+    job = reports.run_report(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', poll_interval=0)
+    assert job.status == ProcessingStatus.DONE
+    assert job.document is None
+    assert job.document_id == 'DOC-R1'
+
+
+def test_run_reports_concurrently(credentials):
+    reports = FakeReports(credentials=credentials)
+    jobs = [dict(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', download=True, poll_interval=0.001,
+                 reportOptions={'polls_until_done': polls, 'id': 'R%d' % polls}) for polls in (6, 1, 3)]
+    jobs.append(ReportJob(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', timeout=0, poll_interval=0.01,
+                          reportOptions={'polls_until_done': 100, 'id': 'SLOW'}))
+    finished = list(reports.run_reports(jobs, max_workers=2))
+    assert len(finished) == 4
+    done = {job.report_id: job for job in finished if not job.error}
+    assert {report_id: job.polls for report_id, job in done.items()} == {'R6': 6, 'R1': 1, 'R3': 3}
+    assert all(job.document.payload['document'] == 'rows' for job in done.values())
+    failed, = [job for job in finished if job.error]
+    assert failed.report_id == 'SLOW'
+    assert isinstance(failed.error, TimeoutError)
+
+
+def test_async_run_reports(credentials):
+    async def run():
+        reports = AsyncFakeReports(credentials=credentials)
+        job = await reports.run_report(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', download=True,
+                                       poll_interval=0, reportOptions={'polls_until_done': 2})
+        jobs = [dict(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', poll_interval=0,
+                     reportOptions={'polls_until_done': polls}) for polls in (3, 1)]
+        return job, [job async for job in reports.run_reports(jobs)]
+
+    job, finished = asyncio.run(run())
+    assert job.document.payload['reportDocumentId'] == 'DOC-R0'
+    assert [job.report_id for job in finished] == ['R2', 'R1']
+
+
+class SlowRateLimiter:
+    """
+    Widens the window between a request's method being chosen and sent
+    """
+
+    def acquire(self, *args):
+        time.sleep(0.001)
+
+    def update(self, *args):
+        pass
+
+    def throttled(self, *args):
+        pass
+
+
+def check_method(errors):
+    lock = threading.Lock()
+    reports = itertools.count()
+
+    def respond(method, url, data=None, **kwargs):
+        path = urllib.parse.urlparse(url).path
+        expected = 'POST' if path.endswith('/reports') else 'GET'
+        if method != expected or (method == 'POST') != (data is not None):
+            errors.append((method, path, data))
+        if method == 'POST':
+            with lock:
+                return FakeResponse(content=b'{"reportId": "R%d"}' % next(reports))
+        return FakeResponse(content=b'{"processingStatus": "DONE", "reportDocumentId": "DOC"}')
+
+    return respond
+
+
+def test_run_reports_share_client(make_client, session):
+    errors = []
+    session.respond = check_method(errors)
+    reports = make_client(Reports, rate_limiter=SlowRateLimiter())
+    jobs = [dict(reportType='GET_FLAT_FILE_OPEN_LISTINGS_DATA', poll_interval=0) for _ in range(40)]
+    finished = list(reports.run_reports(jobs, max_workers=8))
+    assert [job.error for job in finished if job.error] == []
+    assert len(finished) == 40
+    assert errors == []
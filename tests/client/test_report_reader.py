@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from sp_api.base import ReportType, ReportFormat, report_format
+from sp_api.util import ReportReader
+
+listings = 'item-name\tseller-sku\tprice\n' + ''.join('Ärger "Deluxe" %d\tSKU-%d\t%d.99\n' % (i, i, i) for i in range(300))
+
+sales_and_traffic = {
+    'reportSpecification': {'reportType': 'GET_SALES_AND_TRAFFIC_REPORT', 'reportOptions': {'asinGranularity': 'PARENT'}},
+    'salesAndTrafficByDate': [{'date': '2024-01-%02d' % i, 'unitsOrdered': i, 'price': 1.5} for i in range(1, 29)],
+    'salesAndTrafficByAsin': [{'parentAsin': 'B0%08d' % i, 'sessions': i, 'note': None} for i in range(100)],
+}
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_report_format():
+    assert report_format(ReportType.GET_MERCHANT_LISTINGS_ALL_DATA) == ReportFormat.TAB_DELIMITED
+    assert report_format('GET_SALES_AND_TRAFFIC_REPORT') == ReportFormat.JSON
+    assert report_format(ReportType.GET_XML_BROWSE_TREE_DATA) == ReportFormat.XML
+    assert report_format(ReportType.GET_CSV_MFN_PRIME_RETURNS_REPORT) == ReportFormat.CSV
+    with pytest.raises(ValueError):
+        ReportReader([], report_type=ReportType.GET_XML_BROWSE_TREE_DATA)
+
+
+def test_tab_delimited_rows():
+    for size in (1, 10, 4096):
+        reader = ReportReader(split(listings, size), report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA)
+        rows = list(reader)
+        assert len(rows) == 300
+        assert rows[7] == {'item-name': 'Ärger "Deluxe" 7', 'seller-sku': 'SKU-7', 'price': '7.99'}
+        assert reader.header == ['item-name', 'seller-sku', 'price']
+
+
+def test_tuple_rows_and_line_endings():
+    reader = ReportReader(['\ufeffa\tb\r\n1\t', '2\r\n\r\n3\t4'], row_type=tuple)
+    assert list(reader) == [('1', '2'), ('3', '4')]
+    assert reader.header == ['a', 'b']
+
+
+def test_csv_rows():
+    document = 'order-id,comment,qty\n1,"multi\nline, quoted",2\n2,plain,3\n'
+    for size in (1, 5, 100):
+        rows = list(ReportReader(split(document, size)))
+        assert rows == [{'order-id': '1', 'comment': 'multi\nline, quoted', 'qty': '2'},
+                        {'order-id': '2', 'comment': 'plain', 'qty': '3'}]
+
+
+def test_json_rows():
+    document = json.dumps(sales_and_traffic, indent=2)
+    for size in (1, 7, 100000):
+        reader = ReportReader(split(document, size))
+        rows = list(reader)
+        assert rows == sales_and_traffic['salesAndTrafficByDate'] + sales_and_traffic['salesAndTrafficByAsin']
+        assert reader.metadata == {'reportSpecification': sales_and_traffic['reportSpecification']}
+
+    reader = ReportReader(split(document, 13), report_type=ReportType.GET_SALES_AND_TRAFFIC_REPORT,
+                          json_key='salesAndTrafficByAsin')
+    assert list(reader) == sales_and_traffic['salesAndTrafficByAsin']
+    assert list(ReportReader(['[1, 2', '3, {"a": [4]}]'])) == [1, 23, {'a': [4]}]
+
+
+def test_json_truncated():
+    with pytest.raises(ValueError):
+        list(ReportReader(['{"rows": [{"a": 1}, {"b"']))
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / 'listings.txt.gz'
+    path.write_bytes(gzip.compress(listings.encode('cp1252')))
+    reader = ReportReader.from_file(str(path), encoding='cp1252', chunk_size=64, row_type=tuple)
+    rows = list(reader)
+    assert rows[-1] == ('Ärger "Deluxe" 299', 'SKU-299', '299.99')
+
+    path = tmp_path / 'listings.txt'
+    path.write_bytes(listings.encode('utf-8'))
+    assert len(list(ReportReader.from_file(str(path)))) == 300
+
+
+def test_async_rows():
+    async def chunks():
+        for chunk in split(listings, 50):
+            yield chunk
+
+    async def run():
+        return [row async for row in ReportReader(chunks(), report_type=ReportType.GET_MERCHANT_LISTINGS_ALL_DATA)]
+
+    rows = asyncio.run(run())
+    assert len(rows) == 300
+    assert rows[0]['seller-sku'] == 'SKU-0'
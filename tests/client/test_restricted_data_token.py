@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+import pytest
+
+from sp_api.api import Orders, Tokens
+from sp_api.api.tokens.restricted_data_token import restricted_resource
+from sp_api.auth import MemoryTokenCache
+from sp_api.base import SellingApiForbiddenException
+
+from .conftest import FakeResponse
+
+
+class Mint:
+    """
+    Answers restricted data token requests with RDT-1, RDT-2, ..., and rejects calls with the forbidden tokens
+    """
+
+    def __init__(self, forbidden=()):
+        self.forbidden = set(forbidden)
+        self.minted = 0
+
+    def __call__(self, method, url, headers=None, **kwargs):
+        if url.endswith('/restrictedDataToken'):
+            self.minted += 1
+            return FakeResponse(payload={'restrictedDataToken': 'RDT-%d' % self.minted, 'expiresIn': 3600})
+        if headers['x-amz-access-token'] in self.forbidden:
+            return FakeResponse(403, payload={'errors': [{'code': 'Unauthorized',
+                                                          'message': 'Access to requested resource is denied.'}]})
+        return FakeResponse(payload={'payload': {'url': url}})
+
+
+def sent(session):
+    return [(call.method, call.url, json.loads(call.data) if call.data else None,
+             call.headers['x-amz-access-token']) for call in session.calls]
+
+
+@pytest.fixture
+def make_orders(make_client):
+    def make(rdt_cache, **kwargs):
+        return make_client(Orders, restricted_data_token=None, rdt_cache=rdt_cache, **kwargs)
+
+    return make
+
+
+def test_restricted_data_token_is_cached(make_orders, session):
+    session.respond, cache = Mint(), MemoryTokenCache()
+    orders = make_orders(cache)
+    for order_id in ('1', '2', '3'):
+        res = orders.get_order_items(order_id, RestrictedResources=['buyerInfo'])
+        assert res.payload['url'].endswith('/orders/v0/orders/%s/orderItems' % order_id)
+    orders.get_order('1', RestrictedResources=['buyerInfo'])
+
+    tokens = [r for r in sent(session) if r[1].endswith('/restrictedDataToken')]
+    assert len(tokens) == 2
+    assert tokens[0][2]['restrictedResources'] == [
+        {'method': 'GET', 'path': '/orders/v0/orders/{orderId}/orderItems', 'dataElements': ['buyerInfo']}]
+    assert tokens[0][3] == '<access_token>'
+    assert [r[3] for r in sent(session) if not r[1].endswith('/restrictedDataToken')] == \
+           ['RDT-1', 'RDT-1', 'RDT-1', 'RDT-2']
+    assert orders.restricted_data_token is None
+
+    # Another client of the same seller reuses the token, other data elements need their own
+    orders = make_orders(cache)
+    orders.get_order_items('4', RestrictedResources=['buyerInfo'])
+    orders.get_order_items('4', RestrictedResources=['buyerInfo', 'shippingAddress'])
+    assert session.respond.minted == 3
+
+
+def test_restricted_data_token_of_the_client_is_kept(make_client, session):
+    session.respond = Mint()
+    orders = make_client(Orders, rdt_cache=MemoryTokenCache())
+    orders.get_order_items('1', RestrictedResources=['buyerInfo'])
+    orders.get_order('1')
+    assert [r[3] for r in sent(session)] == ['<access_token>', 'RDT-1', '<token>']
+    assert orders.restricted_data_token == '<token>'
+
+
+def test_revoked_restricted_data_token_is_minted_again(make_orders, session):
+    session.respond = Mint(forbidden={'RDT-1'})
+    orders = make_orders(MemoryTokenCache())
+    with pytest.raises(SellingApiForbiddenException):
+        orders.get_orders(CreatedAfter='2024-01-01', RestrictedResources=['buyerInfo'])
+    assert session.respond.minted == 1
+
+    orders.rdt_cache.set(orders.restricted_data_token_key('GET', '/orders/v0/orders', ['buyerInfo']),
+                         {'restrictedDataToken': 'RDT-1'}, 60)
+    res = orders.get_orders(CreatedAfter='2024-01-01', RestrictedResources=['buyerInfo'])
+    assert res.payload['url'].endswith('/orders/v0/orders')
+    assert session.respond.minted == 2
+    assert sent(session)[-1][3] == 'RDT-2'
+
+
+def test_async_restricted_data_token_is_cached(make_async_client):
+    import httpx
+    from sp_api import asyncio as sp_asyncio
+
+    tokens = []
+
+    def handler(request):
+        if request.url.path.endswith('/restrictedDataToken'):
+            tokens.append(json.loads(request.content)['restrictedResources'])
+            return httpx.Response(200, json={'restrictedDataToken': 'RDT', 'expiresIn': 3600})
+        return httpx.Response(200, json={'payload': {'token': request.headers['x-amz-access-token']}})
+
+    async def run():
+        orders = make_async_client(sp_asyncio.Orders, handler, restricted_data_token=None,
+                                   rdt_cache=MemoryTokenCache())
+        await orders.get_order('1', RestrictedResources=['buyerInfo'])
+        return await orders.get_order('2', RestrictedResources=['buyerInfo'])
+
+    res = asyncio.run(run())
+    assert res.payload['token'] == 'RDT'
+    assert tokens == [[{'method': 'GET', 'path': '/orders/v0/orders/{orderId}', 'dataElements': ['buyerInfo']}]]
+
+
+def test_batch_restricted_data_token(make_client, make_orders, session):
+    session.respond, cache = Mint(forbidden={'RDT-2'}), MemoryTokenCache()
+    tokens = make_client(Tokens, restricted_data_token=None, rdt_cache=cache)
+    rdt = tokens.batch_restricted_data_token([
+        restricted_resource('/orders/v0/orders/{orderId}/address'),
+        restricted_resource('/orders/v0/orders/{orderId}/orderItems', ['buyerInfo']),
+    ])
+
+    def load(token, order_id):
+        orders = make_client(Orders, restricted_data_token=token)
+        return orders.get_order_address(order_id).payload['url'], token
+
+    results = rdt.map(load, ['1', '2', '3', '4'], max_workers=4)
+    assert [url.rsplit('/', 2)[1] for url, _ in results] == ['1', '2', '3', '4']
+    assert {token for _, token in results} == {'RDT-1'}
+    minted = [r for r in sent(session) if r[1].endswith('/restrictedDataToken')]
+    assert len(minted) == 1
+    assert minted[0][2]['restrictedResources'][1] == {'method': 'GET', 'path': '/orders/v0/orders/{orderId}/orderItems',
+                                                      'dataElements': ['buyerInfo']}
+
+    # Orders calls with matching restricted resources reuse the token
+    orders = make_orders(cache)
+    orders.get_order_items('1', RestrictedResources=['buyerInfo'])
+    assert session.respond.minted == 1
+    assert sent(session)[-1][3] == 'RDT-1'
+
+    # Expired tokens are minted again, rejected ones too
+    rdt.clock = lambda: rdt._expires_at
+    assert rdt.token == 'RDT-2'
+    rdt.clock = lambda: 0
+    assert rdt.call(load, '5')[1] == 'RDT-3'
+    assert rdt.mints == 3
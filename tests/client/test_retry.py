@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from sp_api.base import SellingApiRequestThrottledException, SellingApiServerException
+from sp_api.util import retry, sp_retry, throttle_retry, Retry
+from sp_api.util.retry import retry_after, rate_limit_delay
+
+
+def failing(failures, exception=SellingApiRequestThrottledException, headers=None):
+    calls = []
+
+    def function(value):
+        calls.append(value)
+        if len(calls) <= failures:
+            raise exception([{'code': 'QuotaExceeded', 'message': 'You exceeded your quota'}], headers or {})
+        return value
+
+    function.calls = calls
+    return function
+
+
+def make_retry(*args, **kwargs):
+    decorator = retry(*args, **kwargs)
+    decorator.delays = []
+    decorator.sleep = decorator.delays.append
+    return decorator
+
+
+def test_retry_succeeds():
+    function = failing(2)
+    decorator = make_retry((SellingApiRequestThrottledException,), tries=3, delay=1, rate=2, jitter=False)
+    assert decorator(function)('x') == 'x'
+    assert decorator.delays == [1, 2]
+    assert decorator.statistics == {'calls': 1, 'retries': 2, 'giveups': 0}
+
+
+def test_retry_gives_up_with_per_call_state():
+    decorator = make_retry((SellingApiRequestThrottledException,), tries=3, delay=1, rate=2, jitter=False)
+    function = failing(10)
+    wrapped = decorator(function)
+    with pytest.raises(SellingApiRequestThrottledException):
+        wrapped('x')
+    assert len(function.calls) == 3
+    # The next call starts over
+    with pytest.raises(SellingApiRequestThrottledException):
+        wrapped('x')
+    assert len(function.calls) == 6
+    assert decorator.delays == [1, 2, 1, 2]
+    assert decorator.statistics['giveups'] == 2
+
+
+def test_retry_other_exceptions_are_raised():
+    function = failing(1, exception=SellingApiServerException)
+    with pytest.raises(SellingApiServerException):
+        make_retry((SellingApiRequestThrottledException,))(function)('x')
+    assert len(function.calls) == 1
+    function = failing(1, exception=SellingApiServerException)
+    decorator = sp_retry()
+    decorator.sleep = lambda delay: None
+    assert decorator(function)('x') == 'x'
+
+
+def test_full_jitter_and_max_delay():
+    decorator = Retry(delay=10, rate=2, max_delay=15)
+    for attempt in range(1, 6):
+        assert 0 <= decorator.backoff(attempt) <= min(10 * 2 ** (attempt - 1), 15)
+    assert len({decorator.backoff(3) for _ in range(10)}) > 1
+
+
+def test_retry_headers():
+    assert retry_after({'Retry-After': '3'}) == 3
+    assert 58 <= retry_after({'retry-after': formatdate(time.time() + 60, usegmt=True)}) <= 60
+    assert retry_after({'Retry-After': 'soon'}) is None
+    assert rate_limit_delay({'x-amzn-RateLimit-Limit': '0.5'}) == 2
+    assert rate_limit_delay({}) is None
+
+    decorator = make_retry(tries=2, delay=1, jitter=False)
+    decorator(failing(1, headers={'Retry-After': '7'}))('x')
+    decorator(failing(1, headers={'x-amzn-RateLimit-Limit': '0.25'}))('x')
+    assert decorator.delays == [7, 4]
+
+
+def test_retry_deadline_and_hooks():
+    now = [0]
+    retries, giveups = [], []
+    decorator = make_retry(tries=10, delay=4, rate=1, jitter=False, deadline=10,
+                           on_retry=lambda state: retries.append((state.attempt, state.delay)),
+                           on_giveup=lambda state: giveups.append((state.attempt, state.elapsed)))
+    decorator.clock = lambda: now[0]
+    decorator.sleep = lambda delay: now.__setitem__(0, now[0] + delay)
+    function = failing(10)
+    with pytest.raises(SellingApiRequestThrottledException):
+        decorator(function)('x')
+    # 0 + 4 + 4, the next delay would end after the deadline
+    assert len(function.calls) == 3
+    assert retries == [(1, 4), (2, 4)]
+    assert giveups == [(3, 8)]
+
+
+def test_retry_threads():
+    decorator = make_retry(tries=3, delay=0)
+    decorator.sleep = lambda delay: None
+    results = []
+
+    def run():
+        results.append(decorator(failing(2))('x'))
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ['x'] * 8
+    assert decorator.statistics == {'calls': 8, 'retries': 16, 'giveups': 0}
+
+
+def test_retry_async():
+    calls = []
+
+    @throttle_retry(tries=3, delay=0)
+    async def function():
+        calls.append(1)
+        if len(calls) < 3:
+            raise SellingApiRequestThrottledException([{'message': 'throttled'}], {})
+        return 'done'
+
+    assert asyncio.run(function()) == 'done'
+    assert function.retry.statistics['retries'] == 2
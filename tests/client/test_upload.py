@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import hashlib
+import io
+import urllib.parse
+
+import pytest
+
+from sp_api.api import Upload
+from sp_api.base import SellingApiException
+from sp_api.base.helpers import create_md5
+
+from .conftest import FakeResponse
+
+CONTENT = b'%PDF-1.4 ' + bytes(range(256)) * 100
+MD5 = base64.b64encode(hashlib.md5(CONTENT).digest()).decode()
+DESTINATION = (b'{"payload": {"uploadDestinationId": "dest", "url": "https://bucket.example.com/up", '
+               b'"headers": {"x-amz-meta": "1"}}}')
+
+
+@pytest.fixture
+def upload(make_client, session):
+    def respond(method, url, data=None, **kwargs):
+        if method == 'PUT':
+            # The uploaded view is released once upload_file returns
+            session.uploaded = bytes(data)
+            return FakeResponse()
+        return FakeResponse(content=DESTINATION)
+
+    session.respond = respond
+    return make_client(Upload)
+
+
+def test_create_md5_chunk_size():
+    assert create_md5(CONTENT, chunk_size=1000) == create_md5(io.BytesIO(CONTENT)) == MD5
+
+
+@pytest.mark.parametrize('source', ['path', 'file', 'bytes', 'bytes_io', 'stream'])
+def test_upload_file(tmp_path, source, upload, session):
+    path = tmp_path / 'doc.pdf'
+    path.write_bytes(CONTENT)
+    with open(path, 'rb') as f:
+        file = {
+            'path': str(path),
+            'file': f,
+            'bytes': CONTENT,
+            'bytes_io': io.BytesIO(CONTENT),
+            'stream': io.BufferedReader(io.BytesIO(CONTENT)),
+        }[source]
+        res = upload.upload_file('aplus/2020-11-01/contentDocuments', file, chunk_size=4096)
+
+    assert res.payload['uploadDestinationId'] == 'dest'
+    destination, put = session.calls
+    assert destination.params['contentMD5'] == urllib.parse.quote(MD5)
+    assert put.url == 'https://bucket.example.com/up'
+    assert put.headers == {'Content-Type': 'application/pdf', 'x-amz-meta': '1'}
+    assert session.uploaded == CONTENT
+    if source == 'bytes_io':
+        # The buffer was released, the BytesIO can be written to again
+        file.write(b'more')
+
+
+def test_upload_file_from_position(tmp_path, upload, session):
+    path = tmp_path / 'doc.pdf'
+    path.write_bytes(b'header' + CONTENT)
+    with open(path, 'rb') as f:
+        f.seek(6)
+        upload.upload_file('aplus/2020-11-01/contentDocuments', f)
+    assert session.uploaded == CONTENT
+    assert session.calls[0].params['contentMD5'] == urllib.parse.quote(MD5)
+
+
+def test_upload_file_error(upload, session):
+    session.responses = [FakeResponse(content=DESTINATION),
+                         FakeResponse(403, text='<Error>SignatureDoesNotMatch</Error>')]
+    with pytest.raises(SellingApiException) as info:
+        upload.upload_file('aplus/2020-11-01/contentDocuments', CONTENT)
+    assert info.value.error[0]['code'] == '403'
+
+
+def test_async_upload_file(tmp_path, make_async_client):
+    import httpx
+    from sp_api import asyncio as sp_asyncio
+    path = tmp_path / 'doc.pdf'
+    path.write_bytes(CONTENT)
+    requests = []
+
+    def handler(request):
+        requests.append((request, request.read()))
+        if request.url.host == 'bucket.example.com':
+            return httpx.Response(200)
+        return httpx.Response(200, json={'payload': {'uploadDestinationId': 'dest',
+                                                     'url': 'https://bucket.example.com/up'}})
+
+    async def run():
+        async with make_async_client(sp_asyncio.Upload, handler) as client:
+            return await client.upload_file('aplus/2020-11-01/contentDocuments', str(path), chunk_size=1000)
+
+    assert asyncio.run(run()).payload['uploadDestinationId'] == 'dest'
+    (destination, _), (put, body) = requests
+    assert destination.url.params['contentMD5'] == urllib.parse.quote(MD5)
+    assert body == CONTENT
+    assert put.headers['Content-Length'] == str(len(CONTENT))
+    assert 'Transfer-Encoding' not in put.headers